@@ -3,6 +3,10 @@
 #
 # License: BSD-3-Clause
 
+from glob import glob
+import hashlib
+import json
+import os
 import os.path as op
 from io import BytesIO, SEEK_SET
 from gzip import GzipFile
@@ -13,7 +17,7 @@ from scipy.sparse import issparse
 from .tag import read_tag_info, read_tag, Tag, _call_dict_names, _matrix_info
 from .tree import make_dir_tree, dir_tree_find
 from .constants import FIFF
-from ..utils import logger, verbose, _file_like, warn
+from ..utils import logger, verbose, _file_like, warn, get_config
 
 
 class _NoCloseRead:
@@ -156,6 +160,15 @@ def _fiff_open(fname, fid, preload):
     if tag.kind != FIFF.FIFF_DIR_POINTER:
         raise ValueError(f"{prefix} have a directory pointer")
 
+    #   Use a cached directory tree if possible
+    cache_fname = _get_tree_cache_fname(fname)
+    cached = _read_tree_cache(cache_fname)
+    if cached is not None:
+        tree, directory = cached
+        logger.debug("    Using cached tag directory for %s" % fname)
+        fid.seek(0)
+        return fid, tree, directory
+
     #   Read or create the directory tree
     logger.debug("    Creating tag directory for %s..." % fname)
 
@@ -171,6 +184,7 @@ def _fiff_open(fname, fid, preload):
                 "FIF tag directory missing at the end of the file "
                 f"(at byte {dirpos}{extra}), possibly corrupted file: {fname}"
             )
+            cache_fname = None  # do not cache so that we keep warning
         else:
             directory = dir_tag.data
             read_slow = False
@@ -187,6 +201,7 @@ def _fiff_open(fname, fid, preload):
                 directory.append(tag)
 
     tree, _ = make_dir_tree(fid, directory)
+    _write_tree_cache(cache_fname, tree, directory)
 
     logger.debug("[done]")
 
@@ -196,6 +211,115 @@ def _fiff_open(fname, fid, preload):
     return fid, tree, directory
 
 
+###############################################################################
+# Persistent cache of directory trees
+
+_TREE_CACHE_VERSION = 1
+
+
+def _get_tree_cache_fname(fname):
+    """Get the tree cache filename for a FIF file (None if not enabled)."""
+    cache_dir = get_config("MNE_FIF_TREE_CACHE_DIR", None)
+    if cache_dir is None or _file_like(fname):
+        return None
+    fname = op.realpath(str(fname))
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    key = f"{_TREE_CACHE_VERSION}\n{fname}\n{stat.st_size}\n{stat.st_mtime_ns}"
+    return op.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".npz")
+
+
+def _id_to_cache(id_):
+    if id_ is None:
+        return None
+    id_ = id_.copy()
+    id_["machid"] = [int(m) for m in id_["machid"]]
+    return id_
+
+
+def _id_from_cache(id_):
+    if id_ is None:
+        return None
+    id_["machid"] = np.array(id_["machid"], ">i4")
+    return id_
+
+
+def _tree_to_cache(tree, index):
+    """Convert a tree to a JSON-compatible structure."""
+    return dict(
+        block=int(tree["block"]),
+        id=_id_to_cache(tree["id"]),
+        parent_id=_id_to_cache(tree["parent_id"]),
+        nent=tree["nent"],
+        nchild=tree["nchild"],
+        directory=None
+        if tree["directory"] is None
+        else [index[id(ent)] for ent in tree["directory"]],
+        children=[_tree_to_cache(child, index) for child in tree["children"]],
+    )
+
+
+def _tree_from_cache(tree, directory):
+    """Convert a JSON-compatible structure back to a tree."""
+    tree["id"] = _id_from_cache(tree["id"])
+    tree["parent_id"] = _id_from_cache(tree["parent_id"])
+    if tree["directory"] is not None:
+        tree["directory"] = [directory[ii] for ii in tree["directory"]]
+    tree["children"] = [
+        _tree_from_cache(child, directory) for child in tree["children"]
+    ]
+    return tree
+
+
+def _read_tree_cache(cache_fname):
+    """Read a cached tree and directory, returning None on a cache miss."""
+    if cache_fname is None or not op.isfile(cache_fname):
+        return None
+    try:
+        with np.load(cache_fname, allow_pickle=False) as npz:
+            entries = npz["directory"]
+            tree = json.loads(str(npz["tree"]))
+        # mark as recently used
+        os.utime(cache_fname)
+    except Exception as exp:  # corrupted or concurrently evicted
+        logger.debug(f"    Could not read tag directory cache: {exp}")
+        return None
+    directory = [Tag(*entry) for entry in entries.tolist()]
+    return _tree_from_cache(tree, directory), directory
+
+
+def _write_tree_cache(cache_fname, tree, directory):
+    """Write a tree and directory to the cache, evicting old entries."""
+    if cache_fname is None:
+        return
+    index = {id(ent): ii for ii, ent in enumerate(directory)}
+    entries = np.array(
+        [[ent.kind, ent.type, ent.size, ent.next, ent.pos] for ent in directory],
+        np.int64,
+    ).reshape(-1, 5)
+    tree = json.dumps(_tree_to_cache(tree, index))
+    cache_dir = op.dirname(cache_fname)
+    tmp_fname = f"{cache_fname}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(fid, directory=entries, tree=np.array(tree))
+        os.replace(tmp_fname, cache_fname)
+        # least recently used eviction
+        max_size = int(get_config("MNE_FIF_TREE_CACHE_SIZE", "1000"))
+        cache_fnames = sorted(
+            glob(op.join(cache_dir, "*.npz")), key=lambda f: op.getmtime(f)
+        )
+        for fname in cache_fnames[: max(len(cache_fnames) - max_size, 0)]:
+            os.remove(fname)
+    except OSError as exp:  # read-only, concurrently evicted, etc.
+        logger.debug(f"    Could not write tag directory cache: {exp}")
+        if op.isfile(tmp_fname):
+            os.remove(tmp_fname)
+
+
 @verbose
 def show_fiff(
     fname,
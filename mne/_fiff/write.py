@@ -191,6 +191,14 @@ def write_complex_double_matrix(fid, kind, mat):
 
 
 def _write_matrix_data(fid, kind, mat, data_type):
+    _write_matrix_blocks(fid, kind, mat.shape, data_type, [mat])
+
+
+def _write_matrix_blocks(fid, kind, shape, data_type, blocks):
+    """Write a matrix tag from consecutive blocks along its first axis.
+
+    This avoids holding (a converted copy of) the whole matrix in memory.
+    """
     dtype = {
         FIFF.FIFFT_FLOAT: ">f4",
         FIFF.FIFFT_DOUBLE: ">f8",
@@ -199,16 +207,26 @@ def _write_matrix_data(fid, kind, mat, data_type):
         FIFF.FIFFT_INT: ">i4",
     }[data_type]
     dtype = np.dtype(dtype)
-    data_size = dtype.itemsize * mat.size + 4 * (mat.ndim + 1)
+    size = int(np.prod(shape))
+    data_size = dtype.itemsize * size + 4 * (len(shape) + 1)
     matrix_type = data_type | FIFF.FIFFT_MATRIX
     fid.write(np.array(kind, dtype=">i4").tobytes())
     fid.write(np.array(matrix_type, dtype=">i4").tobytes())
     fid.write(np.array(data_size, dtype=">i4").tobytes())
     fid.write(np.array(FIFF.FIFFV_NEXT_SEQ, dtype=">i4").tobytes())
-    fid.write(np.array(mat, dtype=dtype).tobytes())
-    dims = np.empty(mat.ndim + 1, dtype=np.int32)
-    dims[: mat.ndim] = mat.shape[::-1]
-    dims[-1] = mat.ndim
+    n_written = 0
+    for block in blocks:
+        block = np.array(block, dtype=dtype)
+        fid.write(block.tobytes())
+        n_written += block.size
+    if n_written != size:
+        raise RuntimeError(
+            f"Wrote {n_written} matrix elements, expected {size}, please "
+            "contact mne-python developers"
+        )
+    dims = np.empty(len(shape) + 1, dtype=np.int32)
+    dims[: len(shape)] = shape[::-1]
+    dims[-1] = len(shape)
     fid.write(np.array(dims, dtype=">i4").tobytes())
     check_fiff_length(fid)
 
@@ -185,6 +185,61 @@ def _sym_inv_sm(x, reduce_rank, inversion, sk):
     return x_inv
 
 
+def _whiten_cov_inv(Cm, whitener, reg, rank):
+    """Whiten data covariance matrices and compute their regularized inverse.
+
+    Parameters
+    ----------
+    Cm : ndarray, shape (..., n_channels, n_channels)
+        The data covariance matrices, e.g. one per frequency.
+    whitener : ndarray, shape (n_channels, n_channels)
+        The whitener.
+    reg : float
+        Regularization parameter.
+    rank : int | None | 'full' | list of int
+        See :func:`mne.utils._reg_pinv`. When a list is given, it contains the
+        rank of each covariance matrix.
+
+    Returns
+    -------
+    Cm : ndarray, shape (..., n_channels, n_channels)
+        The whitened data covariance matrices.
+    Cm_inv : ndarray, shape (..., n_channels, n_channels)
+        Their regularized inverse.
+    loading_factor : float | ndarray
+        The value added to the diagonal of each matrix during regularization.
+    rank : int | ndarray of int
+        The rank of each matrix.
+    """
+    # Whiten the data covariance
+    Cm = whitener @ Cm @ whitener.T.conj()
+    # Restore to properly Hermitian as large whitening coefs can have bad
+    # rounding error
+    Cm[:] = (Cm + Cm.swapaxes(-2, -1).conj()) / 2.0
+
+    s = np.linalg.eigvalsh(Cm)
+    if not (s >= -s.max(axis=-1, keepdims=True) * 1e-7).all():
+        # This shouldn't ever happen, but just in case
+        warn(
+            "data covariance does not appear to be positive semidefinite, "
+            "results will likely be incorrect"
+        )
+    # Tikhonov regularization using reg parameter to control for
+    # trade-off between spatial resolution and noise sensitivity
+    # eq. 25 in Gross and Ioannides, 1999 Phys. Med. Biol. 44 2081
+    if not isinstance(rank, (list, tuple, np.ndarray)):
+        return (Cm,) + tuple(_reg_pinv(Cm, reg, rank))
+
+    # Invert the matrices that share the same rank together
+    rank = np.asarray(rank, dtype=int)
+    Cm_inv = np.empty_like(Cm)
+    loading_factor = np.empty(len(rank))
+    for this_rank in np.unique(rank):
+        sel = rank == this_rank
+        Cm_inv[sel], loading_factor[sel], _ = _reg_pinv(Cm[sel], reg, this_rank)
+    return Cm, Cm_inv, loading_factor, rank
+
+
 def _compute_beamformer(
     G,
     Cm,
@@ -198,6 +253,8 @@ def _compute_beamformer(
     nn,
     orient_std,
     whitener,
+    *,
+    cov_inv=None,
 ):
     """Compute a spatial beamformer filter (LCMV or DICS).
 
@@ -230,6 +287,10 @@ def _compute_beamformer(
         The std of the orientation prior used in weighting the lead fields.
     whitener : ndarray, shape (n_channels, n_channels)
         The whitener.
+    cov_inv : tuple | None
+        The whitened data covariance, its regularized inverse, the loading
+        factor and the rank, as returned by :func:`_whiten_cov_inv`. If None
+        (default), they are computed from ``Cm``.
 
     Returns
     -------
@@ -242,24 +303,10 @@ def _compute_beamformer(
         ["unit-noise-gain-invariant", "unit-noise-gain", "nai", None],
     )
 
-    # Whiten the data covariance
-    Cm = whitener @ Cm @ whitener.T.conj()
-    # Restore to properly Hermitian as large whitening coefs can have bad
-    # rounding error
-    Cm[:] = (Cm + Cm.T.conj()) / 2.0
-
+    if cov_inv is None:
+        cov_inv = _whiten_cov_inv(Cm, whitener, reg, rank)
+    Cm, Cm_inv, loading_factor, rank = cov_inv
     assert Cm.shape == (G.shape[0],) * 2
-    s, _ = np.linalg.eigh(Cm)
-    if not (s >= -s.max() * 1e-7).all():
-        # This shouldn't ever happen, but just in case
-        warn(
-            "data covariance does not appear to be positive semidefinite, "
-            "results will likely be incorrect"
-        )
-    # Tikhonov regularization using reg parameter to control for
-    # trade-off between spatial resolution and noise sensitivity
-    # eq. 25 in Gross and Ioannides, 1999 Phys. Med. Biol. 44 2081
-    Cm_inv, loading_factor, rank = _reg_pinv(Cm, reg, rank)
 
     assert orient_std.shape == (G.shape[1],)
     n_sources = G.shape[1] // n_orient
@@ -9,6 +9,7 @@
 import numpy as np
 
 from ..channels import equalize_channels
+from ..cov import Covariance
 from .._fiff.pick import pick_info, pick_channels
 from ..utils import (
     logger,
@@ -25,10 +26,12 @@ from ..minimum_norm.inverse import combine_xyz, _check_reference, _check_depth
 from ..rank import compute_rank
 from ..source_estimate import _make_stc, _get_src_type
 from ..time_frequency import EpochsTFR
+from ..time_frequency.csd import _vectors_to_sym_mats
 from ..time_frequency.tfr import _check_tfr_complex
 from ._compute_beamformer import (
     _prepare_beamformer_input,
     _compute_beamformer,
+    _whiten_cov_inv,
     _check_src_type,
     Beamformer,
     _compute_power,
@@ -227,13 +230,18 @@ def make_dics(
         **depth,
     )
 
+    # Expand the CSD matrices of all frequencies at once
+    Cms = _vectors_to_sym_mats(csd._data)
+
     # Compute ranks
     csd_int_rank = []
     if not allow_mismatch:
         noise_rank = compute_rank(noise_csd, info=info, rank=rank)
-    for i in range(len(frequencies)):
+    for Cm in Cms:
         csd_rank = compute_rank(
-            csd.get_data(index=i, as_cov=True), info=info, rank=rank
+            Covariance(Cm, csd.ch_names, bads=[], projs=csd.projs, nfree=csd.n_fft),
+            info=info,
+            rank=rank,
         )
         if not allow_mismatch:
             for key in csd_rank:
@@ -248,6 +256,14 @@ def make_dics(
     del noise_csd
     ch_names = list(info["ch_names"])
 
+    # XXX: Weird that real_filter happens *before* whitening, which could
+    # make things complex again...?
+    if real_filter:
+        Cms = Cms.real
+
+    # Whiten and invert the CSD matrices of all frequencies together
+    cov_inv = _whiten_cov_inv(Cms, whitener, reg, csd_int_rank)
+
     logger.info("Computing DICS spatial filters...")
     Ws = []
     max_oris = []
@@ -258,18 +274,11 @@ def make_dics(
                 f"{round(freq, 2)} Hz ({i + 1}/{n_freqs})"
             )
 
-        Cm = csd.get_data(index=i)
-
-        # XXX: Weird that real_filter happens *before* whitening, which could
-        # make things complex again...?
-        if real_filter:
-            Cm = Cm.real
-
         # compute spatial filter
         n_orient = 3 if is_free_ori else 1
         W, max_power_ori = _compute_beamformer(
             G,
-            Cm,
+            Cms[i],
             reg,
             n_orient,
             weight_norm,
@@ -280,6 +289,7 @@ def make_dics(
             nn=nn,
             orient_std=orient_std,
             whitener=whitener,
+            cov_inv=tuple(x[i] for x in cov_inv),
         )
         Ws.append(W)
         max_oris.append(max_power_ori)
@@ -615,6 +625,10 @@ def apply_dics_csd(csd, filters, verbose=None):
     # Ensure the CSD is in the same order as the weights
     csd_picks = [csd.ch_names.index(ch) for ch in ch_names]
 
+    # Expand and whiten the CSD of all frequencies at once
+    Cms = _vectors_to_sym_mats(csd._data, csd_picks)
+    Cms = whitener @ Cms @ whitener.conj().T
+
     logger.info("Computing DICS source power...")
     for i, freq in enumerate(frequencies):
         if n_freqs > 1:
@@ -623,14 +637,8 @@ def apply_dics_csd(csd, filters, verbose=None):
                 f"{round(freq, 2)} Hz ({i + 1}/{n_freqs})"
             )
 
-        Cm = csd.get_data(index=i)
-        Cm = Cm[csd_picks, :][:, csd_picks]
         W = filters["weights"][i]
-
-        # Whiten the CSD
-        Cm = np.dot(whitener, np.dot(Cm, whitener.conj().T))
-
-        source_power[:, i] = _compute_power(Cm, W, n_orient)
+        source_power[:, i] = _compute_power(Cms[i], W, n_orient)
 
     logger.info("[done]")
 
@@ -10,8 +10,10 @@
 # License: BSD-3-Clause
 
 from functools import partial
-from collections import Counter
+from collections import Counter, OrderedDict
 from copy import deepcopy
+import hashlib
+import itertools
 import json
 import operator
 import os.path as op
@@ -27,13 +29,10 @@ from ._fiff.write import (
     end_block,
     write_int,
     write_float,
-    write_float_matrix,
-    write_double_matrix,
-    write_complex_float_matrix,
-    write_complex_double_matrix,
     write_id,
     write_string,
     _get_split_size,
+    _write_matrix_blocks,
     _NEXT_FILE_BUFFER,
     INT32_MAX,
 )
@@ -72,6 +71,7 @@ from .viz import plot_epochs, plot_epochs_image, plot_topo_image_epochs, plot_dr
 from .utils import (
     _check_fname,
     check_fname,
+    get_config,
     logger,
     verbose,
     repr_html,
@@ -154,21 +154,27 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
     start_block(fid, FIFF.FIFFB_PROCESSED_DATA)
     start_block(fid, FIFF.FIFFB_MNE_EPOCHS)
 
+    # The epochs are written in blocks, their calibration factors are undone
+    decal = np.empty(info["nchan"])
+    for k in range(info["nchan"]):
+        decal[k] = 1.0 / (info["chs"][k]["cal"] * info["chs"][k].get("scale", 1.0))
+    blocks = _iter_epochs_blocks(epochs, decal)
+
     # write events out after getting data to ensure bad events are dropped
-    data = epochs.get_data()
+    first_block = next(blocks)
 
     _check_option("fmt", fmt, ["single", "double"])
 
-    if np.iscomplexobj(data):
+    if np.iscomplexobj(first_block):
         if fmt == "single":
-            write_function = write_complex_float_matrix
+            data_type = FIFF.FIFFT_COMPLEX_FLOAT
         elif fmt == "double":
-            write_function = write_complex_double_matrix
+            data_type = FIFF.FIFFT_COMPLEX_DOUBLE
     else:
         if fmt == "single":
-            write_function = write_float_matrix
+            data_type = FIFF.FIFFT_FLOAT
         elif fmt == "double":
-            write_function = write_double_matrix
+            data_type = FIFF.FIFFT_DOUBLE
 
     # Epoch annotations are written if there are any
     annotations = getattr(epochs, "annotations", [])
@@ -204,16 +210,10 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
         write_float(fid, FIFF.FIFF_MNE_BASELINE_MAX, bmax)
 
     # The epochs itself
-    decal = np.empty(info["nchan"])
-    for k in range(info["nchan"]):
-        decal[k] = 1.0 / (info["chs"][k]["cal"] * info["chs"][k].get("scale", 1.0))
-
-    data *= decal[np.newaxis, :, np.newaxis]
-
-    write_function(fid, FIFF.FIFF_EPOCH, data)
-
-    # undo modifications to data
-    data /= decal[np.newaxis, :, np.newaxis]
+    shape = (len(epochs), info["nchan"], len(epochs.times))
+    _write_matrix_blocks(
+        fid, FIFF.FIFF_EPOCH, shape, data_type, itertools.chain([first_block], blocks)
+    )
 
     write_string(fid, FIFF.FIFF_MNE_EPOCHS_DROP_LOG, json.dumps(epochs.drop_log))
 
@@ -238,6 +238,45 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
     end_block(fid, FIFF.FIFFB_MEAS)
 
 
+_MAX_IO_BLOCK_BYTES = 2**26  # how much epochs data to write or read at once
+
+
+def _iter_epochs_blocks(epochs, decal):
+    """Get the data of consecutive blocks of epochs, multiplied by decal."""
+    n_per = len(epochs.ch_names) * len(epochs.times) * 16  # worst case: complex
+    n_per = max(_MAX_IO_BLOCK_BYTES // max(n_per, 1), 1)
+    # always get data at least once, even if it's empty
+    for start in range(0, max(len(epochs), 1), n_per):
+        data = epochs.get_data(item=slice(start, start + n_per))
+        yield data * decal[:, np.newaxis]
+
+
+def _read_epochs_data(fid, pos, fmt, start, stop, epoch_shape, cals):
+    """Read and calibrate the epochs start through stop - 1 from a data tag.
+
+    ``pos`` is the position of the epochs data (after the tag header). The
+    data are read in blocks so that no copy of all of them is needed.
+    """
+    if fmt == ">c8":
+        read_fmt, datatype = ">f4", np.complex128
+    elif fmt == ">c16":
+        read_fmt, datatype = ">f8", np.complex128
+    else:
+        read_fmt, datatype = fmt, np.float64
+    epoch_size = int(np.prod(epoch_shape)) * np.dtype(fmt).itemsize
+    data = np.empty((stop - start,) + tuple(epoch_shape), datatype)
+    n_per = max(_MAX_IO_BLOCK_BYTES // max(epoch_size, 1), 1)
+    fid.seek(pos + start * epoch_size, 0)
+    for ii in range(0, stop - start, n_per):
+        n_read = min(n_per, stop - start - ii)
+        block = np.frombuffer(fid.read(n_read * epoch_size), read_fmt)
+        if read_fmt != fmt:
+            block = block.view(fmt)
+        data[ii : ii + n_read] = block.reshape((n_read,) + tuple(epoch_shape))
+    data *= cals
+    return data
+
+
 def _event_id_string(event_id):
     return ";".join([k + ":" + str(v) for k, v in event_id.items()])
 
@@ -364,6 +403,61 @@ def _handle_event_repeated(events, event_id, event_repeated, selection, drop_log
     return new_events, event_id, selection, drop_log
 
 
+def _get_epochs_cache_size():
+    """Get the maximum size in bytes of the cache of processed epochs."""
+    size = get_config("MNE_EPOCHS_CACHE_SIZE", "256MB")
+    exp = dict(kB=10, KB=10, MB=20, GB=30).get(size[-2:], None)
+    try:
+        size = int(float(size[:-2]) * 2**exp) if exp else int(size)
+    except ValueError:
+        raise ValueError(
+            "MNE_EPOCHS_CACHE_SIZE must be an integer number of bytes or end "
+            f'with "kB", "MB" or "GB", got {repr(size)}'
+        )
+    return max(size, 0)
+
+
+class _EpochCache:
+    """Least recently used cache of processed epochs.
+
+    Entries are keyed by epoch and by the processing state of the Epochs
+    instance, so that they never need to be invalidated explicitly.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self.nbytes = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry, max_size):
+        nbytes = _epoch_cache_nbytes(entry)
+        if nbytes > max_size:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= _epoch_cache_nbytes(old)
+        self._entries[key] = entry
+        self.nbytes += nbytes
+        while self.nbytes > max_size:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= _epoch_cache_nbytes(old)
+
+
+def _epoch_cache_nbytes(entry):
+    seen = set()
+    nbytes = 0
+    for epoch in entry:
+        if isinstance(epoch, np.ndarray) and id(epoch) not in seen:
+            seen.add(id(epoch))
+            nbytes += epoch.nbytes
+    return nbytes
+
+
 @fill_doc
 class BaseEpochs(
     ProjMixin,
@@ -577,6 +671,7 @@ class BaseEpochs(
         self.detrend = detrend
 
         self._raw = raw
+        self._epoch_cache = _EpochCache()
         info._check_consistency()
         self.picks = _picks_to_idx(
             info, picks, none="all", exclude=(), allow_empty=False
@@ -734,7 +829,8 @@ class BaseEpochs(
         """
         if self.preload:
             return self
-        self._data = self._get_data()
+        self._data = self._get_data(store_cache=False)
+        self._epoch_cache = _EpochCache()  # not needed anymore
         self.preload = True
         self._do_baseline = False
         self._decim_slice = slice(None, None, None)
@@ -884,7 +980,7 @@ class BaseEpochs(
             self._reject_time = slice(reject_imin, reject_imax)
 
     @verbose  # verbose is used by mne-realtime
-    def _is_good_epoch(self, data, verbose=None):
+    def _is_good_epoch(self, data, verbose=None, *, check_reject=True):
         """Determine if epoch is good."""
         if isinstance(data, str):
             return False, (data,)
@@ -894,7 +990,7 @@ class BaseEpochs(
         if data.shape[1] < n_times:
             # epoch is too short ie at the end of the data
             return False, ("TOO_SHORT",)
-        if self.reject is None and self.flat is None:
+        if (self.reject is None and self.flat is None) or not check_reject:
             return True, None
         else:
             if self._reject_time is not None:
@@ -910,6 +1006,39 @@ class BaseEpochs(
                 ignore_chs=self.info["bads"],
             )
 
+    def _drop_bad_batch(self, data, idxs, drop_log):
+        """Reject stored epochs based on reject and flat, all at once.
+
+        ``data[:len(idxs)]`` holds the epochs with indices ``idxs``, it is
+        compacted in place so that the good epochs come first.
+        """
+        bad_tuples = [None] * len(idxs)
+        if self.reject is not None or self.flat is not None:
+            # like _project_epoch, data are only projected for delayed SSP
+            projector = None
+            if self._do_delayed_proj and self._projector is not None:
+                projector = self._projector
+            bad_tuples = _is_good_batch(
+                data[: len(idxs)],
+                self.ch_names,
+                self._channel_type_idx,
+                self.reject,
+                self.flat,
+                ignore_chs=self.info["bads"],
+                projector=projector,
+                reject_time=self._reject_time,
+            )
+        good_idx = list()
+        for ii, (idx, bad_tuple) in enumerate(zip(idxs, bad_tuples)):
+            if bad_tuple is None:
+                if len(good_idx) != ii:
+                    data[len(good_idx)] = data[ii]
+                good_idx.append(idx)
+            else:
+                sel = self.selection[idx]
+                drop_log[sel] = drop_log[sel] + bad_tuple
+        return good_idx
+
     @verbose
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
         """Aux Function: detrend, baseline correct, offset, decim.
@@ -1559,6 +1688,69 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _epoch_cache_state(self, detrend_picks, store=True):
+        """Summarize everything that the processing of an epoch depends on.
+
+        Returns the maximum cache size (read once per pass over the epochs,
+        0 if new entries should not be stored) and the processing state, or
+        None if the cache should not be used at all.
+        """
+        max_size = _get_epochs_cache_size() if store else 0
+        # a preloaded Raw can be modified in place, and reading from it is
+        # cheap anyway
+        if getattr(self._raw, "preload", False) or (store and max_size == 0):
+            return None
+        hasher = hashlib.sha1()
+        for arr in (
+            self.picks,
+            self._raw_times,
+            self._offset,
+            self._projector,
+            detrend_picks,
+        ):
+            if arr is not None:
+                hasher.update(np.ascontiguousarray(arr).tobytes())
+            hasher.update(b"|")
+        decim_slice = self._decim_slice
+        return max_size, (
+            hasher.hexdigest(),
+            (decim_slice.start, decim_slice.stop, decim_slice.step),
+            self.detrend,
+            self._do_baseline,
+            self.baseline,
+            self.reject_tmin,
+            self.reject_tmax,
+            getattr(self, "reject_by_annotation", None),
+            bool(self._do_delayed_proj or self.proj),
+        )
+
+    def _get_processed_epoch(self, idx, detrend_picks, state, project=True):
+        """Load, detrend, baseline correct, decimate and project one epoch.
+
+        Returns the epoch before and (if ``project``) after projection, reusing
+        the results of previous calls with the same processing ``state`` (see
+        ``_epoch_cache_state``).
+        """
+        key = entry = None
+        if state is not None:
+            key = (int(self.selection[idx]), int(self.events[idx, 0]), state[1])
+            entry = self._epoch_cache.get(key)
+            if entry is not None and (entry[1] is not None or not project):
+                return entry
+        if entry is not None:
+            epoch_noproj = entry[0]
+        else:
+            epoch_noproj = self._get_epoch_from_raw(idx)
+            epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
+            is_view = getattr(epoch_noproj, "base", None) is not None
+            if key is not None and is_view:
+                # do not keep e.g. the data prior to decimation alive
+                epoch_noproj = epoch_noproj.copy()
+        epoch = self._project_epoch(epoch_noproj) if project else None
+        if key is not None:
+            self._epoch_cache.put(key, (epoch_noproj, epoch), state[0])
+        return epoch_noproj, epoch
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1590,6 +1782,7 @@ class BaseEpochs(
         tmin=None,
         tmax=None,
         on_empty="warn",
+        store_cache=True,
         verbose=None,
     ):
         """Load all data, dropping bad epochs along the way.
@@ -1607,6 +1800,9 @@ class BaseEpochs(
             Start time of data to get in seconds.
         tmax : int | float | None
             End time of data to get in seconds.
+        store_cache : bool
+            Whether to store the processed epochs in the cache. This is
+            disabled when preloading, as the data are then kept anyway.
         %(verbose)s
         """
         from .io.base import _get_ch_factors
@@ -1688,14 +1884,16 @@ class BaseEpochs(
 
             # we need to load from disk, drop, and return data
             detrend_picks = self._detrend_picks
+            state = self._epoch_cache_state(detrend_picks, store_cache)
             for ii, idx in enumerate(use_idx):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
+                epoch_noproj, epoch = self._get_processed_epoch(
+                    idx, detrend_picks, state, project=not self._do_delayed_proj
+                )
                 if self._do_delayed_proj:
                     epoch_out = epoch_noproj
                 else:
-                    epoch_out = self._project_epoch(epoch_noproj)
+                    epoch_out = epoch
                 if ii == 0:
                     data = np.empty(
                         (n_events, len(self.ch_names), len(self.times)),
@@ -1709,43 +1907,42 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
-            if not self.preload:
+            if self.preload:  # from memory, all epochs at once
+                good_idx = self._drop_bad_batch(data, range(n_events), drop_log)
+                n_out = len(good_idx)
+            else:  # from disk
                 detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
-                        epoch = self._project_epoch(epoch_noproj)
-                    else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
+                state = self._epoch_cache_state(detrend_picks, store_cache)
+                for idx, sel in enumerate(self.selection):
+                    epoch_noproj, epoch = self._get_processed_epoch(
+                        idx, detrend_picks, state
                     )
-                    epoch = self._project_epoch(epoch_noproj)
-
-                epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
-                    assert isinstance(bad_tuple, tuple)
-                    assert all(isinstance(x, str) for x in bad_tuple)
-                    drop_log[sel] = drop_log[sel] + bad_tuple
-                    continue
-                good_idx.append(idx)
-
-                # store the epoch if there is a reason to (output or update)
-                if out or self.preload:
-                    # faster to pre-allocate, then trim as necessary
-                    if n_out == 0 and not self.preload:
-                        data = np.empty(
-                            (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
-                            order="C",
-                        )
-                    data[n_out] = epoch_out
-                    n_out += 1
+                    epoch_out = epoch_noproj if self._do_delayed_proj else epoch
+                    # if the epochs are stored, reject them all at once below
+                    is_good, bad_tuple = self._is_good_epoch(
+                        epoch, verbose=verbose, check_reject=not out
+                    )
+                    if not is_good:
+                        assert isinstance(bad_tuple, tuple)
+                        assert all(isinstance(x, str) for x in bad_tuple)
+                        drop_log[sel] = drop_log[sel] + bad_tuple
+                        continue
+                    good_idx.append(idx)
+
+                    # store the epoch if there is a reason to (output)
+                    if out:
+                        # faster to pre-allocate, then trim as necessary
+                        if n_out == 0:
+                            data = np.empty(
+                                (n_events, epoch_out.shape[0], epoch_out.shape[1]),
+                                dtype=epoch_out.dtype,
+                                order="C",
+                            )
+                        data[n_out] = epoch_out
+                        n_out += 1
+                if out:
+                    good_idx = self._drop_bad_batch(data, good_idx, drop_log)
+                    n_out = len(good_idx)
             self.drop_log = tuple(drop_log)
             del drop_log
 
@@ -2018,8 +2215,9 @@ class BaseEpochs(
         result = cls.__new__(cls)
         for k, v in self.__dict__.items():
             # drop_log is immutable and _raw is private (and problematic to
-            # deepcopy)
-            if k in ("drop_log", "_raw", "_times_readonly"):
+            # deepcopy), the epoch cache is keyed by processing state so it can
+            # be shared
+            if k in ("drop_log", "_raw", "_times_readonly", "_epoch_cache"):
                 memodict[id(v)] = v
             else:
                 v = deepcopy(v, memodict)
@@ -3521,6 +3719,64 @@ def _is_good(
             return False, bad_tuple
 
 
+_MAX_BLOCK_BYTES = 2**26  # how much data to process at once in _is_good_batch
+
+
+def _is_good_batch(
+    data,
+    ch_names,
+    channel_type_idx,
+    reject,
+    flat,
+    ignore_chs=(),
+    projector=None,
+    reject_time=None,
+):
+    """Test which epochs of data are good according to reject and flat.
+
+    This is equivalent to calling ``_is_good`` with ``full_report=True`` on
+    each epoch (after applying ``projector`` and ``reject_time``), but the
+    peak-to-peak amplitudes are computed for many epochs at once. None is
+    returned for each good epoch and the offending channels for each bad one.
+    """
+    n_epochs = len(data)
+    checkable = np.array([c not in ignore_chs for c in ch_names], dtype=bool)
+    checks = list()
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        if refl is not None:
+            for key, thresh in refl.items():
+                idx = np.array(channel_type_idx[key], int)
+                if len(idx) > 0:
+                    checks.append((f, thresh, t, key.upper(), idx))
+    if reject_time is None:
+        reject_time = slice(None)
+    deltas = np.empty((n_epochs, len(ch_names)))
+    n_block = max(_MAX_BLOCK_BYTES // max(data[:1].nbytes, 1), 1)
+    for start in range(0, n_epochs, n_block):
+        block = data[start : start + n_block, :, reject_time]
+        if projector is not None:
+            block = projector @ block
+        deltas[start : start + n_block] = block.max(axis=-1) - block.min(axis=-1)
+    masks = list()
+    is_bad = np.zeros(n_epochs, bool)
+    for f, thresh, _, _, idx in checks:
+        masks.append(np.logical_and(f(deltas[:, idx], thresh), checkable[idx]))
+        is_bad |= masks[-1].any(axis=1)
+    bad_tuples = [None] * n_epochs
+    for ei in np.where(is_bad)[0]:
+        bad_tuple = tuple()
+        for (_, _, t, name, idx), mask in zip(checks, masks):
+            bad_names = [ch_names[ci] for ci in idx[mask[ei]]]
+            if len(bad_names) > 0:
+                if bad_tuple == ():
+                    logger.info(
+                        "    Rejecting %s epoch based on %s : %s" % (t, name, bad_names)
+                    )
+                bad_tuple += tuple(bad_names)
+        bad_tuples[ei] = bad_tuple
+    return bad_tuples
+
+
 def _read_one_epoch_file(f, tree, preload):
     """Read a single FIF file."""
     with f as fid:
@@ -3636,16 +3892,12 @@ def _read_one_epoch_file(f, tree, preload):
         size_expected = len(events) * np.prod(epoch_shape)
         # on read double-precision is always used
         if data_tag.type == FIFF.FIFFT_FLOAT:
-            datatype = np.float64
             fmt = ">f4"
         elif data_tag.type == FIFF.FIFFT_DOUBLE:
-            datatype = np.float64
             fmt = ">f8"
         elif data_tag.type == FIFF.FIFFT_COMPLEX_FLOAT:
-            datatype = np.complex128
             fmt = ">c8"
         elif data_tag.type == FIFF.FIFFT_COMPLEX_DOUBLE:
-            datatype = np.complex128
             fmt = ">c16"
         fmt_itemsize = np.dtype(fmt).itemsize
         assert fmt_itemsize in (4, 8, 16)
@@ -3668,8 +3920,9 @@ def _read_one_epoch_file(f, tree, preload):
 
         # Read the data
         if preload:
-            data = read_tag(fid, data_tag.pos).data.astype(datatype)
-            data *= cals
+            data = _read_epochs_data(
+                fid, data_tag.pos + 16, fmt, 0, len(events), epoch_shape, cals
+            )
 
         # Put it all together
         tmin = first / info["sfreq"]
@@ -3737,6 +3990,13 @@ class _RawContainer:
         self.fid = fid
         self.data_tag = data_tag
         self.event_samps = event_samps
+        # only the event samples that are unique can be found in this file
+        samps, idx, counts = np.unique(
+            event_samps, return_index=True, return_counts=True
+        )
+        self.event_idx = dict(
+            zip(samps[counts == 1].tolist(), idx[counts == 1].tolist())
+        )
         self.epoch_shape = epoch_shape
         self.cals = cals
         self.proj = False
@@ -3770,7 +4030,8 @@ class EpochsFIF(BaseEpochs):
     def __init__(self, fname, proj=True, preload=True, verbose=None):  # noqa: D102
         from .io.base import _get_fname_rep
 
-        if _path_like(fname):
+        is_path = _path_like(fname)
+        if is_path:
             check_fname(
                 fname=fname,
                 filetype="epochs",
@@ -3786,7 +4047,8 @@ class EpochsFIF(BaseEpochs):
         for fname in fnames:
             fname_rep = _get_fname_rep(fname)
             logger.info("Reading %s ..." % fname_rep)
-            fid, tree, _ = fiff_open(fname, preload=preload)
+            # the data are read in blocks, so files need not be loaded whole
+            fid, tree, _ = fiff_open(fname, preload=preload and not is_path)
             next_fname = _get_next_fname(fid, fname, tree)
             (
                 info,
@@ -3871,10 +4133,13 @@ class EpochsFIF(BaseEpochs):
             drop_log,
         ) = _concatenate_epochs(
             ep_list,
-            with_data=preload,
+            # a single part can use its data directly instead of a copy
+            with_data=preload and len(ep_list) > 1,
             add_offset=False,
             on_mismatch="raise",
         )
+        if preload and len(ep_list) == 1:
+            data = ep_list[0]._data
         # we need this uniqueness for non-preloaded data to work properly
         if len(np.unique(events[:, 0])) != len(events):
             raise RuntimeError("Event time samples were not unique")
@@ -3928,14 +4193,10 @@ class EpochsFIF(BaseEpochs):
     def _get_epoch_from_raw(self, idx, verbose=None):
         """Load one epoch from disk."""
         # Find the right file and offset to use
-        event_samp = self.events[idx, 0]
+        event_samp = int(self.events[idx, 0])
         for raw in self._raw:
-            idx = np.where(raw.event_samps == event_samp)[0]
-            if len(idx) == 1:
-                fmt = raw.fmt
-                idx = idx[0]
-                size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
-                offset = idx * size + 16  # 16 = Tag header
+            idx = raw.event_idx.get(event_samp)
+            if idx is not None:
                 break
         else:
             # read the correct subset of the data
@@ -3948,26 +4209,15 @@ class EpochsFIF(BaseEpochs):
         # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
         # >>> data *= raw.cals[np.newaxis, :, :]
         # >>> data = data[idx]
-        #
-        # Eventually this could be refactored in io/tag.py if other functions
-        # could make use of it
-        raw.fid.seek(raw.data_tag.pos + offset, 0)
-        if fmt == ">c8":
-            read_fmt = ">f4"
-        elif fmt == ">c16":
-            read_fmt = ">f8"
-        else:
-            read_fmt = fmt
-        data = np.frombuffer(raw.fid.read(size), read_fmt)
-        if read_fmt != fmt:
-            data = data.view(fmt)
-            data = data.astype(np.complex128)
-        else:
-            data = data.astype(np.float64)
-
-        data.shape = raw.epoch_shape
-        data *= raw.cals
-        return data
+        return _read_epochs_data(
+            raw.fid,
+            raw.data_tag.pos + 16,  # 16 = Tag header
+            raw.fmt,
+            idx,
+            idx + 1,
+            raw.epoch_shape,
+            raw.cals,
+        )[0]
 
 
 @fill_doc
@@ -1,6 +1,7 @@
 """IIR and FIR filtering and resampling functions."""
 
 from collections import Counter
+from fractions import Fraction
 from copy import deepcopy
 from functools import partial
 
@@ -326,7 +327,8 @@ def _overlap_add_filter(
         See calling functions.
     n_jobs : int | str
         Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
-        is installed properly.
+        is installed properly, or ``'fft-threads'`` to filter blocks of
+        signals at once with multithreaded FFTs.
     copy : bool
         If True, a copy of x, filtered, is returned. Otherwise, it operates
         on x in place.
@@ -382,11 +384,17 @@ def _overlap_add_filter(
             "2 * len(h) - 1 (%s), got %s" % (min_fft, n_fft)
         )
 
+    picks = _picks_to_idx(len(x), picks)
+    if isinstance(n_jobs, str) and n_jobs == "fft-threads":
+        logger.debug("Using multithreaded FFTs for all signals at once")
+        _2d_overlap_filter(x, h, n_edge, phase, pad, n_fft, picks)
+        x.shape = orig_shape
+        return x
+
     # Figure out if we should use CUDA
     n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
 
     # Process each row separately
-    picks = _picks_to_idx(len(x), picks)
     parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
     if n_jobs == 1:
         for p in picks:
@@ -436,6 +444,41 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     return x_filtered
 
 
+# Maximum size of the padded signals to filter at once with n_jobs="fft-threads"
+_MAX_BLOCK_BYTES = 2**24
+
+
+def _2d_overlap_filter(x, h, n_edge, phase, pad, n_fft, picks):
+    """Do overlap-add FFT FIR filtering of blocks of signals in place."""
+    n_h = len(h)
+    h_fft = fft.rfft(h, n_fft)
+    n_x = x.shape[1] + 2 * n_edge
+    n_seg = n_fft - n_h + 1
+    n_segments = int(np.ceil(n_x / float(n_seg)))
+    shift = ((n_h - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+    n_block = max(_MAX_BLOCK_BYTES // (n_x * x.itemsize), 1)
+    for block_start in range(0, len(picks), n_block):
+        block = picks[block_start : block_start + n_block]
+        # pad to reduce ringing
+        x_ext = np.array([_smart_pad(x[p], (n_edge, n_edge), pad) for p in block])
+        x_filtered = np.zeros_like(x_ext)
+        for seg_idx in range(n_segments):
+            start = seg_idx * n_seg
+            stop = (seg_idx + 1) * n_seg
+            # one FFT call for all signals, zero-padded to n_fft
+            prod = fft.rfft(x_ext[:, start:stop], n_fft, axis=-1, workers=-1)
+            prod *= h_fft
+            prod = fft.irfft(prod, n_fft, axis=-1, workers=-1)
+
+            start_filt = max(0, start - shift)
+            stop_filt = min(start - shift + n_fft, n_x)
+            start_prod = max(0, shift - start)
+            stop_prod = start_prod + stop_filt - start_filt
+            x_filtered[:, start_filt:stop_filt] += prod[:, start_prod:stop_prod]
+        # Remove mirrored edges that we added (n_edge can be zero)
+        x[block] = x_filtered[:, : n_x - 2 * n_edge]
+
+
 def _filter_attenuation(h, freq, gain):
     """Compute minimum attenuation at stop frequency."""
     _, filt_resp = signal.freqz(h.ravel(), worN=np.pi * freq)
@@ -1005,6 +1048,15 @@ def _check_method(method, iir_params, extra_types=()):
     return iir_params, method
 
 
+def _check_n_jobs_method(n_jobs, method):
+    """Check that n_jobs="fft-threads" is only used for FIR filtering."""
+    if isinstance(n_jobs, str) and n_jobs == "fft-threads" and method != "fir":
+        raise ValueError(
+            'n_jobs="fft-threads" can only be used with method="fir", got '
+            f"method={repr(method)}"
+        )
+
+
 @verbose
 def filter_data(
     data,
@@ -1093,6 +1145,7 @@ def filter_data(
     """
     data = _check_filterable(data)
     iir_params, method = _check_method(method, iir_params)
+    _check_n_jobs_method(n_jobs, method)
     filt = create_filter(
         data,
         sfreq,
@@ -1606,6 +1659,7 @@ def notch_filter(
     """
     x = _check_filterable(x, "notch filtered", "notch_filter")
     iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
+    _check_n_jobs_method(n_jobs, method)
 
     if freqs is not None:
         freqs = np.atleast_1d(freqs)
@@ -1899,10 +1953,11 @@ def resample(
     down=1.0,
     npad=100,
     axis=-1,
-    window="boxcar",
+    window="auto",
     n_jobs=None,
-    pad="reflect_limited",
+    pad="auto",
     *,
+    method="fft",
     verbose=None,
 ):
     """Resample an array.
@@ -1922,10 +1977,12 @@ def resample(
         Axis along which to resample (default is the last axis).
     %(window_resample)s
     %(n_jobs_cuda)s
-    %(pad)s
-        The default is ``'reflect_limited'``.
+    %(pad_resample_auto)s
 
         .. versionadded:: 0.15
+    %(method_resample)s
+
+        .. versionadded:: 1.6
     %(verbose)s
 
     Returns
@@ -1941,10 +1998,12 @@ def resample(
     important consequences, and the default choices should work well
     for most natural signals.
 
-    Resampling arguments are broken into "up" and "down" components for future
-    compatibility in case we decide to use an upfirdn implementation. The
-    current implementation is functionally equivalent to passing
-    up=up/down and down=1.
+    Resampling arguments are broken into "up" and "down" components, but
+    only their ratio matters: ``method="fft"`` is functionally equivalent to
+    passing up=up/down and down=1, and ``method="polyphase"`` requires
+    up/down to be a fraction with a denominator of at most 1000 (e.g.,
+    256 Hz to 100 Hz is 25/64), as the length of the polyphase filter grows
+    with the numerator and denominator.
     """
     # check explicitly for backwards compatibility
     if not isinstance(axis, int):
@@ -1956,6 +2015,9 @@ def resample(
         )
         raise TypeError(err)
 
+    _check_option("method", method, ("fft", "polyphase"))
+    window, pad = _resamp_window_pad(window, pad, method)
+
     # make sure our arithmetic will work
     x = _check_filterable(x, "resampled", "resample")
     ratio, final_len = _resamp_ratio_len(up, down, x.shape[axis])
@@ -1970,6 +2032,15 @@ def resample(
     if x_len == 0:
         warn("x has zero length along last axis, returning a copy of x")
         return x.copy()
+    if method == "polyphase":
+        up, down = _polyphase_up_down(ratio)
+        y = _polyphase_resample(
+            x.reshape((-1, x_len)), up, down, final_len, window, pad, n_jobs
+        )
+        y.shape = orig_shape[:-1] + (final_len,)
+        if axis != orig_last_axis:
+            y = y.swapaxes(axis, orig_last_axis)
+        return y
     bad_msg = 'npad must be "auto" or an integer'
     if isinstance(npad, str):
         if npad != "auto":
@@ -2032,6 +2103,66 @@ def resample(
     return y
 
 
+def _resamp_window_pad(window, pad, method):
+    """Resolve the "auto" window and pad values of resampling functions."""
+    if isinstance(window, str) and window == "auto":
+        window = "boxcar" if method == "fft" else ("kaiser", 5.0)
+    if pad == "auto":
+        pad = "reflect_limited" if method == "fft" else "reflect"
+    return window, pad
+
+
+def _polyphase_up_down(ratio, max_down=1000):
+    """Get the integer up and down factors of a polyphase resampling."""
+    frac = Fraction(ratio).limit_denominator(max_down)
+    # the filter length and the chunk sizes grow with max(up, down), so only
+    # allow exact ratios of small integers (up to floating point precision)
+    if abs(float(frac) - ratio) > 1e-9 * ratio:
+        raise ValueError(
+            f"The resampling ratio {ratio} cannot be expressed as up/down with "
+            f"down <= {max_down} (closest: {frac.numerator}/{frac.denominator}), "
+            'which is needed for method="polyphase". Use method="fft" instead.'
+        )
+    return frac.numerator, frac.denominator
+
+
+def _polyphase_n_ctx(up, down):
+    """Get the number of context samples needed on each side of a chunk.
+
+    The returned number is a multiple of ``down`` so that chunk boundaries in
+    the input map onto integer output samples.
+    """
+    # scipy.signal.resample_poly uses a filter with this half length in the
+    # upsampled domain
+    half_len = 10 * max(up, down)
+    n_ctx = half_len // up + 2
+    return -(-n_ctx // down) * down
+
+
+def _polyphase_resample(x, up, down, final_len, window, pad, n_jobs):
+    """Resample the rows of a 2D array using a polyphase filter."""
+    if n_jobs == "cuda":
+        logger.info("CUDA is not used for polyphase resampling")
+        n_jobs = None
+    kwargs = dict(axis=-1, window=window, padtype=pad)
+    parallel, p_fun, n_jobs = parallel_func(signal.resample_poly, n_jobs)
+    if n_jobs == 1:
+        y = signal.resample_poly(x, up, down, **kwargs)
+    else:
+        y = parallel(
+            p_fun(x_, up, down, **kwargs)
+            for x_ in np.array_split(x, min(n_jobs, len(x)))
+        )
+        y = np.concatenate(y)
+    # the length of the output can differ by one sample from the length
+    # that is expected from the exact sampling rate ratio
+    if y.shape[-1] >= final_len:
+        y = y[:, :final_len]
+    else:
+        y = np.pad(y, ((0, 0), (0, final_len - y.shape[-1])), mode="edge")
+    return y.astype(x.dtype, copy=False)
+
+
 def _resample_stim_channels(stim_data, up, down):
     """Resample stim channels, carefully.
 
@@ -2070,19 +2201,33 @@ def _resample_stim_channels(stim_data, up, down):
     )
 
     # Create windows starting from sample_picks[i], ending at sample_picks[i+1]
-    windows = zip(sample_picks, np.r_[sample_picks[1:], n_samples])
+    _stim_windows_first_nonzero(
+        stim_data, sample_picks, np.r_[sample_picks[1:], n_samples], stim_resampled
+    )
+    return stim_resampled
+
+
+def _stim_sample_picks(ratio, n_samples, start, stop):
+    """Get the stim windows of resampled samples start through stop - 1."""
+    sample_picks = np.minimum(
+        (np.arange(start, stop + 1) / ratio).astype(int), n_samples - 1
+    )
+    ends = sample_picks[1:]
+    if stop == int(round(n_samples * ratio)):
+        ends[-1] = n_samples
+    return sample_picks[:-1], ends
+
 
-    # Use the first non-zero value in each window
-    for window_i, window in enumerate(windows):
+def _stim_windows_first_nonzero(stim_data, starts, stops, out):
+    """Use the first non-zero value in each window of the stim channels."""
+    for window_i, window in enumerate(zip(starts, stops)):
         for stim_num, stim in enumerate(stim_data):
             nonzero = stim[window[0] : window[1]].nonzero()[0]
             if len(nonzero) > 0:
                 val = stim[window[0] + nonzero[0]]
             else:
                 val = stim[window[0]]
-            stim_resampled[stim_num, window_i] = val
-
-    return stim_resampled
+            out[stim_num, window_i] = val
 
 
 def detrend(x, order=1, axis=-1):
@@ -2635,10 +2780,11 @@ class FilterMixin:
         self,
         sfreq,
         npad="auto",
-        window="boxcar",
+        window="auto",
         n_jobs=None,
         pad="edge",
         *,
+        method="fft",
         verbose=None,
     ):
         """Resample data.
@@ -2655,11 +2801,14 @@ class FilterMixin:
         %(npad)s
         %(window_resample)s
         %(n_jobs_cuda)s
-        %(pad)s
+        %(pad_resample)s
             The default is ``'edge'``, which pads with the edge values of each
             vector.
 
             .. versionadded:: 0.15
+        %(method_resample)s
+
+            .. versionadded:: 1.6
         %(verbose)s
 
         Returns
@@ -2690,7 +2839,14 @@ class FilterMixin:
 
         _check_preload(self, "inst.resample")
         self._data = resample(
-            self._data, sfreq, o_sfreq, npad, window=window, n_jobs=n_jobs, pad=pad
+            self._data,
+            sfreq,
+            o_sfreq,
+            npad,
+            window=window,
+            n_jobs=n_jobs,
+            pad=pad,
+            method=method,
         )
         lowpass = self.info.get("lowpass")
         lowpass = np.inf if lowpass is None else lowpass
@@ -2974,3 +3130,110 @@ def _filt_update_info(info, update_info, l_freq, h_freq):
         ):
             with info._unlock():
                 info["highpass"] = float(l_freq)
+
+
+class _RawFIRStream:
+    """Filter raw data on the fly in consecutive chunks with bounded memory.
+
+    Each chunk is read with enough context on both sides (limited to the
+    segments delimited by ``skip_by_annotation``) for the output to match
+    filtering all of the data at once.
+    """
+
+    def __init__(self, raw, h, picks, phase, pad, n_jobs, skip_by_annotation):
+        from .annotations import _annotations_starts_stops
+
+        self.raw = raw
+        self.h = h
+        self.picks = picks
+        self.phase = phase
+        self.pad = pad
+        self.n_jobs = n_jobs
+        self.onsets, self.ends = _annotations_starts_stops(
+            raw, skip_by_annotation, invert=True
+        )
+        self.n_ctx = max(len(h) - 1, 0)
+        # keep the overhead of reading the context bounded
+        self.n_chunk = max(int(round(10 * raw.info["sfreq"])), 4 * self.n_ctx)
+        self.start = self.stop = 0
+        self.data = None
+
+    def __call__(self, picks, start, stop):
+        if not self.start <= start < stop <= self.stop:
+            self._process(start, max(stop, start + self.n_chunk))
+        return self.data[picks, start - self.start : stop - self.start]
+
+    def _process(self, start, stop):
+        n_times = len(self.raw.times)
+        stop = min(stop, n_times)
+        read_start = max(start - self.n_ctx, 0)
+        read_stop = min(stop + self.n_ctx, n_times)
+        logger.debug(f"    Filtering {start} ... {stop}")
+        data = self.raw.get_data(start=read_start, stop=read_stop)
+        self.data = data[:, start - read_start : stop - read_start].copy()
+        for onset, end in zip(self.onsets, self.ends):
+            seg_start, seg_stop = max(onset, start), min(end, stop)
+            if seg_start >= seg_stop:
+                continue
+            lo = max(onset, seg_start - self.n_ctx)
+            hi = min(end, seg_stop + self.n_ctx)
+            x = _overlap_add_filter(
+                data[:, lo - read_start : hi - read_start],
+                self.h,
+                None,
+                self.phase,
+                self.picks,
+                self.n_jobs,
+                copy=True,
+                pad=self.pad,
+            )
+            self.data[:, seg_start - start : seg_stop - start] = x[
+                :, seg_start - lo : seg_stop - lo
+            ]
+        self.start, self.stop = start, stop
+
+
+def _filter_raw_to_file(
+    raw,
+    out_fname,
+    overwrite,
+    l_freq,
+    h_freq,
+    picks,
+    filter_length,
+    l_trans_bandwidth,
+    h_trans_bandwidth,
+    n_jobs,
+    method,
+    phase,
+    fir_window,
+    fir_design,
+    skip_by_annotation,
+    pad,
+):
+    """Filter raw data chunk by chunk and write the result to a FIF file."""
+    from .io.base import _write_raw_stream
+
+    _check_option("method", method, ("fir",), extra="when out_fname is given")
+    if pad is None:
+        pad = "edge"
+    update_info, picks = _filt_check_picks(raw.info, picks, l_freq, h_freq)
+    h = create_filter(
+        None,
+        raw.info["sfreq"],
+        l_freq,
+        h_freq,
+        filter_length,
+        l_trans_bandwidth,
+        h_trans_bandwidth,
+        method,
+        None,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    info = raw.info.copy()
+    _filt_update_info(info, update_info, l_freq, h_freq)
+    stream = _RawFIRStream(raw, h, picks, phase, pad, n_jobs, skip_by_annotation)
+    logger.info(f"Writing filtered data in chunks of {stream.n_chunk} samples")
+    return _write_raw_stream(raw, out_fname, info, stream, overwrite)
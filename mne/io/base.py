@@ -15,6 +15,7 @@ from datetime import timedelta
 import os
 import os.path as op
 import shutil
+import textwrap
 from collections import defaultdict
 from dataclasses import dataclass, field
 
@@ -74,7 +75,14 @@ from ..filter import (
     resample,
     _resamp_ratio_len,
     _resample_stim_channels,
+    _resamp_window_pad,
+    _polyphase_up_down,
+    _polyphase_n_ctx,
+    _polyphase_resample,
+    _stim_sample_picks,
+    _stim_windows_first_nonzero,
     _check_fun,
+    _filter_raw_to_file,
 )
 from ..html_templates import _get_html_template
 from ..parallel import parallel_func
@@ -84,7 +92,6 @@ from ..utils import (
     sizeof_fmt,
     _check_pandas_index_arguments,
     fill_doc,
-    copy_doc,
     check_fname,
     _get_stim_channel,
     _stamp_to_dt,
@@ -108,11 +115,21 @@ from ..utils import (
     _pl,
     _file_like,
 )
+from ..utils.docs import docdict
 from ..defaults import _handle_default
 from ..viz import plot_raw, _RAW_CLIP_DEF
 from ..time_frequency.spectrum import Spectrum, SpectrumMixin, _validate_method
 
 
+def _add_out_fname_filter_doc(func):
+    """Copy the docstring of FilterMixin.filter, adding out_fname/overwrite."""
+    doc = FilterMixin.filter.__doc__
+    idx = doc.index("\n        Returns\n")
+    extra = textwrap.indent(docdict["out_fname_filter"], " " * 8)
+    func.__doc__ = doc[:idx] + extra + doc[idx:]
+    return func
+
+
 @fill_doc
 class BaseRaw(
     ProjMixin,
@@ -474,6 +491,10 @@ class BaseRaw(
                 raise ValueError("Bad array indexing, could be a bug")
             n_read = stop_file - start_file
             this_sl = slice(offset, offset + n_read)
+            if "virtual" in self._raw_extras[fi]:
+                _read_virtual_segment(self, data[:, this_sl], idx, fi, start_file)
+                offset += n_read
+                continue
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
             _ReadSegmentFileProtector(self)._read_segment_file(
@@ -602,6 +623,8 @@ class BaseRaw(
         )
         self._data = self._read_segment(data_buffer=data_buffer)
         assert len(self._data) == self.info["nchan"]
+        for extra in self._raw_extras:  # release virtually concatenated data
+            extra.pop("virtual", None)
         self.preload = True
         self._comp = None  # no longer needed
         self.close()
@@ -1104,8 +1127,10 @@ class BaseRaw(
 
         return self
 
-    # Need a separate method because the default pad is different for raw
-    @copy_doc(FilterMixin.filter)
+    # Need a separate method because the default pad is different for raw,
+    # and to write the filtered data to a file chunk by chunk
+    @_add_out_fname_filter_doc
+    @verbose
     def filter(
         self,
         l_freq,
@@ -1123,7 +1148,29 @@ class BaseRaw(
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="reflect_limited",
         verbose=None,
+        *,
+        out_fname=None,
+        overwrite=False,
     ):  # noqa: D102
+        if out_fname is not None:
+            return _filter_raw_to_file(
+                self,
+                out_fname,
+                overwrite,
+                l_freq,
+                h_freq,
+                picks,
+                filter_length,
+                l_trans_bandwidth,
+                h_trans_bandwidth,
+                n_jobs,
+                method,
+                phase,
+                fir_window,
+                fir_design,
+                skip_by_annotation,
+                pad,
+            )
         return super().filter(
             l_freq,
             h_freq,
@@ -1259,11 +1306,13 @@ class BaseRaw(
         self,
         sfreq,
         npad="auto",
-        window="boxcar",
+        window="auto",
         stim_picks=None,
         n_jobs=None,
         events=None,
-        pad="reflect_limited",
+        pad="auto",
+        *,
+        method="fft",
         verbose=None,
     ):
         """Resample all channels.
@@ -1305,10 +1354,12 @@ class BaseRaw(
             An optional event matrix. When specified, the onsets of the events
             are resampled jointly with the data. NB: The input events are not
             modified, but a new array is returned with the raw instead.
-        %(pad)s
-            The default is ``'reflect_limited'``.
+        %(pad_resample_auto)s
 
             .. versionadded:: 0.15
+        %(method_resample)s
+
+            .. versionadded:: 1.6
         %(verbose)s
 
         Returns
@@ -1332,6 +1383,10 @@ class BaseRaw(
         object has to have the data loaded e.g. with ``preload=True`` or
         ``self.load_data()``, but this increases memory requirements. The
         resulting raw object will have the data loaded into memory.
+
+        With ``method="polyphase"``, data that are not loaded are read and
+        resampled in chunks of about 10 seconds (all channels at once), so
+        that only the resampled data need to fit in memory.
         """
         sfreq = float(sfreq)
         o_sfreq = float(self.info["sfreq"])
@@ -1362,7 +1417,13 @@ class BaseRaw(
             )
 
         kwargs = dict(
-            up=sfreq, down=o_sfreq, npad=npad, window=window, n_jobs=n_jobs, pad=pad
+            up=sfreq,
+            down=o_sfreq,
+            npad=npad,
+            window=window,
+            n_jobs=n_jobs,
+            pad=pad,
+            method=method,
         )
         ratio, n_news = zip(
             *(
@@ -1387,6 +1448,12 @@ class BaseRaw(
                     new_data[stim_picks, this_sl] = _resample_stim_channels(
                         data_chunk[stim_picks], n_new, data_chunk.shape[1]
                     )
+            elif method == "polyphase":
+                if ri == 0:
+                    new_data = np.empty((len(self.ch_names), new_offsets[-1]))
+                new_data[:, this_sl] = _resample_raw_chunks(
+                    self, offsets[ri], n_orig, n_new, ratio, stim_picks, kwargs
+                )
             else:  # this will not be I/O efficient, but will be mem efficient
                 for ci in range(len(self.ch_names)):
                     data_chunk = self.get_data(
@@ -1639,27 +1706,8 @@ class BaseRaw(
         Samples annotated ``BAD_ACQ_SKIP`` are not stored in order to optimize
         memory. Whatever values, they will be loaded as 0s when reading file.
         """
-        endings = (
-            "raw.fif",
-            "raw_sss.fif",
-            "raw_tsss.fif",
-            "_meg.fif",
-            "_eeg.fif",
-            "_ieeg.fif",
-        )
-        endings += tuple([f"{e}.gz" for e in endings])
-        endings_err = (".fif", ".fif.gz")
-
-        # convert to str, check for overwrite a few lines later
-        fname = _check_fname(fname, overwrite=True, verbose="error")
-        check_fname(fname, "raw", endings, endings_err=endings_err)
-
+        fname = _check_raw_save_fname(self, fname, overwrite)
         split_size = _get_split_size(split_size)
-        if not self.preload and str(fname) in self._filenames:
-            raise ValueError(
-                "You cannot save data to the same file."
-                " Please use a different filename."
-            )
 
         if self.preload:
             if np.iscomplexobj(self._data):
@@ -1674,9 +1722,6 @@ class BaseRaw(
                 'Complex data must be saved as "single" or ' '"double", not "short"'
             )
 
-        # check for file existence and expand `~` if present
-        fname = _check_fname(fname=fname, overwrite=overwrite, verbose="error")
-
         if proj:
             info = deepcopy(self.info)
             projector, info = setup_proj(info)
@@ -1953,7 +1998,15 @@ class BaseRaw(
             else:
                 preload = False
 
-        if preload is False:
+        raw_extras = [r._raw_extras for r in all_raws]
+        read_picks = [r._read_picks for r in all_raws]
+        if isinstance(preload, str) and preload == "virtual":
+            raw_extras, read_picks = zip(*(_virtual_raw_extras(r) for r in all_raws))
+            self._raw_extras, self._read_picks = list(raw_extras[0]), read_picks[0]
+            if self.preload:
+                self._data = None
+            self.preload = False
+        elif preload is False:
             if self.preload:
                 self._data = None
             self.preload = False
@@ -1999,8 +2052,8 @@ class BaseRaw(
             edge_samps.append(sum(self._last_samps) - sum(self._first_samps) + (ri + 1))
             self._first_samps = np.r_[self._first_samps, r._first_samps]
             self._last_samps = np.r_[self._last_samps, r._last_samps]
-            self._read_picks += r._read_picks
-            self._raw_extras += r._raw_extras
+            self._read_picks += read_picks[ri + 1]
+            self._raw_extras += raw_extras[ri + 1]
             self._filenames += r._filenames
         assert annotations.orig_time == self.info["meas_date"]
         # The above _combine_annotations gets everything synchronized to
@@ -2165,7 +2218,14 @@ class BaseRaw(
 
         Notes
         -----
+        If the data are not preloaded and Welch's method is used with
+        ``average='mean'`` (the default), the data are read and the
+        periodograms of the segments accumulated chunk by chunk, so the data
+        are never loaded entirely into memory.
+
         .. versionadded:: 1.2
+        .. versionchanged:: 1.6
+           Non-preloaded data are processed chunk by chunk.
 
         References
         ----------
@@ -2493,6 +2553,41 @@ def _get_scaling(ch_type, target_unit):
     return scaling
 
 
+def _virtual_raw_extras(raw):
+    """Get file extras and read picks that reference preloaded data."""
+    if not raw.preload:
+        return raw._raw_extras, raw._read_picks
+    # the data are final, i.e. calibrated, compensated and picked
+    offsets = np.cumsum([0] + list(raw._raw_lengths))
+    raw_extras = list()
+    for fi, extra in enumerate(raw._raw_extras):
+        extra = dict(extra)  # do not modify the other instance
+        extra["virtual"] = (
+            raw._first_samps[fi],
+            raw._data[:, offsets[fi] : offsets[fi + 1]],
+        )
+        raw_extras.append(extra)
+    read_picks = [np.arange(raw.info["nchan"]) for _ in raw_extras]
+    return raw_extras, read_picks
+
+
+def _read_virtual_segment(raw, data, idx, fi, start):
+    """Fill data from the preloaded data referenced by a virtual file."""
+    if raw._comp is not None:
+        raise RuntimeError(
+            "Cannot change the gradient compensation of virtually concatenated "
+            "data, call load_data() first"
+        )
+    first_samp, file_data = raw._raw_extras[fi]["virtual"]
+    start = start - first_samp
+    file_data = file_data[:, start : start + data.shape[1]]
+    read_picks = raw._read_picks[fi]
+    if raw._projector is None:
+        data[:] = file_data[read_picks[idx]]
+    else:  # projecting is idempotent, so it is fine if it was applied already
+        data[:] = raw._projector[idx] @ file_data[read_picks]
+
+
 class _ReadSegmentFileProtector:
     """Ensure only _filenames, _raw_extras, and _read_segment_file are used."""
 
@@ -2581,6 +2676,89 @@ def _write_raw(raw_fid_writer, fpath, split_naming, overwrite):
     logger.info("[done]")
 
 
+def _resample_raw_chunks(raw, offset, n_orig, n_new, ratio, stim_picks, kwargs):
+    """Resample one segment of non-preloaded raw data in chunks."""
+    window, pad = _resamp_window_pad(kwargs["window"], kwargs["pad"], "polyphase")
+    up, down = _polyphase_up_down(ratio)
+    n_ctx = _polyphase_n_ctx(up, down)
+    # chunks start at multiples of down so their first output sample is exact
+    n_chunk = max(int(round(10 * raw.info["sfreq"])) // down, 1) * down
+    n_chunk = max(n_chunk, 4 * n_ctx)
+    logger.info(f"Resampling in chunks of {n_chunk} samples")
+    out = np.empty((len(raw.ch_names), n_new))
+    for start in range(0, n_orig, n_chunk):
+        stop = min(start + n_chunk, n_orig)
+        out_start = start * up // down
+        out_stop = n_new if stop == n_orig else stop * up // down
+        if out_stop <= out_start:  # can happen for the last chunk
+            continue
+        lo, hi = max(start - n_ctx, 0), min(stop + n_ctx, n_orig)
+        data = raw._read_segment(offset + lo, offset + hi)
+        n_skip = (start - lo) * up // down
+        y = _polyphase_resample(
+            data,
+            up,
+            down,
+            n_skip + out_stop - out_start,
+            window,
+            pad,
+            kwargs["n_jobs"],
+        )
+        out[:, out_start:out_stop] = y[:, n_skip:]
+        if len(stim_picks) > 0:
+            # use the same windows as when resampling the whole segment
+            starts, stops = _stim_sample_picks(
+                n_new / n_orig, n_orig, out_start, out_stop
+            )
+            stim = np.zeros((len(stim_picks), out_stop - out_start))
+            _stim_windows_first_nonzero(data[stim_picks], starts - lo, stops - lo, stim)
+            out[stim_picks, out_start:out_stop] = stim
+    return out
+
+
+def _check_raw_save_fname(raw, fname, overwrite):
+    """Check the name of a raw file to write to."""
+    endings = (
+        "raw.fif",
+        "raw_sss.fif",
+        "raw_tsss.fif",
+        "_meg.fif",
+        "_eeg.fif",
+        "_ieeg.fif",
+    )
+    endings += tuple([f"{e}.gz" for e in endings])
+    endings_err = (".fif", ".fif.gz")
+
+    # convert to str, check for overwrite a few lines later
+    fname = _check_fname(fname, overwrite=True, verbose="error")
+    check_fname(fname, "raw", endings, endings_err=endings_err)
+
+    if not raw.preload and str(fname) in raw._filenames:
+        raise ValueError(
+            "You cannot save data to the same file." " Please use a different filename."
+        )
+
+    # check for file existence and expand `~` if present
+    return _check_fname(fname=fname, overwrite=overwrite, verbose="error")
+
+
+def _write_raw_stream(raw, fname, info, data_getter, overwrite, fmt="single"):
+    """Write data computed on the fly from raw data to a FIF file.
+
+    ``data_getter(picks, start, stop)`` is called with consecutive sample
+    ranges and must return the data to write for these channels and samples.
+    """
+    from .fiff import read_raw_fif
+
+    fname = _check_raw_save_fname(raw, fname, overwrite)
+    cfg = _RawFidWriterCfg(raw._get_buffer_size(), _get_split_size("2GB"), False, fmt)
+    raw_fid_writer = _RawFidWriter(
+        raw, info, None, None, 0, len(raw.times), cfg, data_getter=data_getter
+    )
+    _write_raw(raw_fid_writer, fname, "neuromag", overwrite)
+    return read_raw_fif(fname)
+
+
 class _ReservedFilename:
     def __init__(self, fname):
         self.fname = fname
@@ -2620,8 +2798,9 @@ class _RawFidWriterCfg:
 
 
 class _RawFidWriter:
-    def __init__(self, raw, info, picks, projector, start, stop, cfg):
+    def __init__(self, raw, info, picks, projector, start, stop, cfg, data_getter=None):
         self.raw = raw
+        self.data_getter = data_getter
         self.picks = _picks_to_idx(info, picks, "all", ())
         self.info = pick_info(info, sel=self.picks, copy=True)
         for k in range(self.info["nchan"]):
@@ -2659,6 +2838,7 @@ class _RawFidWriter:
             self.projector,
             self.cfg.drop_small_buffer,
             self.cfg.fmt,
+            self.data_getter,
         )
         end_block(fid, FIFF.FIFFB_MEAS)
         is_next_split = self.start < self.stop
@@ -2689,6 +2869,7 @@ def _write_raw_data(
     projector,
     drop_small_buffer,
     fmt,
+    data_getter=None,
 ):
     # Start the raw data
     data_kind = "IAS_" if info.get("maxshield", False) else ""
@@ -2754,13 +2935,16 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
+        if data_getter is None:
+            data = raw[picks, first:last][0]
+        else:
+            data = data_getter(picks, first, last)
+        assert data.shape[-1] == last - first
 
         if projector is not None:
             data = np.dot(projector, data)
 
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
+        if drop_small_buffer and (first > start) and (last - first < buffer_size):
             logger.info("Skipping data chunk due to small buffer ... " "[done]")
             break
         logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
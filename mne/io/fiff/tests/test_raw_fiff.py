@@ -21,7 +21,7 @@ from mne.datasets import testing
 from mne.filter import filter_data
 from mne._fiff.constants import FIFF
 from mne.io import RawArray, concatenate_raws, read_raw_fif, match_channel_orders, base
-from mne._fiff.open import read_tag, read_tag_info
+from mne._fiff.open import fiff_open, read_tag, read_tag_info
 from mne._fiff.tag import _read_tag_header
 from mne.io.tests.test_raw import _test_concat, _test_raw_reader
 from mne import (
@@ -37,6 +37,7 @@ from mne import (
 )
 from mne.utils import (
     assert_object_equal,
+    catch_logging,
     _dt_to_stamp,
     requires_mne,
     run_subprocess,
@@ -485,6 +486,47 @@ def test_concatenate_raws_order():
     assert np.all(ch0 == 0)
 
 
+def test_concatenate_raws_virtual(tmp_path):
+    """Test virtual concatenation of raws without copying their data."""
+    raws = [_create_toy_data(seed=seed) for seed in range(3)]
+    want = np.concatenate([raw.get_data() for raw in raws], axis=1)
+    # a non-preloaded instance can be mixed with preloaded ones
+    for ri, raw in enumerate(raws):
+        raw.save(tmp_path / f"test_{ri}_raw.fif")
+        raws[ri] = read_raw_fif(tmp_path / f"test_{ri}_raw.fif", preload=ri != 1)
+    raw = concatenate_raws([raws[0].copy()] + raws[1:], preload="virtual")
+    assert not raw.preload
+    assert raw._data is None
+    assert np.shares_memory(raw._raw_extras[2]["virtual"][1], raws[2]._data)
+    assert_allclose(raw.get_data(), want, atol=1e-20)
+    assert_allclose(
+        raw.get_data(picks=[0, 2], start=12400, stop=25100),
+        want[[0, 2], 12400:25100],
+        atol=1e-20,
+    )
+    assert len(raw.annotations) == 4  # BAD and EDGE boundaries
+    # in-place changes of the referenced data are visible
+    n_times = raws[0].n_times + raws[1].n_times
+    raws[2]._data[0, 0] = 1.0
+    assert raw.get_data(picks=[0], start=n_times, stop=n_times + 1)[0, 0] == 1.0
+    raws[2]._data[0, 0] = want[0, n_times]
+
+    # crop, pick and project without copying
+    raw.crop(20, 120).pick([2, 0])
+    assert_allclose(raw.get_data(), want[[2, 0], 5000:30001], atol=1e-20)
+    raw.set_eeg_reference(projection=True).apply_proj()
+    data = raw.get_data()
+    assert_allclose(data, data - data.mean(0), atol=1e-20)
+
+    # writing and loading materialize the data
+    raw.save(tmp_path / "concat_raw.fif")
+    assert_allclose(read_raw_fif(tmp_path / "concat_raw.fif").get_data(), data)
+    raw.load_data()
+    assert raw.preload
+    assert not any("virtual" in extra for extra in raw._raw_extras)
+    assert_allclose(raw.get_data(), data)
+
+
 @testing.requires_testing_data
 @pytest.mark.parametrize(
     "mod",
@@ -1193,6 +1235,40 @@ def test_filter_picks():
         pytest.raises(ValueError, raw_.filter, 10, 30)
 
 
+@pytest.mark.parametrize(
+    "l_freq, h_freq, phase",
+    [(0.5, 40.0, "zero"), (None, 30.0, "minimum"), (1.0, None, "zero-double")],
+)
+def test_filter_out_fname(tmp_path, l_freq, h_freq, phase):
+    """Test filtering non-preloaded raw data chunk by chunk to a file."""
+    info = create_info(["EEG 001", "EEG 002", "STI 014"], 200.0, ["eeg"] * 2 + ["stim"])
+    data = np.random.RandomState(0).randn(3, 12000) * 1e-6
+    raw = RawArray(data, info)
+    raw.set_annotations(Annotations([20.0], [0.0], ["edge"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, fmt="double")
+    raw = read_raw_fif(fname)
+    kwargs = dict(l_freq=l_freq, h_freq=h_freq, phase=phase)
+    raw_filt = raw.copy().load_data().filter(**kwargs)
+    with pytest.raises(RuntimeError, match="requires raw data to be loaded"):
+        raw.filter(**kwargs)
+    with pytest.raises(ValueError, match="same file"):
+        raw.filter(out_fname=fname, **kwargs)
+    with pytest.raises(ValueError, match="when out_fname is given"):
+        raw.filter(method="iir", out_fname=tmp_path / "bad_raw.fif", **kwargs)
+    out_fname = tmp_path / "test_filt_raw.fif"
+    raw_out = raw.filter(out_fname=out_fname, **kwargs)
+    assert not raw.preload
+    assert not raw_out.preload
+    assert raw_out.filenames == (str(out_fname),)
+    assert raw_out.info["highpass"] == raw_filt.info["highpass"]
+    assert raw_out.info["lowpass"] == raw_filt.info["lowpass"]
+    assert_allclose(raw_out.get_data(), raw_filt.get_data(), rtol=1e-6, atol=1e-12)
+    assert_allclose(raw_out.get_data("stim"), raw.get_data("stim"), rtol=1e-6)
+    with pytest.raises(FileExistsError, match="overwrite"):
+        raw.filter(out_fname=out_fname, **kwargs)
+
+
 @testing.requires_testing_data
 def test_crop():
     """Test cropping raw files."""
@@ -1429,6 +1505,30 @@ def test_resample(tmp_path, preload, n, npad):
     assert len(raw) == 10
 
 
+@pytest.mark.parametrize("sfreq, new_sfreq", ((100.0, 30.0), (256.0, 100.0)))
+def test_resample_polyphase(tmp_path, sfreq, new_sfreq):
+    """Test chunked polyphase resampling of data that are not loaded."""
+    rng = np.random.RandomState(0)
+    info = create_info(["EEG 001", "EEG 002", "STI 014"], sfreq, ["eeg"] * 2 + ["stim"])
+    data = rng.randn(3, 8001) * 1e-5
+    data[2] = 0
+    data[2, 50::397] = 5
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname)
+    raw = read_raw_fif(fname)
+    raw_preload = raw.copy().load_data()
+    with catch_logging() as log:
+        raw.resample(new_sfreq, method="polyphase", verbose=True)
+    assert "Resampling in chunks" in log.getvalue()
+    raw_preload.resample(new_sfreq, method="polyphase")
+    assert raw.preload
+    assert raw.info["sfreq"] == new_sfreq
+    assert raw.n_times == raw_preload.n_times == int(round(8001 * new_sfreq / sfreq))
+    assert_allclose(raw._data, raw_preload._data, rtol=1e-6, atol=1e-20)
+    assert_array_equal(find_events(raw), find_events(raw_preload))
+    assert len(find_events(raw)) == len(find_events(RawArray(data, info)))
+
+
 def test_resample_stim():
     """Test stim_picks argument."""
     data = np.ones((2, 1000))
@@ -2079,6 +2179,42 @@ def test_corrupted(tmp_path, offset):
     assert_allclose(raw.get_data(), raw_bad.get_data())
 
 
+def test_tree_cache(tmp_path, monkeypatch):
+    """Test caching of FIF directory trees."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("MNE_FIF_TREE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv("MNE_FIF_TREE_CACHE_SIZE", "2")
+    fname = tmp_path / "test_raw.fif"
+    shutil.copyfile(ctf_comp_fname, fname)
+
+    def _tree_repr(tree):
+        tree = tree.copy()
+        if tree["directory"] is not None:
+            tree["directory"] = [
+                (ent.kind, ent.type, ent.size, ent.next, ent.pos)
+                for ent in tree["directory"]
+            ]
+        tree["children"] = [_tree_repr(child) for child in tree["children"]]
+        return tree
+
+    fid, tree, directory = fiff_open(fname)
+    fid.close()
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+    fid, tree_cached, directory_cached = fiff_open(fname)
+    fid.close()
+    assert directory == directory_cached
+    assert_object_equal(_tree_repr(tree), _tree_repr(tree_cached))
+    raw = read_raw_fif(fname, preload=True)
+    assert_array_equal(raw.get_data(), read_raw_fif(ctf_comp_fname).get_data())
+    # modification invalidates the entry, and LRU entries are evicted
+    raw.crop(0, 0.25).save(fname, overwrite=True)
+    raw_read = read_raw_fif(fname)
+    assert raw_read.n_times == raw.n_times
+    assert len(list(cache_dir.glob("*.npz"))) == 2
+    read_raw_fif(ctf_comp_fname)
+    assert len(list(cache_dir.glob("*.npz"))) == 2
+
+
 @testing.requires_testing_data
 def test_expand_user(tmp_path, monkeypatch):
     """Test that we're expanding `~` before reading and writing."""
@@ -14,6 +14,7 @@ from scipy.stats import chi2
 from ._eloreta import _compute_eloreta
 from ..fixes import _safe_svd
 from ..io import BaseRaw
+from ..io.base import _allocate_data
 from .._fiff.constants import FIFF
 from .._fiff.open import fiff_open
 from .._fiff.tag import find_tag
@@ -66,7 +67,7 @@ from ..source_space._source_space import (
 from ..surface import _normal_orth
 from ..transforms import _ensure_trans, transform_surface_to
 from ..time_frequency.tfr import _check_tfr_complex
-from ..source_estimate import _make_stc, _get_src_type
+from ..source_estimate import _make_stc, _get_src_type, _label_time_course_operator
 from ..utils import (
     check_fname,
     logger,
@@ -1283,20 +1284,19 @@ def apply_inverse_raw(
     return stc
 
 
-def _apply_inverse_epochs_gen(
+def _prepare_inverse_epochs(
     epochs,
     inverse_operator,
     lambda2,
-    method="dSPM",
-    label=None,
-    nave=1,
-    pick_ori=None,
-    prepared=False,
-    method_params=None,
-    use_cps=True,
-    verbose=None,
+    method,
+    label,
+    nave,
+    pick_ori,
+    prepared,
+    method_params,
+    use_cps,
 ):
-    """Generate inverse solutions for epochs. Used in apply_inverse_epochs."""
+    """Set up the kernel to apply to epochs."""
     _validate_type(epochs, BaseEpochs, "epochs")
     _check_reference(epochs, inverse_operator["info"]["ch_names"])
     _check_option("method", method, INVERSE_METHODS)
@@ -1320,9 +1320,6 @@ def _apply_inverse_epochs_gen(
         inv, label, method, pick_ori, use_cps
     )
 
-    tstep = 1.0 / epochs.info["sfreq"]
-    tmin = epochs.times[0]
-
     is_free_ori = not (is_fixed_orient(inverse_operator) or pick_ori == "normal")
 
     if pick_ori == "vector" and noise_norm is not None:
@@ -1331,7 +1328,37 @@ def _apply_inverse_epochs_gen(
     if not is_free_ori and noise_norm is not None:
         # premultiply kernel with noise normalization
         K *= noise_norm
+    return sel, K, noise_norm, vertno, source_nn, is_free_ori
 
+
+def _apply_inverse_epochs_gen(
+    epochs,
+    inverse_operator,
+    lambda2,
+    method="dSPM",
+    label=None,
+    nave=1,
+    pick_ori=None,
+    prepared=False,
+    method_params=None,
+    use_cps=True,
+    verbose=None,
+):
+    """Generate inverse solutions for epochs. Used in apply_inverse_epochs."""
+    sel, K, noise_norm, vertno, source_nn, is_free_ori = _prepare_inverse_epochs(
+        epochs,
+        inverse_operator,
+        lambda2,
+        method,
+        label,
+        nave,
+        pick_ori,
+        prepared,
+        method_params,
+        use_cps,
+    )
+    tstep = 1.0 / epochs.info["sfreq"]
+    tmin = epochs.times[0]
     subject = _subject_from_inverse(inverse_operator)
     try:
         total = " / %d" % (len(epochs),)  # len not always defined
@@ -1373,6 +1400,40 @@ def _apply_inverse_epochs_gen(
     logger.info("[done]")
 
 
+def _apply_inverse_epochs_array(
+    epochs, sel, K, noise_norm, is_free_ori, pick_ori, return_array
+):
+    """Apply an inverse kernel to epochs, a chunk of epochs at a time."""
+    if not epochs.preload and not epochs._bad_dropped:
+        epochs.drop_bad()
+    n_epochs, n_times = len(epochs), len(epochs.times)
+    n_sources = K.shape[0]
+    if pick_ori == "vector":
+        shape = (n_epochs, n_sources // 3, 3, n_times)
+    else:
+        if is_free_ori:
+            n_sources //= 3
+        shape = (n_epochs, n_sources, n_times)
+    out = _allocate_data(return_array, shape, np.float32)
+    n_block = max(int(100e6 // (8 * K.shape[0] * n_times)), 1)
+    for start in range(0, n_epochs, n_block):
+        data = epochs.get_data(sel, item=slice(start, start + n_block))
+        n = len(data)
+        logger.info(f"Processing epochs : {start + 1}-{start + n} / {n_epochs}")
+        # stack the epochs as (n_channels, n_epochs * n_times) to use a
+        # single matrix product for the whole chunk
+        sol = K @ data.transpose(1, 0, 2).reshape(len(sel), n * n_times)
+        if is_free_ori:
+            if pick_ori != "vector":
+                sol = combine_xyz(sol)
+            if noise_norm is not None:
+                sol *= noise_norm
+        sol = sol.reshape(-1, n, n_times).transpose(1, 0, 2)
+        out[start : start + n] = sol.reshape((n,) + shape[1:])
+    logger.info("[done]")
+    return out
+
+
 @verbose
 def apply_inverse_epochs(
     epochs,
@@ -1386,6 +1447,10 @@ def apply_inverse_epochs(
     prepared=False,
     method_params=None,
     use_cps=True,
+    *,
+    return_array=False,
+    labels=None,
+    mode="auto",
     verbose=None,
 ):
     """Apply inverse operator to Epochs.
@@ -1419,12 +1484,44 @@ def apply_inverse_epochs(
     %(use_cps_restricted)s
 
         .. versionadded:: 0.20
+    return_array : bool | path-like
+        If True, return the source time courses of all epochs as a single
+        single-precision array instead of a list of source estimates. The
+        epochs are then processed in chunks, with a single matrix product per
+        chunk. If path-like, the array is a :class:`numpy.memmap` stored in
+        this file. Defaults to False.
+
+        .. versionadded:: 1.6
+    labels : Label | BiHemiLabel | list | str | None
+        If not None, return one time course per label instead of the source
+        estimates, as :func:`mne.extract_label_time_course` would with the
+        source space of the inverse operator (see its ``labels`` parameter).
+        The label averaging is folded into the inverse kernel once, so the
+        time courses are computed directly from the sensor data without
+        computing the time courses of all sources. This requires a linear
+        inverse, i.e., a fixed-orientation inverse operator or
+        ``pick_ori="normal"``. Cannot be used together with ``label``.
+
+        .. versionadded:: 1.6
+    mode : str
+        The extraction method used for ``labels``, either ``"mean"``,
+        ``"mean_flip"``, or ``"auto"`` (default), which is ``"mean_flip"`` for
+        surface and ``"mean"`` for volume source spaces. See
+        :func:`mne.extract_label_time_course`.
+
+        .. versionadded:: 1.6
     %(verbose)s
 
     Returns
     -------
-    stcs : list of (SourceEstimate | VectorSourceEstimate | VolSourceEstimate)
-        The source estimates for all epochs.
+    stcs : list of (SourceEstimate | VectorSourceEstimate | VolSourceEstimate) | array
+        The source estimates for all epochs. If ``return_array`` is used, an
+        array of shape ``(n_epochs, n_sources, n_times)``, or
+        ``(n_epochs, n_sources, 3, n_times)`` for ``pick_ori="vector"``, with
+        the sources in the order of the vertices of the source estimates.
+        If ``labels`` is used, the label time courses of shape
+        ``(n_labels, n_times)`` for each epoch, or of shape
+        ``(n_epochs, n_labels, n_times)`` with ``return_array``.
 
     See Also
     --------
@@ -1433,6 +1530,42 @@ def apply_inverse_epochs(
     apply_inverse_tfr_epochs : Apply inverse operator to epochs tfr object.
     apply_inverse_cov : Apply inverse operator to a covariance object.
     """
+    _validate_type(return_array, (bool, "path-like"), "return_array")
+    if return_array is not False and return_generator:
+        raise ValueError("return_generator and return_array cannot be used together")
+    if labels is not None and label is not None:
+        raise ValueError("label and labels cannot be used together")
+    if return_array is not False or labels is not None:
+        sel, K, noise_norm, _, _, is_free_ori = _prepare_inverse_epochs(
+            epochs,
+            inverse_operator,
+            lambda2,
+            method,
+            label,
+            nave,
+            pick_ori,
+            prepared,
+            method_params,
+            use_cps,
+        )
+    if labels is not None:
+        if is_free_ori:
+            raise ValueError(
+                "Label time courses can only be extracted with the inverse "
+                "kernel for a fixed-orientation inverse operator or "
+                f'pick_ori="normal", got pick_ori={repr(pick_ori)}'
+            )
+        # fold the label averaging into the kernel (noise normalization is
+        # already applied to it)
+        src = inverse_operator["src"]
+        K = _label_time_course_operator(labels, src, mode, False, True) @ K
+        if return_array is False:
+            label_tc = (K @ e[sel] for e in epochs)
+            return label_tc if return_generator else list(label_tc)
+    if return_array is not False:
+        return _apply_inverse_epochs_array(
+            epochs, sel, K, noise_norm, is_free_ori, pick_ori, return_array
+        )
     stcs = _apply_inverse_epochs_gen(
         epochs,
         inverse_operator,
@@ -39,6 +39,7 @@ from mne import (
     make_ad_hoc_cov,
     pick_channels_forward,
     compute_raw_covariance,
+    extract_label_time_course,
 )
 from mne.io import read_raw_fif, read_info
 from mne.minimum_norm import (
@@ -1249,7 +1250,7 @@ def test_apply_mne_inverse_fixed_raw():
 
 @pytest.mark.slowtest
 @testing.requires_testing_data
-def test_apply_mne_inverse_epochs():
+def test_apply_mne_inverse_epochs(tmp_path):
     """Test MNE with precomputed inverse operator on Epochs."""
     inverse_operator = read_inverse_operator(fname_full)
     label_lh = read_label(Path(str(fname_label) % "Aud-lh"))
@@ -1307,6 +1308,37 @@ def test_apply_mne_inverse_epochs():
         assert len(stcs) == 2
         assert 3 < stcs[0].data.max() < 10
         assert stcs[0].subject == "sample"
+
+        # all epochs at once in a single array
+        data = apply_inverse_epochs(
+            epochs,
+            inverse_operator,
+            lambda2,
+            "dSPM",
+            label=label_lh,
+            pick_ori=pick_ori,
+            prepared=True,
+            return_array=tmp_path / f"stcs_{pick_ori}.dat",
+        )
+        assert isinstance(data, np.memmap)
+        assert data.dtype == np.float32
+        assert data.shape == (len(stcs),) + stcs[0].data.shape
+        assert_allclose(data, [stc.data for stc in stcs], rtol=1e-5)
+    with pytest.raises(ValueError, match="cannot be used together"):
+        apply_inverse_epochs(
+            epochs,
+            inverse_operator,
+            lambda2,
+            prepared=True,
+            return_generator=True,
+            return_array=True,
+        )
+    data = apply_inverse_epochs(
+        epochs, inverse_operator, lambda2, prepared=True, return_array=True
+    )
+    assert not isinstance(data, np.memmap)
+    stcs = apply_inverse_epochs(epochs, inverse_operator, lambda2, prepared=True)
+    assert_allclose(data, [stc.data for stc in stcs], rtol=1e-5)
     inverse_operator = read_inverse_operator(fname_full)
 
     stcs = apply_inverse_epochs(
@@ -1356,6 +1388,42 @@ def test_apply_mne_inverse_epochs():
     assert label_stc.subject == "sample"
     assert_array_almost_equal(stcs_rh[0].data, label_stc.data)
 
+    # label time courses with the kernel
+    labels = [label_lh, label_rh]
+    for mode in ("mean", "mean_flip"):
+        want = extract_label_time_course(
+            stcs, labels, inverse_operator["src"], mode=mode
+        )
+        kwargs = dict(pick_ori="normal", prepared=True, labels=labels, mode=mode)
+        label_tc = apply_inverse_epochs(
+            epochs, inverse_operator, lambda2, "dSPM", **kwargs
+        )
+        assert len(label_tc) == len(stcs)
+        assert_allclose(label_tc, want, rtol=1e-7, atol=1e-10)
+        label_tc = apply_inverse_epochs(
+            epochs, inverse_operator, lambda2, "dSPM", return_array=True, **kwargs
+        )
+        assert label_tc.shape == (len(stcs), 2, len(epochs.times))
+        assert_allclose(label_tc, want, rtol=1e-5, atol=1e-6)
+    with pytest.raises(ValueError, match="fixed-orientation inverse"):
+        apply_inverse_epochs(
+            epochs, inverse_operator, lambda2, prepared=True, labels=labels
+        )
+    with pytest.raises(ValueError, match="Invalid value for the 'mode'"):
+        apply_inverse_epochs(
+            epochs,
+            inverse_operator,
+            lambda2,
+            pick_ori="normal",
+            prepared=True,
+            labels=labels,
+            mode="max",
+        )
+    with pytest.raises(ValueError, match="label and labels cannot be used"):
+        apply_inverse_epochs(
+            epochs, inverse_operator, lambda2, label=label_lh, labels=labels
+        )
+
     with pytest.raises(TypeError, match="must be an instance of BaseEpochs"):
         apply_inverse_epochs(
             EvokedArray(epochs[0].get_data()[0], epochs.info), inverse_operator, 1.0
@@ -9,6 +9,7 @@ from inspect import isfunction, signature, Parameter
 from collections import namedtuple
 from collections.abc import Sequence
 from copy import deepcopy
+from functools import partial
 from numbers import Integral
 from time import time
 from dataclasses import dataclass, is_dataclass
@@ -54,7 +55,9 @@ from .._fiff.meas_info import write_meas_info, read_meas_info, ContainsMixin
 from .._fiff.constants import FIFF
 from .._fiff.write import start_and_end_file, write_id
 from .._fiff.pick import pick_channels_regexp, _picks_by_type, _contains_ch_type
+from .._fiff.utils import _mult_cal_one
 from ..io import BaseRaw
+from ..io.base import _write_raw_stream
 from ..io.eeglab.eeglab import _get_info, _check_load_mat
 
 from ..epochs import BaseEpochs
@@ -94,6 +97,7 @@ from ..utils import (
     _check_all_same_channel_names,
     _check_on_missing,
     _on_missing,
+    use_log_level,
 )
 
 from ..fixes import _safe_svd
@@ -312,7 +316,8 @@ class ICA(ContainsMixin):
         list.
     %(info)s
     n_samples_ : int
-        The number of samples used on fit.
+        The number of samples used on fit. With ``max_samples``, this is the
+        number of samples the ICA algorithm was fit on.
     labels_ : dict
         A dictionary of independent component indices, grouped by types of
         independent components. This attribute is set by some of the artifact
@@ -600,6 +605,9 @@ class ICA(ContainsMixin):
         flat=None,
         tstep=2.0,
         reject_by_annotation=True,
+        *,
+        incremental=False,
+        max_samples=None,
         verbose=None,
     ):
         """Run the ICA decomposition on raw data.
@@ -655,12 +663,41 @@ class ICA(ContainsMixin):
         %(reject_by_annotation_raw)s
 
             .. versionadded:: 0.14.0
+        incremental : bool
+            If True, read the data one chunk at a time instead of loading it
+            all at once, which allows fitting ICA on recordings that do not
+            fit in memory (e.g., non-preloaded `~mne.io.Raw` or
+            `~mne.Epochs`). The pre-whitener and the PCA are computed from the
+            covariance of the data, accumulated in a first pass. The ICA
+            algorithm is then fit on the data projected onto the
+            ``n_components_`` first PCA components in a second pass, so
+            memory usage scales with ``n_components_`` instead of the number
+            of channels. Defaults to False.
+
+            .. versionadded:: 1.6
+        max_samples : int | None
+            The maximum number of time samples the ICA algorithm is fit on,
+            drawn at random (according to ``random_state``) from all
+            available samples. The pre-whitener and the PCA are still
+            computed from all samples, but ``n_samples_`` reports the number
+            of samples the ICA algorithm was fit on. If None (default), all
+            samples are used. Only used if ``incremental=True``.
+
+            .. versionadded:: 1.6
         %(verbose)s
 
         Returns
         -------
         self : instance of ICA
             Returns the modified instance.
+
+        Notes
+        -----
+        With ``incremental=True``, the rejection windows defined by ``tstep``
+        are evaluated within each chunk of about 10 seconds of data, the sign
+        of the PCA components is determined from the components themselves
+        rather than from the projected data, and the components are sorted by
+        the variance they explain in the samples the ICA was fit on.
         """
         req_map = dict(fastica="sklearn", picard="picard")
         for method, mod in req_map.items():
@@ -730,7 +767,20 @@ class ICA(ContainsMixin):
                 self.info["comps"] = []
         self.ch_names = self.info["ch_names"]
 
-        if isinstance(inst, BaseRaw):
+        if incremental:
+            var = self._fit_incremental(
+                inst,
+                picks,
+                start,
+                stop,
+                decim,
+                reject,
+                flat,
+                tstep,
+                reject_by_annotation,
+                max_samples,
+            )
+        elif isinstance(inst, BaseRaw):
             self._fit_raw(
                 inst,
                 picks,
@@ -748,7 +798,8 @@ class ICA(ContainsMixin):
             self._fit_epochs(inst, picks, decim, verbose)
 
         # sort ICA components by explained variance
-        var = _ica_explained_variance(self, inst)
+        if not incremental:
+            var = _ica_explained_variance(self, inst)
         var_ord = var.argsort()[::-1]
         _sort_components(self, var_ord, copy=False)
         t_stop = time()
@@ -836,28 +887,211 @@ class ICA(ContainsMixin):
 
         return self
 
-    def _compute_pre_whitener(self, data):
+    def _iter_fit_chunks(
+        self,
+        inst,
+        picks,
+        start,
+        stop,
+        decim,
+        reject,
+        flat,
+        tstep,
+        reject_by_annotation,
+        drop_inds=None,
+    ):
+        """Read the data to fit one chunk (n_channels, n_samples) at a time."""
+        if isinstance(inst, BaseEpochs):
+            n_times = len(inst.times)
+            n_block = max(int(100e6 // (8 * len(picks) * n_times)), 1)
+            for first in range(0, len(inst.events), n_block):
+                data = inst.get_data(picks, item=slice(first, first + n_block))
+                if decim is not None:
+                    data = data[:, :, ::decim]
+                if len(data):
+                    yield np.hstack(data)
+            return
+
+        start, stop = _check_start_stop(inst, start, stop)
+        reject_by_annotation = "omit" if reject_by_annotation else None
+        step = 1 if decim is None else int(decim)
+        # chunks of about 10 s made of whole rejection windows
+        window = int(np.ceil(np.ceil(tstep * inst.info["sfreq"]) / step))
+        n_chunk = window * max(int(10 * inst.info["sfreq"] / step / window), 1)
+        n_chunk *= step
+        offset = n_seen = 0
+        for first in range(start, stop, n_chunk):
+            data = inst.get_data(
+                picks, first, min(first + n_chunk, stop), reject_by_annotation
+            )
+            n_read = data.shape[1]
+            # keep every step-th sample across chunk boundaries
+            data = data[:, offset::step]
+            offset = (offset - n_read) % step
+            n_data = data.shape[1]
+            if (reject is not None) or (flat is not None):
+                try:
+                    data, drops = _reject_data_segments(
+                        data, reject, flat, decim, self.info, tstep
+                    )
+                except RuntimeError:  # no clean segment in this chunk
+                    drops = [
+                        (ii, ii + window)
+                        for ii in range(0, n_data - window + 1, window)
+                    ]
+                    data = data[:, :0]
+                if drop_inds is not None:
+                    drop_inds.extend((a + n_seen, b + n_seen) for a, b in drops)
+            n_seen += n_data
+            if data.shape[1]:
+                yield data
+
+    def _fit_incremental(
+        self,
+        inst,
+        picks,
+        start,
+        stop,
+        decim,
+        reject,
+        flat,
+        tstep,
+        reject_by_annotation,
+        max_samples,
+    ):
+        """Fit ICA reading the data one chunk at a time (two passes)."""
+        _validate_type(max_samples, (None, "int-like"), "max_samples")
+        if isinstance(inst, BaseEpochs):
+            # the epochs are read by index, which requires the bad ones to be
+            # dropped first (this reads the data once if they are not)
+            inst.drop_bad()
+        if isinstance(inst, BaseEpochs) and inst.events.size == 0:
+            raise RuntimeError(
+                "Tried to fit ICA with epochs, but none were "
+                'found: epochs.events is "{}".'.format(inst.events)
+            )
+        random_state = check_random_state(self.random_state)
+        args = (
+            inst,
+            picks,
+            start,
+            stop,
+            decim,
+            reject,
+            flat,
+            tstep,
+            reject_by_annotation,
+        )
+
+        # First pass: accumulate the moments of the data, from which the
+        # pre-whitener and the PCA are obtained
+        drop_inds = list()
+        moments = _DataMoments()
+        for data in self._iter_fit_chunks(*args, drop_inds=drop_inds):
+            moments.add(data)
+        if moments.n == 0:
+            raise RuntimeError(
+                "No clean segment found. Please consider updating your "
+                "rejection thresholds."
+            )
+        if isinstance(inst, BaseEpochs):
+            self.reject_ = deepcopy(inst.reject)
+        elif (reject is not None) or (flat is not None):
+            self.reject_ = reject
+            self.drop_inds_ = drop_inds
+        else:
+            self.reject_ = None
+        self._compute_pre_whitener(None, moments=moments)
+        # the linear operator that pre-whitens the data
+        pre_whitener = self._pre_whiten(np.eye(len(picks)))
+        mean = moments.mean(pre_whitener)
+        explained_variance, components = np.linalg.eigh(moments.cov(pre_whitener))
+        explained_variance = np.maximum(explained_variance[::-1], 0.0)
+        components = components[:, ::-1].T
+        # flip the sign of the components to enforce deterministic output
+        max_abs = np.argmax(np.abs(components), axis=1)
+        signs = np.sign(components[np.arange(len(components)), max_abs])
+        components *= signs[:, np.newaxis]
+        use_ev = explained_variance / explained_variance.sum()
+        n_pca = min(moments.n, len(components))
+        if self._max_pca_components is not None:
+            n_pca = min(n_pca, self._max_pca_components)
+        self._set_pca(
+            mean, components[:n_pca], explained_variance[:n_pca], use_ev[:n_pca]
+        )
+
+        # Second pass: project the data onto the whitened PCA components to
+        # fit the ICA on, optionally on a random subset of the samples
+        norms = np.sqrt(explained_variance[: self.n_components_])
+        norms[norms == 0] = 1.0
+        proj = components[: self.n_components_] @ pre_whitener / norms[:, np.newaxis]
+        offset = components[: self.n_components_] @ mean / norms
+        n_samples = moments.n
+        keep = None
+        if max_samples is not None and max_samples < n_samples:
+            keep = np.sort(random_state.choice(n_samples, max_samples, replace=False))
+            n_samples = max_samples
+            logger.info(f"Fitting ICA on {n_samples} randomly selected samples")
+        self.n_samples_ = n_samples
+        data_pca = np.empty((n_samples, self.n_components_))
+        n_in = n_out = 0
+        with use_log_level("warning"):  # already logged in the first pass
+            for data in self._iter_fit_chunks(*args):
+                n_data = data.shape[1]
+                if keep is not None:
+                    these = keep[(keep >= n_in) & (keep < n_in + n_data)]
+                    data = data[:, these - n_in]
+                n_in += n_data
+                data = proj @ data - offset[:, np.newaxis]
+                data_pca[n_out : n_out + data.shape[1]] = data.T
+                n_out += data.shape[1]
+        assert n_out == n_samples
+        self._fit_ica(data_pca, random_state)
+        self.current_fit = "epochs" if isinstance(inst, BaseEpochs) else "raw"
+
+        # variance explained by each component, to sort them
+        sources = (data_pca * norms) @ self.unmixing_matrix_.T
+        return (
+            np.sum(self.mixing_matrix_**2, axis=0)
+            * np.sum(sources**2, axis=0)
+            / (sources.size - 1)
+        )
+
+    def _compute_pre_whitener(self, data, moments=None):
         """Aux function."""
-        data = self._do_proj(data, log_suffix="(pre-whitener computation)")
+        if moments is None:
+            data = self._do_proj(data, log_suffix="(pre-whitener computation)")
+            n_channels = len(data)
+
+            def _std(picks):
+                return np.std(data[picks])
+
+        else:
+            # the projector (or the identity) to apply to the moments
+            n_channels = len(moments.sum)
+            proj = self._do_proj(np.eye(n_channels), "(pre-whitener computation)")
+
+            def _std(picks):
+                return moments.std(proj[picks])
 
         if self.noise_cov is None:
             # use standardization as whitener
             # Scale (z-score) the data by channel type
             info = self.info
-            pre_whitener = np.empty([len(data), 1])
+            pre_whitener = np.empty([n_channels, 1])
             for _, picks_ in _picks_by_type(info, ref_meg=False, exclude=[]):
-                pre_whitener[picks_] = np.std(data[picks_])
+                pre_whitener[picks_] = _std(picks_)
             if _contains_ch_type(info, "ref_meg"):
                 picks_ = pick_types(info, ref_meg=True, exclude=[])
-                pre_whitener[picks_] = np.std(data[picks_])
+                pre_whitener[picks_] = _std(picks_)
             if _contains_ch_type(info, "eog"):
                 picks_ = pick_types(info, eog=True, exclude=[])
-                pre_whitener[picks_] = np.std(data[picks_])
+                pre_whitener[picks_] = _std(picks_)
         else:
             pre_whitener, _ = compute_whitener(
                 self.noise_cov, self.info, picks=self.info.ch_names
             )
-            assert data.shape[0] == pre_whitener.shape[1]
+            assert n_channels == pre_whitener.shape[1]
         self.pre_whitener_ = pre_whitener
 
     def _do_proj(self, data, log_suffix=""):
@@ -894,7 +1128,18 @@ class ICA(ContainsMixin):
 
         pca = _PCA(n_components=self._max_pca_components, whiten=True)
         data = pca.fit_transform(data.T)
-        use_ev = pca.explained_variance_ratio_
+        self._set_pca(
+            pca.mean_,
+            pca.components_,
+            pca.explained_variance_,
+            pca.explained_variance_ratio_,
+        )
+        del pca
+        self._fit_ica(data[:, : self.n_components_], random_state)
+        self.current_fit = fit_type
+
+    def _set_pca(self, mean, components, explained_variance, use_ev):
+        """Store the PCA and select the number of ICA components."""
         n_pca = self.n_pca_components
         if isinstance(n_pca, float):
             n_pca = int(_exp_var_ncomp(use_ev, n_pca)[0])
@@ -936,10 +1181,9 @@ class ICA(ContainsMixin):
         logger.info("%s: %s components" % (msg, self.n_components_))
 
         # the things to store for PCA
-        self.pca_mean_ = pca.mean_
-        self.pca_components_ = pca.components_
-        self.pca_explained_variance_ = pca.explained_variance_
-        del pca
+        self.pca_mean_ = mean
+        self.pca_components_ = components
+        self.pca_explained_variance_ = explained_variance
         # update number of components
         self._update_ica_names()
         if self.n_pca_components is not None and self.n_pca_components > len(
@@ -950,18 +1194,18 @@ class ICA(ContainsMixin):
                 f"the number of PCA components ({len(self.pca_components_)})"
             )
 
-        # take care of ICA
-        sel = slice(0, self.n_components_)
+    def _fit_ica(self, data, random_state):
+        """Fit the ICA algorithm on whitened PCA data (n_samples, n_components_)."""
         if self.method == "fastica":
             from sklearn.decomposition import FastICA
 
             ica = FastICA(whiten=False, random_state=random_state, **self.fit_params)
-            ica.fit(data[:, sel])
+            ica.fit(data)
             self.unmixing_matrix_ = ica.components_
             self.n_iter_ = ica.n_iter_
         elif self.method in ("infomax", "extended-infomax"):
             unmixing_matrix, n_iter = infomax(
-                data[:, sel],
+                data,
                 random_state=random_state,
                 return_n_iter=True,
                 **self.fit_params,
@@ -973,7 +1217,7 @@ class ICA(ContainsMixin):
             from picard import picard
 
             _, W, _, n_iter = picard(
-                data[:, sel].T,
+                data.T,
                 whiten=False,
                 return_n_iter=True,
                 random_state=random_state,
@@ -1001,7 +1245,6 @@ class ICA(ContainsMixin):
         norms[norms == 0] = 1.0
         self.unmixing_matrix_ /= norms  # whitening
         self._update_mixing_matrix()
-        self.current_fit = fit_type
 
     def _update_mixing_matrix(self):
         self.mixing_matrix_ = linalg.pinv(self.unmixing_matrix_)
@@ -1215,7 +1458,9 @@ class ICA(ContainsMixin):
         var_explained_ratio = 1 - mean_var_diff / mean_var_orig
         return var_explained_ratio
 
-    def get_sources(self, inst, add_channels=None, start=None, stop=None):
+    def get_sources(
+        self, inst, add_channels=None, start=None, stop=None, *, preload=True
+    ):
         """Estimate sources given the unmixing matrix.
 
         This method will return the sources in the container format passed.
@@ -1238,6 +1483,13 @@ class ICA(ContainsMixin):
         stop : int | float | None
             Last sample to not include. If float, data will be interpreted as
             time in seconds. If None, the entire data will be used.
+        preload : bool
+            Only used for Raw. If False, the returned Raw is not preloaded and
+            the sources are computed from ``inst`` on demand, e.g. chunk by
+            chunk when plotting or saving, so that memory use does not grow
+            with the length of the recording. Defaults to True.
+
+            .. versionadded:: 1.6
 
         Returns
         -------
@@ -1248,7 +1500,7 @@ class ICA(ContainsMixin):
             _check_compensation_grade(
                 self.info, inst.info, "ICA", "Raw", ch_names=self.ch_names
             )
-            sources = self._sources_as_raw(inst, add_channels, start, stop)
+            sources = self._sources_as_raw(inst, add_channels, start, stop, preload)
         elif isinstance(inst, BaseEpochs):
             _check_compensation_grade(
                 self.info, inst.info, "ICA", "Epochs", ch_names=self.ch_names
@@ -1263,10 +1515,24 @@ class ICA(ContainsMixin):
             raise ValueError("Data input must be of Raw, Epochs or Evoked " "type")
         return sources
 
-    def _sources_as_raw(self, raw, add_channels, start, stop):
+    def _sources_as_raw(self, raw, add_channels, start, stop, preload=True):
         """Aux method."""
         # merge copied instance and picked data with sources
         start, stop = _check_start_stop(raw, start, stop)
+        if not preload:
+            if not hasattr(self, "mixing_matrix_"):
+                raise RuntimeError("No fit available. Please fit ICA.")
+            picks = self._get_picks(raw)
+            operator, offset = _affine_operator(self._transform, len(picks))
+            add_picks = []
+            if add_channels is not None and len(add_channels):
+                add_picks = pick_channels(raw.ch_names, add_channels)
+            info = raw.info.copy()
+            self._export_info(info, raw, add_channels)
+            out = _RawICA(
+                raw, info, np.r_[picks, add_picks].astype(int), operator, offset
+            )
+            return out.crop(start / raw.info["sfreq"], (stop - 1) / raw.info["sfreq"])
         data_ = self._transform_raw(raw, start=start, stop=stop)
         assert data_.shape[1] == stop - start
 
@@ -2146,6 +2412,8 @@ class ICA(ContainsMixin):
         stop=None,
         *,
         on_baseline="warn",
+        out_fname=None,
+        overwrite=False,
         verbose=None,
     ):
         """Remove selected components from the signal.
@@ -2179,12 +2447,25 @@ class ICA(ContainsMixin):
             Last sample to not include. If float, data will be interpreted as
             time in seconds. If None, data will be used to the last sample.
         %(on_baseline_ica)s
+        out_fname : path-like | None
+            Only for Raw. If not None, the data are not cleaned in place.
+            Instead, they are read, cleaned, and written to this FIF file
+            chunk by chunk, so that the data do not need to be preloaded and
+            the memory usage does not depend on the duration of the
+            recording.
+
+            .. versionadded:: 1.6
+        %(overwrite)s
+            Only used when ``out_fname`` is not None.
+
+            .. versionadded:: 1.6
         %(verbose)s
 
         Returns
         -------
         out : instance of Raw, Epochs or Evoked
-            The processed data.
+            The processed data. If ``out_fname`` is not None, a new (not
+            preloaded) instance reading the cleaned data from ``out_fname``.
 
         Notes
         -----
@@ -2207,7 +2488,18 @@ class ICA(ContainsMixin):
         )
         if isinstance(inst, BaseRaw):
             kind, meth = "Raw", self._apply_raw
-            kwargs.update(raw=inst, start=start, stop=stop)
+            kwargs.update(
+                raw=inst,
+                start=start,
+                stop=stop,
+                out_fname=out_fname,
+                overwrite=overwrite,
+            )
+        elif out_fname is not None:
+            raise ValueError(
+                "out_fname can only be used when applying ICA to Raw data, got "
+                f"{type(inst).__name__}"
+            )
         elif isinstance(inst, BaseEpochs):
             kind, meth = "Epochs", self._apply_epochs
             kwargs.update(epochs=inst)
@@ -2246,15 +2538,48 @@ class ICA(ContainsMixin):
             # Allow both self.exclude and exclude to be array-like:
             return list(set(self.exclude).union(set(exclude)))
 
-    def _apply_raw(self, raw, include, exclude, n_pca_components, start, stop):
+    def _apply_raw(
+        self,
+        raw,
+        include,
+        exclude,
+        n_pca_components,
+        start,
+        stop,
+        out_fname=None,
+        overwrite=False,
+    ):
         """Aux method."""
-        _check_preload(raw, "ica.apply")
+        if out_fname is None:
+            _check_preload(raw, "ica.apply")
 
         start, stop = _check_start_stop(raw, start, stop)
 
         picks = pick_types(
             raw.info, meg=False, include=self.ch_names, exclude="bads", ref_meg=False
         )
+        if out_fname is not None:
+            operator, offset = _affine_operator(
+                partial(
+                    self._pick_sources,
+                    include=include,
+                    exclude=exclude,
+                    n_pca_components=n_pca_components,
+                ),
+                len(picks),
+            )
+
+            def stream(out_picks, chunk_start, chunk_stop):
+                data = raw.get_data(start=chunk_start, stop=chunk_stop)
+                sl = slice(
+                    min(max(start - chunk_start, 0), chunk_stop - chunk_start),
+                    max(min(stop, chunk_stop) - chunk_start, 0),
+                )
+                data[picks, sl] = operator @ data[picks, sl] + offset[:, np.newaxis]
+                return data[out_picks]
+
+            logger.info("    Writing the cleaned data chunk by chunk")
+            return _write_raw_stream(raw, out_fname, raw.info, stream, overwrite)
 
         data = raw[picks, start:stop][0]
         data = self._pick_sources(data, include, exclude, n_pca_components)
@@ -2647,6 +2972,47 @@ class ICA(ContainsMixin):
         return _n_pca_comp
 
 
+class _DataMoments:
+    """Accumulate the first and second moments of multichannel data."""
+
+    def __init__(self):
+        self.n = 0
+        self.shift = None
+
+    def add(self, data):
+        """Add a chunk of data, shape (n_channels, n_samples)."""
+        if self.shift is None:
+            # work around the mean of the first chunk for numerical precision
+            self.shift = data.mean(axis=1)
+            self.sum = np.zeros(len(data))
+            self.sum_sq = np.zeros((len(data), len(data)))
+        data = data - self.shift[:, np.newaxis]
+        self.n += data.shape[1]
+        self.sum += data.sum(axis=1)
+        self.sum_sq += data @ data.T
+
+    def mean(self, op):
+        """Get the mean of the data transformed by a linear operator."""
+        return op @ (self.shift + self.sum / self.n)
+
+    def cov(self, op):
+        """Get the covariance of the data transformed by a linear operator."""
+        cov = self.sum_sq - np.outer(self.sum, self.sum) / self.n
+        cov = op @ cov @ op.T / (self.n - 1)
+        return (cov + cov.T) / 2.0
+
+    def std(self, op):
+        """Get the std of all values of the data transformed by an operator."""
+        # the rows of the transformed data are y + d, with y the shifted data
+        d = op @ self.shift
+        sum_y = op @ self.sum
+        sum_sq_y = np.einsum("ij,jk,ik->i", op, self.sum_sq, op)
+        mean = (sum_y.sum() + self.n * d.sum()) / (self.n * len(op))
+        d = d - mean
+        var = np.sum(sum_sq_y + 2 * d * sum_y + self.n * d**2) / (self.n * len(op))
+        return np.sqrt(max(var, 0.0))
+
+
 def _exp_var_ncomp(var, n):
     cvar = np.asarray(var, dtype=np.float64)
     cvar = cvar.cumsum()
@@ -2656,6 +3022,55 @@ def _exp_var_ncomp(var, n):
     return n, cvar[n - 1]
 
 
+def _affine_operator(func, n_channels):
+    """Get the operator and offset of an affine function of channel data."""
+    offset = func(np.zeros((n_channels, 1)))[:, 0]
+    operator = func(np.eye(n_channels)) - offset[:, np.newaxis]
+    return operator, offset
+
+
+class _RawICA(BaseRaw):
+    """ICA sources computed on demand from a Raw instance.
+
+    The first ``operator.shape[1]`` channels of ``raw[read_picks]`` are
+    mapped to sources through ``operator @ data + offset``, the remaining
+    ones are appended unchanged.
+    """
+
+    def __init__(self, raw, info, read_picks, operator, offset):
+        raw_extras = dict(
+            raw=raw,
+            read_picks=read_picks,
+            operator=operator,
+            offset=offset,
+            first_samp=raw.first_samp,
+            cals=np.array([ch["cal"] * ch["range"] for ch in info["chs"]]),
+        )
+        super().__init__(
+            info,
+            preload=False,
+            first_samps=[raw.first_samp],
+            last_samps=[raw.last_samp],
+            raw_extras=[raw_extras],
+            buffer_size_sec=raw.buffer_size_sec,
+        )
+        self.set_annotations(raw.annotations)
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        """Compute a chunk of data."""
+        extras = self._raw_extras[fi]
+        operator, offset = extras["operator"], extras["offset"]
+        start, stop = start - extras["first_samp"], stop - extras["first_samp"]
+        one = extras["raw"]._getitem(
+            (extras["read_picks"], slice(start, stop)), return_times=False
+        )
+        n_op = operator.shape[1]
+        sources = operator @ one[:n_op] + offset[:, np.newaxis]
+        one = np.concatenate([sources, one[n_op:]])
+        one /= extras["cals"][:, np.newaxis]
+        _mult_cal_one(data, one, idx, cals, mult)
+
+
 def _check_start_stop(raw, start, stop):
     """Aux function."""
     out = list()
@@ -46,6 +46,8 @@ from .._fiff.proc_history import _read_ctc
 from .._fiff.write import _generate_meas_id, DATE_NONE
 from .._fiff.tag import _loc_to_coil_trans, _coil_trans_to_loc
 from ..io import BaseRaw, RawArray
+from ..io.base import _write_raw_stream
+from ..parallel import parallel_func
 from ..utils import (
     verbose,
     logger,
@@ -227,6 +229,11 @@ def maxwell_filter(
     mag_scale=100.0,
     skip_by_annotation=("edge", "bad_acq_skip"),
     extended_proj=(),
+    *,
+    out_fname=None,
+    overwrite=False,
+    head_pos_tol=None,
+    n_jobs=None,
     verbose=None,
 ):
     """Maxwell filter data using multipole moments.
@@ -274,12 +281,38 @@ def maxwell_filter(
 
         .. versionadded:: 0.17
     %(extended_proj_maxwell)s
+    out_fname : path-like | None
+        If not None, the data are read, processed, and written to this FIF
+        file window by window instead of being loaded and filtered in memory,
+        so that the memory usage does not depend on the duration of the
+        recording.
+
+        .. versionadded:: 1.6
+    %(overwrite)s
+        Only used when ``out_fname`` is not None.
+
+        .. versionadded:: 1.6
+    head_pos_tol : tuple of float | None
+        Translation (in m) and rotation (in degrees) tolerance used for
+        movement compensation with ``head_pos``. If None (default), the SSS
+        decomposition is computed for each distinct head position. Otherwise,
+        head positions are rounded to a grid with these step sizes, so that
+        nearly identical positions reuse the same decomposition, e.g.
+        ``(0.0005, 0.1)`` for 0.5 mm and 0.1°.
+
+        .. versionadded:: 1.6
+    %(n_jobs)s
+        The windows of data (see ``st_duration``) are processed in parallel.
+
+        .. versionadded:: 1.6
     %(verbose)s
 
     Returns
     -------
     raw_sss : instance of Raw
-        The raw data with Maxwell filtering applied.
+        The raw data with Maxwell filtering applied. If ``out_fname`` is not
+        None, a new (not preloaded) instance reading the data from
+        ``out_fname``.
 
     See Also
     --------
@@ -402,10 +435,14 @@ def maxwell_filter(
         mag_scale=mag_scale,
         skip_by_annotation=skip_by_annotation,
         extended_proj=extended_proj,
+        head_pos_tol=head_pos_tol,
+    )
+    raw_sss = _run_maxwell_filter(
+        raw, out_fname=out_fname, overwrite=overwrite, n_jobs=n_jobs, **params
     )
-    raw_sss = _run_maxwell_filter(raw, **params)
-    # Update info
-    _update_sss_info(raw_sss, **params["update_kwargs"])
+    if out_fname is None:  # otherwise it was updated before writing
+        # Update info
+        _update_sss_info(raw_sss, **params["update_kwargs"])
     logger.info("[done]")
     return raw_sss
 
@@ -432,6 +469,7 @@ def _prep_maxwell_filter(
     skip_by_annotation=("edge", "bad_acq_skip"),
     extended_proj=(),
     reconstruct="in",
+    head_pos_tol=None,
     verbose=None,
 ):
     # There are an absurd number of different possible notations for spherical
@@ -445,6 +483,14 @@ def _prep_maxwell_filter(
     _validate_type(raw, BaseRaw, "raw")
     _check_usable(raw, ignore_ref)
     _check_regularize(regularize)
+    _validate_type(head_pos_tol, (tuple, list, None), "head_pos_tol")
+    if head_pos_tol is not None:
+        head_pos_tol = tuple(float(tol) for tol in head_pos_tol)
+        if len(head_pos_tol) != 2 or min(head_pos_tol) <= 0:
+            raise ValueError(
+                "head_pos_tol must be None or two positive values, got "
+                f"{head_pos_tol}"
+            )
     st_correlation = float(st_correlation)
     if st_correlation <= 0.0 or st_correlation > 1.0:
         raise ValueError("Need 0 < st_correlation <= 1., got %s" % st_correlation)
@@ -611,8 +657,8 @@ def _prep_maxwell_filter(
         S_recon = mult @ S_recon
     S_recon /= coil_scale
 
-    _get_this_decomp_trans = partial(
-        _get_decomp,
+    _get_this_decomp_trans = _DecompCache(
+        head_pos_tol,
         all_coils=all_coils,
         cal=calibration,
         regularize=regularize,
@@ -674,23 +720,27 @@ def _run_maxwell_filter(
     ignore_ref=False,
     reconstruct="in",
     copy=True,
+    out_fname=None,
+    overwrite=False,
+    n_jobs=None,
 ):
-    # Eventually find_bad_channels_maxwell could be sped up by moving this
-    # outside the loop (e.g., in the prep function) but regularization depends
-    # on which channels are being used, so easier just to include it here.
-    # The time it takes to recompute S and pS themselves is roughly on par
-    # with the np.dot with the data, so not a huge gain to be made there.
-    S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in = _get_this_decomp_trans(
-        info["dev_head_t"], t=0.0
-    )
-    update_kwargs.update(reg_moments=reg_moments.copy())
+    decomp = _get_this_decomp_trans(info["dev_head_t"], t=0.0)
+    update_kwargs.update(reg_moments=decomp[3].copy())
     if ctc is not None:
         ctc = ctc[good_mask][:, good_mask]
 
     add_channels = (head_pos[0] is not None) and (not st_only) and copy
-    raw_sss, pos_picks = _copy_preload_add_channels(raw, add_channels, copy, info)
-    sfreq = info["sfreq"]
+    if out_fname is None:
+        raw_sss, pos_picks = _copy_preload_add_channels(raw, add_channels, copy, info)
+        reader = raw_sss
+    else:
+        # only the info of the output is needed, the data are read on the fly
+        raw_sss, pos_picks = _copy_preload_add_channels(
+            raw, add_channels, True, info, load=False
+        )
+        reader = raw
     del raw
+    sfreq = info["sfreq"]
     if not st_only:
         # remove MEG projectors, they won't apply now
         _remove_meg_projs_comps(raw_sss, ignore_ref)
@@ -735,124 +785,201 @@ def _run_maxwell_filter(
         del read_lims
     st_duration = min(max_samps, st_duration)
 
-    # Loop through buffer windows of data
-    n_sig = int(np.floor(np.log10(max(len(starts), 0)))) + 1
-    logger.info("    Processing %s data chunk%s" % (len(starts), _pl(starts)))
+    windows = _iter_maxwell_windows(
+        partial(reader.get_data, meg_picks),
+        raw_sss.times,
+        starts,
+        stops,
+        decomp,
+        st_duration=st_duration,
+        st_correlation=st_correlation,
+        st_only=st_only,
+        st_when=st_when,
+        ctc=ctc,
+        this_pos_quat=this_pos_quat,
+        good_mask=good_mask,
+        n_pos=len(pos_picks),
+        head_pos=head_pos,
+        _get_this_decomp_trans=_get_this_decomp_trans,
+        S_recon=S_recon,
+        reconstruct=reconstruct,
+        n_jobs=n_jobs,
+    )
+    if out_fname is not None:
+        _update_sss_info(raw_sss, **update_kwargs)
+        stream = _MaxwellStream(reader, windows, meg_picks, pos_picks)
+        logger.info("    Writing the processed data chunk by chunk")
+        return _write_raw_stream(raw_sss, out_fname, raw_sss.info, stream, overwrite)
+    for start, stop, out_meg_data, out_pos_data in windows:
+        raw_sss._data[meg_picks, start:stop] = out_meg_data
+        raw_sss._data[pos_picks, start:stop] = out_pos_data
+    return raw_sss
+
+
+def _iter_maxwell_windows(
+    get_data,
+    times,
+    starts,
+    stops,
+    decomp,
+    *,
+    st_duration,
+    st_correlation,
+    st_only,
+    st_when,
+    ctc,
+    this_pos_quat,
+    good_mask,
+    n_pos,
+    head_pos,
+    _get_this_decomp_trans,
+    S_recon,
+    reconstruct,
+    n_jobs=None,
+):
+    """Process consecutive windows of MEG data.
+
+    ``get_data(start, stop)`` must return a new array with the MEG data of the
+    window. Yields the window limits with the MEG and cHPI position output.
+    """
+    # The windows are independent except for the decomposition (and cHPI
+    # quaternion) used before the first head position of a window, which is
+    # that of the last head position of the previous windows
+    windows = list()
+    prev_trans, prev_quat = None, this_pos_quat
     for ii, (start, stop) in enumerate(zip(starts, stops)):
         if start == stop:
             continue  # Skip zero-length annotations
-        tsss_valid = (stop - start) >= st_duration
-        rel_times = raw_sss.times[start:stop]
-        t_str = "%8.3f - %8.3f s" % tuple(rel_times[[0, -1]])
-        t_str += ("(#%d/%d)" % (ii + 1, len(starts))).rjust(2 * n_sig + 5)
-
-        # Get original data
-        orig_data = raw_sss._data[meg_picks[good_mask], start:stop]
-        # This could just be np.empty if not st_only, but shouldn't be slow
-        # this way so might as well just always take the original data
-        out_meg_data = raw_sss._data[meg_picks, start:stop]
-        # Apply cross-talk correction
-        if ctc is not None:
-            orig_data = ctc.dot(orig_data)
-        out_pos_data = np.empty((len(pos_picks), stop - start))
+        windows.append((ii, start, stop, prev_trans, prev_quat))
+        # only movement compensation moves on to the next head position
+        if head_pos[0] is not None and (not st_only or st_when == "after"):
+            pos_lims = np.searchsorted(head_pos[1], [start, stop])
+            if pos_lims[1] > pos_lims[0]:
+                prev_trans = head_pos[0][pos_lims[1] - 1]
+                prev_quat = head_pos[2][pos_lims[1] - 1]
+    parallel, p_fun, n_jobs = parallel_func(
+        _process_maxwell_window, n_jobs, max_jobs=len(windows), verbose=False
+    )
+    n_calls = n_hits = 0
+    # Loop through buffer windows of data
+    n_sig = int(np.floor(np.log10(max(len(starts), 0)))) + 1
+    logger.info(
+        "    Processing %s data chunk%s%s"
+        % (len(starts), _pl(starts), f" using {n_jobs} jobs" if n_jobs > 1 else "")
+    )
+    for bi in range(0, len(windows), n_jobs):
+        batch = windows[bi : bi + n_jobs]
+        outs = parallel(
+            p_fun(
+                # This could just be np.empty if not st_only, but shouldn't be
+                # slow this way so might as well just always take the original
+                # data
+                get_data(start, stop),
+                times[start:stop],
+                start,
+                stop,
+                decomp,
+                prev_trans,
+                prev_quat,
+                t_str=("(#%d/%d)" % (ii + 1, len(starts))).rjust(2 * n_sig + 5),
+                st_duration=st_duration,
+                st_correlation=st_correlation,
+                st_only=st_only,
+                st_when=st_when,
+                ctc=ctc,
+                good_mask=good_mask,
+                n_pos=n_pos,
+                head_pos=head_pos,
+                _get_this_decomp_trans=_get_this_decomp_trans,
+                S_recon=S_recon,
+                reconstruct=reconstruct,
+            )
+            for ii, start, stop, prev_trans, prev_quat in batch
+        )
+        for (_, start, stop, _, _), out in zip(batch, outs):
+            out_meg_data, out_pos_data, calls, hits = out
+            n_calls += calls
+            n_hits += hits
+            yield start, stop, out_meg_data, out_pos_data
+    if head_pos[0] is not None:
+        logger.info(
+            f"    Reused the SSS decomposition for {n_hits}/{n_calls} head "
+            f"position{_pl(n_calls)} ({100 * n_hits / max(n_calls, 1):0.1f}%)"
+        )
 
-        # Figure out which positions to use
-        t_s_s_q_a = _trans_starts_stops_quats(head_pos, start, stop, this_pos_quat)
-        n_positions = len(t_s_s_q_a[0])
 
-        # Set up post-tSSS or do pre-tSSS
-        if st_correlation is not None:
-            # If doing tSSS before movecomp...
-            resid = orig_data.copy()  # to be safe let's operate on a copy
-            if st_when == "after":
-                orig_in_data = np.empty((len(meg_picks), stop - start))
-            else:  # 'before'
-                avg_trans = t_s_s_q_a[-1]
-                if avg_trans is not None:
-                    # if doing movecomp
-                    (
-                        S_decomp_st,
-                        _,
-                        pS_decomp_st,
-                        _,
-                        n_use_in_st,
-                    ) = _get_this_decomp_trans(avg_trans, t=rel_times[0])
-                else:
-                    S_decomp_st, pS_decomp_st = S_decomp, pS_decomp
-                    n_use_in_st = n_use_in
-                orig_in_data = np.dot(
-                    np.dot(S_decomp_st[:, :n_use_in_st], pS_decomp_st[:n_use_in_st]),
-                    resid,
-                )
-                resid -= np.dot(
-                    np.dot(S_decomp_st[:, n_use_in_st:], pS_decomp_st[n_use_in_st:]),
-                    resid,
-                )
-                resid -= orig_in_data
-                # Here we operate on our actual data
-                proc = out_meg_data if st_only else orig_data
-                _do_tSSS(
-                    proc,
-                    orig_in_data,
-                    resid,
-                    st_correlation,
-                    n_positions,
-                    t_str,
-                    tsss_valid,
-                )
+def _process_maxwell_window(
+    out_meg_data,
+    rel_times,
+    start,
+    stop,
+    decomp,
+    prev_trans,
+    prev_quat,
+    *,
+    t_str,
+    st_duration,
+    st_correlation,
+    st_only,
+    st_when,
+    ctc,
+    good_mask,
+    n_pos,
+    head_pos,
+    _get_this_decomp_trans,
+    S_recon,
+    reconstruct,
+):
+    """Process one window of MEG data."""
+    S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in = decomp
+    n_calls = _get_this_decomp_trans.n_calls
+    n_hits = _get_this_decomp_trans.n_hits
+    tsss_valid = (stop - start) >= st_duration
+    t_str = "%8.3f - %8.3f s" % tuple(rel_times[[0, -1]]) + t_str
+
+    orig_data = out_meg_data[good_mask]
+    # Apply cross-talk correction
+    if ctc is not None:
+        orig_data = ctc.dot(orig_data)
+    out_pos_data = np.empty((n_pos, stop - start))
 
-        if not st_only or st_when == "after":
-            # Do movement compensation on the data
-            for trans, rel_start, rel_stop, this_pos_quat in zip(*t_s_s_q_a[:4]):
-                # Recalculate bases if necessary (trans will be None iff the
-                # first position in this interval is the same as last of the
-                # previous interval)
-                if trans is not None:
-                    (
-                        S_decomp,
-                        S_decomp_full,
-                        pS_decomp,
-                        reg_moments,
-                        n_use_in,
-                    ) = _get_this_decomp_trans(trans, t=rel_times[rel_start])
-
-                # Determine multipole moments for this interval
-                mm_in = np.dot(pS_decomp[:n_use_in], orig_data[:, rel_start:rel_stop])
-
-                # Our output data
-                if not st_only:
-                    if reconstruct == "in":
-                        proj = S_recon.take(reg_moments[:n_use_in], axis=1)
-                        mult = mm_in
-                    else:
-                        assert reconstruct == "orig"
-                        proj = S_decomp_full  # already picked reg
-                        mm_out = np.dot(
-                            pS_decomp[n_use_in:], orig_data[:, rel_start:rel_stop]
-                        )
-                        mult = np.concatenate((mm_in, mm_out))
-                    out_meg_data[:, rel_start:rel_stop] = np.dot(proj, mult)
-                if len(pos_picks) > 0:
-                    out_pos_data[:, rel_start:rel_stop] = this_pos_quat[:, np.newaxis]
-
-                # Transform orig_data to store just the residual
-                if st_when == "after":
-                    # Reconstruct data using original location from external
-                    # and internal spaces and compute residual
-                    rel_resid_data = resid[:, rel_start:rel_stop]
-                    orig_in_data[:, rel_start:rel_stop] = np.dot(
-                        S_decomp[:, :n_use_in], mm_in
-                    )
-                    rel_resid_data -= np.dot(
-                        np.dot(S_decomp[:, n_use_in:], pS_decomp[n_use_in:]),
-                        rel_resid_data,
-                    )
-                    rel_resid_data -= orig_in_data[:, rel_start:rel_stop]
+    # Figure out which positions to use
+    t_s_s_q_a = _trans_starts_stops_quats(head_pos, start, stop, prev_quat)
+    n_positions = len(t_s_s_q_a[0])
 
-        # If doing tSSS at the end
+    # Set up post-tSSS or do pre-tSSS
+    if st_correlation is not None:
+        # If doing tSSS before movecomp...
+        resid = orig_data.copy()  # to be safe let's operate on a copy
         if st_when == "after":
+            orig_in_data = np.empty((len(out_meg_data), stop - start))
+        else:  # 'before'
+            avg_trans = t_s_s_q_a[-1]
+            if avg_trans is not None:
+                # if doing movecomp
+                (
+                    S_decomp_st,
+                    _,
+                    pS_decomp_st,
+                    _,
+                    n_use_in_st,
+                ) = _get_this_decomp_trans(avg_trans, t=rel_times[0])
+            else:
+                S_decomp_st, pS_decomp_st = S_decomp, pS_decomp
+                n_use_in_st = n_use_in
+            orig_in_data = np.dot(
+                np.dot(S_decomp_st[:, :n_use_in_st], pS_decomp_st[:n_use_in_st]),
+                resid,
+            )
+            resid -= np.dot(
+                np.dot(S_decomp_st[:, n_use_in_st:], pS_decomp_st[n_use_in_st:]),
+                resid,
+            )
+            resid -= orig_in_data
+            # Here we operate on our actual data
+            proc = out_meg_data if st_only else orig_data
             _do_tSSS(
-                out_meg_data,
+                proc,
                 orig_in_data,
                 resid,
                 st_correlation,
@@ -860,14 +987,112 @@ def _run_maxwell_filter(
                 t_str,
                 tsss_valid,
             )
-        elif st_when == "never" and head_pos[0] is not None:
-            logger.info(
-                "        Used % 2d head position%s for %s"
-                % (n_positions, _pl(n_positions), t_str)
-            )
-        raw_sss._data[meg_picks, start:stop] = out_meg_data
-        raw_sss._data[pos_picks, start:stop] = out_pos_data
-    return raw_sss
+
+    if not st_only or st_when == "after":
+        # Do movement compensation on the data
+        for trans, rel_start, rel_stop, this_pos_quat in zip(*t_s_s_q_a[:4]):
+            # Recalculate bases if necessary (trans will be None iff the
+            # first position in this interval is the same as last of the
+            # previous interval)
+            if trans is None:
+                trans = prev_trans
+            if trans is not None:
+                (
+                    S_decomp,
+                    S_decomp_full,
+                    pS_decomp,
+                    reg_moments,
+                    n_use_in,
+                ) = _get_this_decomp_trans(trans, t=rel_times[rel_start])
+
+            # Determine multipole moments for this interval
+            mm_in = np.dot(pS_decomp[:n_use_in], orig_data[:, rel_start:rel_stop])
+
+            # Our output data
+            if not st_only:
+                if reconstruct == "in":
+                    proj = S_recon.take(reg_moments[:n_use_in], axis=1)
+                    mult = mm_in
+                else:
+                    assert reconstruct == "orig"
+                    proj = S_decomp_full  # already picked reg
+                    mm_out = np.dot(
+                        pS_decomp[n_use_in:], orig_data[:, rel_start:rel_stop]
+                    )
+                    mult = np.concatenate((mm_in, mm_out))
+                out_meg_data[:, rel_start:rel_stop] = np.dot(proj, mult)
+            if n_pos > 0:
+                out_pos_data[:, rel_start:rel_stop] = this_pos_quat[:, np.newaxis]
+
+            # Transform orig_data to store just the residual
+            if st_when == "after":
+                # Reconstruct data using original location from external
+                # and internal spaces and compute residual
+                rel_resid_data = resid[:, rel_start:rel_stop]
+                orig_in_data[:, rel_start:rel_stop] = np.dot(
+                    S_decomp[:, :n_use_in], mm_in
+                )
+                rel_resid_data -= np.dot(
+                    np.dot(S_decomp[:, n_use_in:], pS_decomp[n_use_in:]),
+                    rel_resid_data,
+                )
+                rel_resid_data -= orig_in_data[:, rel_start:rel_stop]
+
+    # If doing tSSS at the end
+    if st_when == "after":
+        _do_tSSS(
+            out_meg_data,
+            orig_in_data,
+            resid,
+            st_correlation,
+            n_positions,
+            t_str,
+            tsss_valid,
+        )
+    elif st_when == "never" and head_pos[0] is not None:
+        logger.info(
+            "        Used % 2d head position%s for %s"
+            % (n_positions, _pl(n_positions), t_str)
+        )
+    n_calls = _get_this_decomp_trans.n_calls - n_calls
+    n_hits = _get_this_decomp_trans.n_hits - n_hits
+    return out_meg_data, out_pos_data, n_calls, n_hits
+
+
+class _MaxwellStream:
+    """Get Maxwell filtered data on the fly for consecutive sample ranges.
+
+    Data outside of the processed windows (e.g., in segments skipped due to
+    annotations) and non-MEG channels are passed through unchanged.
+    """
+
+    def __init__(self, raw, windows, meg_picks, pos_picks):
+        self.raw = raw
+        self.windows = windows
+        self.meg_picks = meg_picks
+        self.pos_picks = pos_picks
+        self.pending = list()
+        self.done = False
+
+    def __call__(self, picks, start, stop):
+        n_chan = len(self.raw.ch_names)
+        data = np.zeros((n_chan + len(self.pos_picks), stop - start))
+        data[:n_chan] = self.raw.get_data(start=start, stop=stop)
+        # windows come in order, get all of those that overlap this range
+        while not self.done and (not self.pending or self.pending[-1][1] < stop):
+            try:
+                self.pending.append(next(self.windows))
+            except StopIteration:
+                self.done = True
+        self.pending = [window for window in self.pending if window[1] > start]
+        for w_start, w_stop, out_meg_data, out_pos_data in self.pending:
+            lo, hi = max(w_start, start), min(w_stop, stop)
+            if lo >= hi:
+                continue
+            sl, w_sl = slice(lo - start, hi - start), slice(lo - w_start, hi - w_start)
+            data[self.meg_picks, sl] = out_meg_data[:, w_sl]
+            data[self.pos_picks, sl] = out_pos_data[:, w_sl]
+        return data[picks]
 
 
 def _get_coil_scale(meg_picks, mag_picks, grad_picks, mag_scale, info):
@@ -1063,8 +1288,11 @@ def _do_tSSS(
     clean_data -= np.dot(np.dot(clean_data, t_proj), t_proj.T)
 
 
-def _copy_preload_add_channels(raw, add_channels, copy, info):
-    """Load data for processing and (maybe) add cHPI pos channels."""
+def _copy_preload_add_channels(raw, add_channels, copy, info, *, load=True):
+    """Load data for processing and (maybe) add cHPI pos channels.
+
+    If ``load`` is False, only the info of the copy is updated.
+    """
     if copy:
         raw = raw.copy()
     with raw.info._unlock():
@@ -1081,19 +1309,20 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
             FIFF.FIFFV_HPI_ERR,
             FIFF.FIFFV_HPI_MOV,
         ]
-        out_shape = (len(raw.ch_names) + len(kinds), len(raw.times))
-        out_data = np.zeros(out_shape, np.float64)
-        msg = "    Appending head position result channels and "
-        if raw.preload:
-            logger.info(msg + "copying original raw data")
-            out_data[: len(raw.ch_names)] = raw._data
-            raw._data = out_data
-        else:
-            logger.info(msg + "loading raw data from disk")
-            with use_log_level(False):
-                raw._preload_data(out_data[: len(raw.ch_names)])
-            raw._data = out_data
-        assert raw.preload is True
+        if load:
+            out_shape = (len(raw.ch_names) + len(kinds), len(raw.times))
+            out_data = np.zeros(out_shape, np.float64)
+            msg = "    Appending head position result channels and "
+            if raw.preload:
+                logger.info(msg + "copying original raw data")
+                out_data[: len(raw.ch_names)] = raw._data
+                raw._data = out_data
+            else:
+                logger.info(msg + "loading raw data from disk")
+                with use_log_level(False):
+                    raw._preload_data(out_data[: len(raw.ch_names)])
+                raw._data = out_data
+            assert raw.preload is True
         off = len(raw.ch_names)
         chpi_chs = [
             dict(
@@ -1114,12 +1343,13 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
         raw.info["chs"].extend(chpi_chs)
         raw.info._update_redundant()
         raw.info._check_consistency()
-        assert raw._data.shape == (raw.info["nchan"], len(raw.times))
+        if load:
+            assert raw._data.shape == (raw.info["nchan"], len(raw.times))
         # Return the pos picks
         pos_picks = np.arange(len(raw.ch_names) - len(chpi_chs), len(raw.ch_names))
         return raw, pos_picks
     else:
-        if copy:
+        if copy and load:
             if not raw.preload:
                 logger.info("    Loading raw data from disk")
                 raw.load_data(verbose=False)
@@ -1166,6 +1396,106 @@ def _check_pos(pos, head_frame, raw, st_fixed, sfreq):
     return pos
 
 
+_DECOMP_CACHE_SIZE = 32  # how many SSS decompositions to keep
+
+
+class _DecompCache:
+    """Get SSS decompositions, reusing those of (nearly) identical positions.
+
+    With a tolerance, head positions are rounded to a grid of translations
+    and rotations (quaternions) before computing the decomposition. The most
+    recently used decompositions are kept, as well as the SSS bases of the
+    positions, which do not depend on the good channels.
+    """
+
+    def __init__(self, tol, *, good_mask, **kwargs):
+        self.tol = tol
+        self.good_mask = good_mask  # might be modified in place
+        self.kwargs = kwargs
+        self.cache = OrderedDict()
+        self.basis_cache = OrderedDict()
+        self.n_calls = self.n_hits = 0
+
+    def __getstate__(self):
+        # don't send the cached decompositions to parallel workers
+        state = self.__dict__.copy()
+        state["cache"] = OrderedDict()
+        state["basis_cache"] = OrderedDict()
+        return state
+
+    @property
+    def downdate(self):
+        """Whether removing a good channel only removes a row of the basis."""
+        # Otherwise the regularization depends on the good channels
+        return (
+            self.kwargs["regularize"] is None
+            and len(self.kwargs["exp"].get("extended_proj", ())) == 0
+        )
+
+    def __call__(self, trans, t):
+        self.n_calls += 1
+        trans_key, trans = self._quantize(trans)
+        key = (trans_key, self.good_mask.tobytes())
+        if key in self.cache:
+            self.n_hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        out = _get_decomp(
+            trans,
+            t=t,
+            good_mask=self.good_mask,
+            S_decomp_full=self._get_basis(trans_key, trans),
+            **self.kwargs,
+        )
+        self.cache[key] = out
+        while len(self.cache) > _DECOMP_CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return out
+
+    def _get_basis(self, trans_key, trans):
+        if trans_key in self.basis_cache:
+            self.basis_cache.move_to_end(trans_key)
+            return self.basis_cache[trans_key]
+        kwargs = self.kwargs
+        S_decomp_full = _get_s_decomp(
+            kwargs["exp"],
+            kwargs["all_coils"],
+            trans,
+            kwargs["coil_scale"],
+            kwargs["cal"],
+            kwargs["ignore_ref"],
+            kwargs["grad_picks"],
+            kwargs["mag_picks"],
+            kwargs["mag_scale"],
+        )
+        if kwargs["mult"] is not None:
+            S_decomp_full = kwargs["mult"] @ S_decomp_full
+        S_decomp_full.setflags(write=False)
+        self.basis_cache[trans_key] = S_decomp_full
+        while len(self.basis_cache) > _DECOMP_CACHE_SIZE:
+            self.basis_cache.popitem(last=False)
+        return S_decomp_full
+
+    def _quantize(self, trans):
+        if trans is None:
+            return None, None
+        if isinstance(trans, Transform):
+            trans = trans["trans"]
+        if self.tol is None:
+            return trans.tobytes(), trans
+        trans_tol, rot_tol = self.tol
+        # the vector part of a quaternion changes by half the rotation angle
+        steps = np.array([np.deg2rad(rot_tol) / 2.0] * 3 + [trans_tol] * 3)
+        idx = np.concatenate([rot_to_quat(trans[:3, :3]), trans[:3, 3]])
+        idx = np.round(idx / steps).astype(np.int64)
+        quat, pos = np.split(idx * steps, 2)
+        quat /= max(np.linalg.norm(quat), 1.0)
+        trans = np.eye(4)
+        trans[:3, :3] = quat_to_rot(quat)
+        trans[:3, 3] = pos
+        return idx.tobytes(), trans
+
+
 def _get_decomp(
     trans,
     *,
@@ -1183,24 +1513,30 @@ def _get_decomp(
     t,
     mag_scale,
     mult,
+    S_decomp_full=None,
 ):
-    """Get a decomposition matrix and pseudoinverse matrices."""
+    """Get a decomposition matrix and pseudoinverse matrices.
+
+    ``S_decomp_full`` can be the (not regularized) basis of all channels if it
+    has already been computed for ``trans``. It is not modified.
+    """
     #
     # Fine calibration processing (point-like magnetometers and calib. coeffs)
     #
-    S_decomp_full = _get_s_decomp(
-        exp,
-        all_coils,
-        trans,
-        coil_scale,
-        cal,
-        ignore_ref,
-        grad_picks,
-        mag_picks,
-        mag_scale,
-    )
-    if mult is not None:
-        S_decomp_full = mult @ S_decomp_full
+    if S_decomp_full is None:
+        S_decomp_full = _get_s_decomp(
+            exp,
+            all_coils,
+            trans,
+            coil_scale,
+            cal,
+            ignore_ref,
+            grad_picks,
+            mag_picks,
+            mag_scale,
+        )
+        if mult is not None:
+            S_decomp_full = mult @ S_decomp_full
     S_decomp = S_decomp_full[good_mask]
     #
     # Extended SSS basis (eSSS)
@@ -2421,6 +2757,135 @@ def _trans_sss_basis(exp, all_coils, trans=None, coil_scale=100.0):
     return S_tot
 
 
+_MAX_LEVERAGE = 0.999  # above this, removing a channel needs a new pinv
+
+
+class _NoisyDecomp:
+    """Update an SSS decomposition while removing good channels.
+
+    When the regularization does not depend on the good channels, a removed
+    channel only removes a row of the (column-normalized) basis, so the
+    inverse of its Gram matrix is updated with a rank-one downdate
+    (Sherman-Morrison) instead of recomputing the pseudoinverse.
+    """
+
+    def __init__(self, decomp_cache, trans, t, good_mask, coil_scale):
+        self.decomp_cache = decomp_cache
+        self.trans = trans
+        self.t = t
+        self.good_mask = good_mask.copy()
+        self.coil_scale = coil_scale[:, 0]
+        self._decompose()
+
+    def _decompose(self):
+        self.decomp_cache.good_mask[:] = self.good_mask
+        _, self.S_decomp_full, self.pS_decomp, _, _ = self.decomp_cache(
+            self.trans, t=self.t
+        )
+        self.gram_inv = None
+        if self.decomp_cache.downdate:
+            # Undo the data scaling and normalize the columns
+            self.S_scaled = self.S_decomp_full * self.coil_scale[:, np.newaxis]
+            self.norm = np.linalg.norm(self.S_scaled[self.good_mask], axis=0)
+            pinv = self.pS_decomp / self.coil_scale[self.good_mask]
+            pinv *= self.norm[:, np.newaxis]
+            self.gram_inv = pinv @ pinv.T
+
+    def remove(self, idx):
+        """Remove the channel at index ``idx`` of the MEG channels."""
+        self.good_mask[idx] = False
+        if self.gram_inv is not None:
+            row = self.S_scaled[idx] / self.norm
+            g_row = self.gram_inv @ row
+            denom = 1.0 - row @ g_row
+            if denom > 1.0 - _MAX_LEVERAGE:
+                self.gram_inv += np.outer(g_row / denom, g_row)
+                S_norm = self.S_scaled[self.good_mask] / self.norm
+                self.pS_decomp = self.gram_inv @ S_norm.T
+                self.pS_decomp /= self.norm[:, np.newaxis]
+                self.pS_decomp *= self.coil_scale[self.good_mask]
+                return
+        self._decompose()
+
+
+def _find_noisy_chunk(
+    data,
+    times,
+    start,
+    stop,
+    these_picks,
+    *,
+    limit,
+    meg_picks,
+    coil_scale,
+    ctc,
+    head_pos,
+    dev_head_t,
+    _get_this_decomp_trans,
+):
+    """Find the noisy channels in one chunk of MEG data iteratively.
+
+    ``data`` are the data of all MEG channels and ``these_picks`` the
+    candidate (good, non-flat) channels. Returns the noisy channels with their
+    score when they were excluded and the final scores of all candidates.
+    """
+    these_picks = list(these_picks)
+    scores = np.full(len(these_picks), np.nan)
+    order = list(range(len(these_picks)))
+    idx = np.searchsorted(meg_picks, these_picks)
+    good_mask = np.zeros(len(meg_picks), bool)
+    good_mask[idx] = True
+    # Positions are relative to the raw data, the one before the chunk
+    # (or the device-to-head transform) is used until the first one
+    prev_trans = dev_head_t
+    if head_pos[0] is not None:
+        n_before = np.searchsorted(head_pos[1], start)
+        if n_before > 0:
+            prev_trans = head_pos[0][n_before - 1]
+    trans, rel_starts, rel_stops = _trans_starts_stops_quats(
+        head_pos, start, stop, None
+    )[:3]
+    # The bases are computed once per chunk and downdated if possible
+    with use_log_level(False):
+        decomps = [
+            _NoisyDecomp(
+                _get_this_decomp_trans,
+                prev_trans if this_trans is None else this_trans,
+                times[rel_start],
+                good_mask,
+                coil_scale,
+            )
+            for this_trans, rel_start in zip(trans, rel_starts)
+        ]
+    noisy = list()
+    for _ in range(100):  # iteratively exclude the worst ones
+        good_data = data[good_mask]
+        if ctc is not None:
+            good_data = ctc[good_mask][:, good_mask].dot(good_data)
+        delta = data[idx]  # a copy
+        for decomp, rel_start, rel_stop in zip(decomps, rel_starts, rel_stops):
+            mm = decomp.pS_decomp @ good_data[:, rel_start:rel_stop]
+            delta[:, rel_start:rel_stop] -= decomp.S_decomp_full[idx] @ mm
+        # p2p
+        range_ = np.ptp(delta, axis=-1)
+        range_ *= coil_scale[idx, 0]
+        mean, std = np.mean(range_), np.std(range_)
+        # z score
+        z = (range_ - mean) / std
+        scores[order] = z
+        ii = np.argmax(z)
+        if z[ii] < limit:
+            break
+        noisy.append((these_picks.pop(ii), z[ii]))
+        order.pop(ii)
+        good_mask[idx[ii]] = False
+        with use_log_level(False):
+            for decomp in decomps:
+                decomp.remove(idx[ii])
+        idx = np.delete(idx, ii)
+    return noisy, scores
+
+
 # intentionally omitted: st_duration, st_correlation, destination, st_fixed,
 # st_only
 @verbose
@@ -2444,6 +2909,7 @@ def find_bad_channels_maxwell(
     skip_by_annotation=("edge", "bad_acq_skip"),
     h_freq=40.0,
     extended_proj=(),
+    n_jobs=None,
     verbose=None,
 ):
     r"""Find bad channels using Maxwell filtering.
@@ -2497,6 +2963,10 @@ def find_bad_channels_maxwell(
         should provide similar results to MaxFilter. If you do not wish to
         apply a filter, set this to ``None``.
     %(extended_proj_maxwell)s
+    %(n_jobs)s
+        The chunks of data (see ``duration``) are processed in parallel.
+
+        .. versionadded:: 1.6
     %(verbose)s
 
     Returns
@@ -2641,6 +3111,7 @@ def find_bad_channels_maxwell(
     del origin, int_order, ext_order, calibration, cross_talk, coord_frame
     del regularize, ignore_ref, bad_condition, head_pos, mag_scale
     good_meg_picks = params["meg_picks"][params["good_mask"]]
+    good_meg_idx = np.where(params["good_mask"])[0]
     assert len(params["meg_picks"]) == len(params["coil_scale"])
     assert len(params["good_mask"]) == len(params["meg_picks"])
     noisy_chs = Counter()
@@ -2671,98 +3142,92 @@ def find_bad_channels_maxwell(
     thresh_flat = np.full((len(ch_names), 1), np.nan)
     thresh_noisy = np.full_like(thresh_flat, fill_value=np.nan)
 
-    for si, (start, stop) in enumerate(zip(starts, stops)):
-        n_iter = 0
-        orig_data = raw.get_data(None, start, stop, verbose=False)
-        chunk_raw = RawArray(
-            orig_data,
-            params["info"],
-            first_samp=raw.first_samp + start,
-            copy="data",
-            verbose=False,
-        )
+    parallel, p_fun, n_jobs = parallel_func(
+        _find_noisy_chunk, n_jobs, max_jobs=len(starts), verbose=False
+    )
+    # The flat channels accumulate across chunks, so the flat pass is done in
+    # order and the (much slower) noisy pass for batches of chunks in parallel
+    all_flat = False
+    for bi in range(0, len(starts), n_jobs):
+        batch = list()
+        for si in range(bi, min(bi + n_jobs, len(starts))):
+            start, stop = starts[si], stops[si]
+            orig_data = raw.get_data(params["meg_picks"], start, stop, verbose=False)
+            times = raw.times[start:stop]
+            t = times[[0, -1]]
+            logger.info(
+                "        Interval %3d: %8.3f - %8.3f" % ((si + 1,) + tuple(t[[0, -1]]))
+            )
 
-        t = chunk_raw.times[[0, -1]] + start / raw.info["sfreq"]
-        logger.info(
-            "        Interval %3d: %8.3f - %8.3f" % ((si + 1,) + tuple(t[[0, -1]]))
-        )
+            # Flat pass: SD < 0.01 fT/cm or 0.01 fT for at 30 ms (or 20 samples)
+            n = stop - start
+            flat_stop = n - (n % flat_step)
+            data = orig_data[good_meg_idx, :flat_stop]
+            data.shape = (data.shape[0], -1, flat_step)
+            delta = np.std(data, axis=-1).min(-1)  # min std across segments
 
-        # Flat pass: SD < 0.01 fT/cm or 0.01 fT for at 30 ms (or 20 samples)
-        n = stop - start
-        flat_stop = n - (n % flat_step)
-        data = chunk_raw.get_data(good_meg_picks, 0, flat_stop)
-        data.shape = (data.shape[0], -1, flat_step)
-        delta = np.std(data, axis=-1).min(-1)  # min std across segments
-
-        # We may want to return this later if `return_scores=True`.
-        bins[si, :] = t[0], t[-1]
-        scores_flat[good_meg_picks, si] = delta
-        thresh_flat[good_meg_picks] = these_limits.reshape(-1, 1)
-
-        chunk_flats = delta < these_limits
-        chunk_flats = np.where(chunk_flats)[0]
-        chunk_flats = [
-            raw.ch_names[good_meg_picks[chunk_flat]] for chunk_flat in chunk_flats
-        ]
-        flat_chs.update(chunk_flats)
-        all_flats |= set(chunk_flats)
-        chunk_flats = sorted(all_flats)
-        these_picks = [
-            pick for pick in good_meg_picks if raw.ch_names[pick] not in chunk_flats
-        ]
-        if len(these_picks) == 0:
-            logger.info(f"            Flat ({len(chunk_flats):2d}): <all>")
-            warn(
-                "All-flat segment detected, all channels will be marked as "
-                f"flat and processing will stop (t={t[0]:0.3f}). "
-                "Consider using annotate_amplitude before calling this "
-                'function with skip_by_annotation="bad_flat" (or similar) to '
-                "properly process all segments."
-            )
-            break  # no reason to continue
-        # Bad pass
-        chunk_noisy = list()
-        params["st_duration"] = int(round(chunk_raw.times[-1] * raw.info["sfreq"]))
-        for n_iter in range(1, 101):  # iteratively exclude the worst ones
-            assert set(raw.info["bads"]) & set(chunk_noisy) == set()
-            params["good_mask"][:] = [
-                chunk_raw.ch_names[pick]
-                not in raw.info["bads"] + chunk_noisy + chunk_flats
-                for pick in params["meg_picks"]
+            # We may want to return this later if `return_scores=True`.
+            bins[si, :] = t[0], t[-1]
+            scores_flat[good_meg_picks, si] = delta
+            thresh_flat[good_meg_picks] = these_limits.reshape(-1, 1)
+
+            chunk_flats = delta < these_limits
+            chunk_flats = np.where(chunk_flats)[0]
+            chunk_flats = [
+                raw.ch_names[good_meg_picks[chunk_flat]] for chunk_flat in chunk_flats
             ]
-            chunk_raw._data[:] = orig_data
-            delta = chunk_raw.get_data(these_picks)
-            with use_log_level(False):
-                _run_maxwell_filter(chunk_raw, reconstruct="orig", copy=False, **params)
-
-            if n_iter == 1 and len(chunk_flats):
+            flat_chs.update(chunk_flats)
+            all_flats |= set(chunk_flats)
+            chunk_flats = sorted(all_flats)
+            these_picks = [
+                pick for pick in good_meg_picks if raw.ch_names[pick] not in chunk_flats
+            ]
+            if len(these_picks) == 0:
+                logger.info(f"            Flat ({len(chunk_flats):2d}): <all>")
+                warn(
+                    "All-flat segment detected, all channels will be marked as "
+                    f"flat and processing will stop (t={t[0]:0.3f}). "
+                    "Consider using annotate_amplitude before calling this "
+                    'function with skip_by_annotation="bad_flat" (or similar) '
+                    "to properly process all segments."
+                )
+                all_flat = True
+                break  # no reason to continue
+            if len(chunk_flats):
                 logger.info(
                     "            Flat (%2d): %s"
                     % (len(chunk_flats), " ".join(chunk_flats))
                 )
-            delta -= chunk_raw.get_data(these_picks)
-            # p2p
-            range_ = np.ptp(delta, axis=-1)
-            cs_picks = np.searchsorted(params["meg_picks"], these_picks)
-            range_ *= params["coil_scale"][cs_picks, 0]
-            mean, std = np.mean(range_), np.std(range_)
-            # z score
-            z = (range_ - mean) / std
-            idx = np.argmax(z)
-            max_ = z[idx]
-
+            batch.append((si, orig_data, times, start, stop, these_picks))
+        # Bad pass
+        outs = parallel(
+            p_fun(
+                orig_data,
+                times,
+                start,
+                stop,
+                these_picks,
+                limit=limit,
+                meg_picks=params["meg_picks"],
+                coil_scale=params["coil_scale"],
+                ctc=params["ctc"],
+                head_pos=params["head_pos"],
+                dev_head_t=params["info"]["dev_head_t"],
+                _get_this_decomp_trans=params["_get_this_decomp_trans"],
+            )
+            for _, orig_data, times, start, stop, these_picks in batch
+        )
+        for (si, _, _, _, _, these_picks), (chunk_noisy, z) in zip(batch, outs):
             # We may want to return this later if `return_scores=True`.
             scores_noisy[these_picks, si] = z
             thresh_noisy[these_picks] = limit
-
-            if max_ < limit:
-                break
-
-            name = raw.ch_names[these_picks[idx]]
-            logger.debug("            Bad:       %s %0.1f" % (name, max_))
-            these_picks.pop(idx)
-            chunk_noisy.append(name)
-        noisy_chs.update(chunk_noisy)
+            for pick, max_ in chunk_noisy:
+                logger.debug(
+                    "            Bad:       %s %0.1f" % (raw.ch_names[pick], max_)
+                )
+            noisy_chs.update(raw.ch_names[pick] for pick, _ in chunk_noisy)
+        if all_flat:
+            break
     noisy_chs = sorted(
         (b for b, c in noisy_chs.items() if c >= min_count),
         key=lambda x: raw.ch_names.index(x),
@@ -1166,6 +1166,94 @@ def test_ica_reject_buffer(method):
     _assert_ica_attributes(ica)
 
 
+def test_ica_incremental():
+    """Test fitting ICA incrementally on data that is not preloaded."""
+    raw = read_raw_fif(raw_fname).crop(0, stop)
+    picks = pick_types(raw.info, meg="mag", exclude="bads")[:8]
+    kwargs = dict(n_components=5, max_iter=500, method="fastica")
+    ica = ICA(**kwargs)
+    with _record_warnings():  # convergence
+        ica.fit(raw, picks=picks, decim=2)
+    ica_inc = ICA(**kwargs)
+    with _record_warnings():
+        ica_inc.fit(raw, picks=picks, decim=2, incremental=True)
+    assert not raw.preload
+    assert ica_inc.current_fit == "raw"
+    assert ica_inc.n_samples_ == ica.n_samples_
+    assert ica_inc.n_components_ == ica.n_components_
+    assert_allclose(ica_inc.pre_whitener_, ica.pre_whitener_, rtol=1e-6)
+    assert_allclose(ica_inc.pca_mean_, ica.pca_mean_, rtol=1e-6, atol=1e-20)
+    assert_allclose(
+        ica_inc.pca_explained_variance_, ica.pca_explained_variance_, rtol=1e-6
+    )
+    assert_allclose(
+        np.abs(ica_inc.pca_components_), np.abs(ica.pca_components_), atol=1e-6
+    )
+    _assert_ica_attributes(ica_inc)
+
+    # random subset of the projected samples
+    ica_sub = ICA(**kwargs)
+    with _record_warnings():
+        ica_sub.fit(raw, picks=picks, incremental=True, max_samples=500)
+    assert ica_sub.n_samples_ == 500
+    _assert_ica_attributes(ica_sub)
+
+    # epochs are read a block at a time
+    events = read_events(event_name)
+    epochs = Epochs(raw, events, event_id, tmin, tmax, picks=picks, preload=False)
+    assert not epochs._bad_dropped
+    ica_epo = ICA(**kwargs)
+    with _record_warnings():
+        ica_epo.fit(epochs, incremental=True)
+    assert ica_epo.current_fit == "epochs"
+    assert ica_epo.n_samples_ == len(epochs) * len(epochs.times)
+    _assert_ica_attributes(ica_epo)
+
+
+def test_ica_apply_get_sources_chunked(tmp_path):
+    """Test computing sources on demand and streaming the cleaned data."""
+    raw = read_raw_fif(raw_fname).crop(0, stop)
+    raw.pick(raw.ch_names[:40:3] + ["STI 014"])
+    picks = pick_types(raw.info, meg=True, exclude="bads")
+    ica = ICA(n_components=5, max_iter=500, method="fastica")
+    with _record_warnings():  # convergence
+        ica.fit(raw, picks=picks)
+    ica.exclude = [0, 2]
+
+    kwargs = dict(add_channels=["STI 014"], start=100, stop=1000)
+    sources = ica.get_sources(raw, **kwargs)
+    sources_lazy = ica.get_sources(raw, preload=False, **kwargs)
+    assert not raw.preload
+    assert not sources_lazy.preload
+    assert sources_lazy.ch_names == sources.ch_names
+    assert sources_lazy.info["bads"] == sources.info["bads"]
+    assert_allclose(sources_lazy.times, sources.times)
+    assert_allclose(sources_lazy.get_data(), sources.get_data(), atol=1e-10)
+    assert_allclose(
+        sources_lazy.copy().crop(0.5).get_data(picks=[1]),
+        sources.copy().crop(0.5).get_data(picks=[1]),
+        atol=1e-10,
+    )
+
+    raw_loaded = raw.copy().load_data()
+    kwargs = dict(exclude=[1], start=500, stop=2000)
+    raw_clean = ica.apply(raw_loaded.copy(), **kwargs)
+    fname = tmp_path / "test_ica_raw.fif"
+    raw_stream = ica.apply(raw, out_fname=fname, **kwargs)
+    assert not raw.preload
+    assert not raw_stream.preload
+    assert raw_stream.ch_names == raw_clean.ch_names
+    data_stream, data_clean = raw_stream.get_data(), raw_clean.get_data()
+    assert_allclose(data_stream, data_clean, rtol=1e-6, atol=1e-20)
+    assert_allclose(data_stream[:, :500], raw_loaded.get_data()[:, :500], rtol=1e-6)
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        ica.apply(raw, out_fname=fname)
+    events = make_fixed_length_events(raw_loaded, duration=1.0)
+    epochs = Epochs(raw_loaded, events, tmax=0.5, baseline=None, preload=True)
+    with pytest.raises(ValueError, match="only be used when applying ICA to Raw"):
+        ica.apply(epochs, out_fname=fname, overwrite=True)
+
+
 @pytest.mark.parametrize("method", ["fastica", "picard"])
 def test_ica_twice(method):
     """Test running ICA twice."""
@@ -7,7 +7,7 @@
 import pytest
 
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_allclose
 
 from scipy import stats
 from scipy import linalg
@@ -194,6 +194,29 @@ def test_infomax_n_iter(return_n_iter):
         assert isinstance(r, np.ndarray)
 
 
+@pytest.mark.parametrize("extended", [True, False])
+def test_infomax_dtype_n_jobs(extended):
+    """Test single precision and threaded kurtosis estimation."""
+    rng = np.random.RandomState(0)
+    n_samples = 2000
+    t = np.linspace(0, 100, n_samples)
+    s = np.c_[np.sin(t), stats.t.rvs(3, size=n_samples, random_state=rng)].T
+    center_and_norm(s)
+    m = np.dot(rng.randn(2, 2), s)
+    center_and_norm(m)
+    X = _get_pca(rng).fit_transform(m.T)
+    kwargs = dict(extended=extended, random_state=0, max_iter=50)
+    w64 = infomax(X, **kwargs)
+    w32 = infomax(X, dtype="float32", **kwargs)
+    assert w64.dtype == np.float64
+    assert w32.dtype == np.float32
+    assert_allclose(w32, w64, atol=5e-2)
+    w_par = infomax(X, n_jobs=2, **kwargs)
+    assert_allclose(w_par, w64, rtol=1e-5)
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        infomax(X, dtype="float16")
+
+
 def _get_pca(rng=None):
     from sklearn.decomposition import PCA
 
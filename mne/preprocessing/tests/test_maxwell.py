@@ -49,6 +49,7 @@ from mne.preprocessing.maxwell import (
     _prep_mf_coils,
 )
 from mne.rank import _get_rank_sss, _compute_rank_int, compute_rank
+from mne.transforms import rot_to_quat
 from mne.utils import (
     assert_meg_snr,
     catch_logging,
@@ -640,6 +641,159 @@ def test_maxwell_filter_additional(tmp_path):
     assert cov_sss_rank == _get_n_moments(int_order)
 
 
+def test_maxwell_filter_out_fname(tmp_path):
+    """Test Maxwell filtering window by window to disk."""
+    raw = read_raw_fif(io_dir / "kit" / "tests" / "data" / "test_bin_raw.fif")
+    raw.set_annotations(mne.Annotations([0.7], [0.3], "bad_segment"))
+    # movement compensation adds cHPI channels to the output
+    trans = raw.info["dev_head_t"]["trans"]
+    quat = rot_to_quat(trans[:3, :3])
+    t0 = raw.first_samp / raw.info["sfreq"]
+    head_pos = np.array(
+        [
+            [t0, *quat, *trans[:3, 3], 1.0, 0.0, 0.0],
+            [t0 + 1.2, *quat, *(trans[:3, 3] + [0, 0, 0.002]), 1.0, 0.0, 0.0],
+        ]
+    )
+    kwargs = dict(
+        origin=(0.0, 0.0, 0.04),
+        ignore_ref=True,
+        int_order=6,
+        ext_order=2,
+        st_duration=0.5,
+        head_pos=head_pos,
+        skip_by_annotation="bad_segment",
+    )
+    raw_sss = maxwell_filter(raw, **kwargs)
+    out_fname = tmp_path / "test_raw_sss.fif"
+    raw_sss_stream = maxwell_filter(raw, out_fname=out_fname, **kwargs)
+    assert not raw.preload and not raw_sss_stream.preload
+    assert raw_sss_stream.ch_names == raw_sss.ch_names
+    assert raw_sss_stream.ch_names[-1] == "CHPI009"
+    # some numerical imprecision since the data are saved as single
+    assert_allclose(
+        raw_sss_stream.get_data(), raw_sss.get_data(), rtol=1e-6, atol=1e-20
+    )
+    max_info = raw_sss_stream.info["proc_history"][0]["max_info"]
+    assert max_info["max_st"]["buflen"] == 0.5
+    assert_array_equal(
+        max_info["sss_info"]["components"],
+        raw_sss.info["proc_history"][0]["max_info"]["sss_info"]["components"],
+    )
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        maxwell_filter(raw, out_fname=out_fname, **kwargs)
+
+
+def test_maxwell_filter_n_jobs():
+    """Test Maxwell filtering windows in parallel."""
+    pytest.importorskip("joblib")
+    raw = read_raw_fif(io_dir / "kit" / "tests" / "data" / "test_bin_raw.fif")
+    raw.load_data()
+    raw.set_annotations(mne.Annotations([0.7], [0.3], "bad_segment"))
+    trans = raw.info["dev_head_t"]["trans"]
+    quat = rot_to_quat(trans[:3, :3])
+    t0 = raw.first_samp / raw.info["sfreq"]
+    head_pos = np.array(
+        [
+            [t0, *quat, *trans[:3, 3], 1.0, 0.0, 0.0],
+            [t0 + 0.6, *quat, *(trans[:3, 3] + [0, 0, 0.002]), 1.0, 0.0, 0.0],
+        ]
+    )
+    kwargs = dict(
+        origin=(0.0, 0.0, 0.04),
+        ignore_ref=True,
+        int_order=6,
+        ext_order=2,
+        st_duration=0.3,
+        head_pos=head_pos,
+        skip_by_annotation="bad_segment",
+    )
+    raw_sss = maxwell_filter(raw, **kwargs)
+    with catch_logging() as log:
+        raw_sss_par = maxwell_filter(raw, n_jobs=2, verbose=True, **kwargs)
+    assert "using 2 jobs" in log.getvalue()
+    assert_allclose(raw_sss_par.get_data(), raw_sss.get_data(), rtol=1e-7, atol=0)
+
+
+def test_st_only_head_pos_windows(monkeypatch):
+    """Test that tSSS-only windows all start from the initial head position."""
+    raw = read_raw_fif(io_dir / "kit" / "tests" / "data" / "test_bin_raw.fif")
+    raw.load_data()
+    trans = raw.info["dev_head_t"]["trans"]
+    quat = rot_to_quat(trans[:3, :3])
+    t0 = raw.first_samp / raw.info["sfreq"]
+    head_pos = np.array(
+        [
+            [t0, *quat, *trans[:3, 3], 1.0, 0.0, 0.0],
+            [t0 + 0.4, *quat, *(trans[:3, 3] + [0, 0, 0.002]), 1.0, 0.0, 0.0],
+        ]
+    )
+    first_quats = list()
+    orig_trans_starts_stops_quats = mne.preprocessing.maxwell._trans_starts_stops_quats
+
+    def _record_quat(pos, start, stop, this_pos_data):
+        first_quats.append(this_pos_data)
+        return orig_trans_starts_stops_quats(pos, start, stop, this_pos_data)
+
+    monkeypatch.setattr(
+        "mne.preprocessing.maxwell._trans_starts_stops_quats", _record_quat
+    )
+    maxwell_filter(
+        raw,
+        origin=(0.0, 0.0, 0.04),
+        ignore_ref=True,
+        int_order=6,
+        ext_order=2,
+        st_duration=0.3,
+        st_only=True,
+        head_pos=head_pos,
+    )
+    assert len(first_quats) > 2
+    for this_quat in first_quats[1:]:
+        assert_allclose(this_quat, first_quats[0])
+
+
+def test_head_pos_tol():
+    """Test reusing SSS decompositions of nearly identical head positions."""
+    raw = read_raw_fif(io_dir / "kit" / "tests" / "data" / "test_bin_raw.fif")
+    raw.load_data()
+    trans = raw.info["dev_head_t"]["trans"]
+    quat = rot_to_quat(trans[:3, :3])
+    t0 = raw.first_samp / raw.info["sfreq"]
+    rng = np.random.RandomState(0)
+    head_pos = np.array(
+        [
+            [t0 + 0.1 * ii, *(quat + rng.randn(3) * 1e-5)]
+            + [*(trans[:3, 3] + rng.randn(3) * 5e-5), 1.0, 0.0, 0.0]
+            for ii in range(20)
+        ]
+    )
+    kwargs = dict(
+        origin=(0.0, 0.0, 0.04),
+        ignore_ref=True,
+        int_order=6,
+        ext_order=2,
+        head_pos=head_pos,
+        verbose=True,
+    )
+    with catch_logging() as log:
+        raw_sss = maxwell_filter(raw, **kwargs)
+    assert "Reused the SSS decomposition for 0/20 head positions" in log.getvalue()
+    with catch_logging() as log:
+        raw_sss_tol = maxwell_filter(raw, head_pos_tol=(0.0005, 0.1), **kwargs)
+    assert "for 18/20 head positions (90.0%)" in log.getvalue()
+    # equivalent to using positions rounded to the grid
+    steps = np.r_[[np.deg2rad(0.1) / 2] * 3, [0.0005] * 3]
+    head_pos[:, 1:7] = np.round(head_pos[:, 1:7] / steps) * steps
+    raw_sss_round = maxwell_filter(raw, **kwargs)
+    # (the cHPI channels store the original head positions)
+    assert_allclose(raw_sss_tol.get_data("meg"), raw_sss_round.get_data("meg"))
+    diff = raw_sss_tol.get_data("meg") - raw_sss.get_data("meg")
+    assert np.linalg.norm(diff) > 1e-3 * np.linalg.norm(raw_sss.get_data("meg"))
+    with pytest.raises(ValueError, match="two positive values"):
+        maxwell_filter(raw, head_pos_tol=(0.001, 0), **kwargs)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_bads_reconstruction():
@@ -1753,6 +1907,23 @@ def test_find_bads_maxwell_flat():
     assert noisy == want_noisy
 
 
+def test_find_bads_maxwell_downdate_n_jobs(monkeypatch):
+    """Test find_bads_maxwell downdating and running in parallel."""
+    pytest.importorskip("joblib")
+    raw = read_raw_fif(raw_small_fname).crop(0, 15).load_data()
+    kwargs = dict(min_count=1, regularize=None, return_scores=True, h_freq=None)
+    noisy, flat, scores = find_bad_channels_maxwell(raw, **kwargs)
+    noisy_par, flat_par, scores_par = find_bad_channels_maxwell(raw, n_jobs=2, **kwargs)
+    assert noisy_par == noisy
+    assert flat_par == flat
+    assert_allclose(scores_par["scores_noisy"], scores["scores_noisy"])
+    # always recompute the pseudoinverse instead of downdating
+    monkeypatch.setattr("mne.preprocessing.maxwell._MAX_LEVERAGE", 0.0)
+    noisy_full, _, scores_full = find_bad_channels_maxwell(raw, **kwargs)
+    assert noisy_full == noisy
+    assert_allclose(scores_full["scores_noisy"], scores["scores_noisy"], rtol=1e-6)
+
+
 @pytest.mark.parametrize(
     "regularize, n, int_order",
     [
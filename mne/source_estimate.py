@@ -3360,7 +3360,7 @@ def _prepare_label_extraction(stc, labels, src, mode, allow_empty, use_sparse):
             #
             # So if we override vertno with the stc vertices, it will pick
             # the correct normals.
-            with _temporary_vertices(src, stc.vertices):
+            with _temporary_vertices(src, vertno):
                 this_flip = label_sign_flip(label, src[:2])[:, None]
 
         label_vertidx.append(this_vertidx)
@@ -3597,6 +3597,54 @@ def _gen_extract_label_time_course(
         yield label_tc
 
 
+def _label_time_course_operator(labels, src, mode, allow_empty, mri_resolution):
+    """Get the linear operator that extracts label time courses from sources.
+
+    The returned array of shape (n_labels, n_sources) applies the "mean" or
+    "mean_flip" mode of extract_label_time_course to sources ordered like the
+    vertices of ``src``.
+    """
+    _validate_type(src, SourceSpaces, "src")
+    kind = src.kind
+    allowed = ("mean", "auto") if kind == "volume" else ("mean", "mean_flip", "auto")
+    _check_option("mode", mode, allowed, "when extracting labels with a kernel")
+    if mode == "auto":
+        mode = "mean" if kind == "volume" else "mean_flip"
+    if kind in ("surface", "mixed"):
+        if not isinstance(labels, list):
+            labels = [labels]
+        use_sparse = False
+    else:
+        labels = _volume_labels(src, labels, mri_resolution)
+        use_sparse = bool(mri_resolution)
+    label_vertidx, label_flip = _prepare_label_extraction(
+        None, labels, src, mode, allow_empty, use_sparse
+    )
+    nvert = np.array([len(s["vertno"]) for s in src])
+    n_mean = len(src[2:]) if kind == "mixed" else 0
+    logger.info(
+        "Extracting time courses for %d labels (mode: %s)"
+        % (len(labels) + n_mean, mode)
+    )
+    operator = np.zeros((len(labels) + n_mean, nvert.sum()))
+    for i, (vertidx, flip) in enumerate(zip(label_vertidx, label_flip)):
+        if vertidx is None:
+            continue
+        if isinstance(vertidx, sparse.csr_matrix):
+            operator[i] = np.asarray(vertidx.mean(axis=0)).ravel()
+        else:
+            operator[i, vertidx] = 1.0 if flip is None else flip[:, 0]
+            operator[i] /= len(vertidx)
+
+    # time series for the vol src spaces of mixed source spaces (only mean)
+    offset = nvert[:2].sum()
+    for i, nv in enumerate(nvert[2:] if n_mean else []):
+        if nv != 0:
+            operator[len(labels) + i, offset : offset + nv] = 1.0 / nv
+            offset += nv
+    return operator
+
+
 @verbose
 def extract_label_time_course(
     stcs,
@@ -642,37 +642,52 @@ def _setup_adjacency(adjacency, n_tests, n_times):
     return adjacency
 
 
-def _do_permutations(
-    X_full,
-    slices,
-    threshold,
-    tail,
-    adjacency,
-    stat_fun,
-    max_step,
-    include,
-    partitions,
-    t_power,
-    orders,
-    sample_shape,
-    buffer_size,
-    progress_bar,
-):
+_MAX_BLOCK_BYTES = 2**24  # how much memory batched permutation stats can use
+
+
+def _perm_block_size(n_vars, n_groups=1):
+    """Get how many permutations to compute the stats of at once."""
+    return max(_MAX_BLOCK_BYTES // (8 * n_vars * n_groups), 1)
+
+
+def _perm_stats(X_full, slices, stat_fun, orders, buffer_size):
+    """Yield the statistic for each permutation of the samples."""
     n_samp, n_vars = X_full.shape
+    if stat_fun is f_oneway:
+        # the group sums of a block of permutations are a single matrix
+        # product, everything else does not depend on the permutation
+        n_groups = len(slices)
+        labels = np.empty(n_samp, int)
+        n_per_group = np.empty(n_groups)
+        for gi, sl in enumerate(slices):
+            labels[sl] = gi
+            n_per_group[gi] = len(labels[sl])
+        sums = np.sum(X_full, axis=0)
+        sstot = np.sum(X_full**2, axis=0) - sums**2 / n_samp
+        dfbn, dfwn = n_groups - 1, n_samp - n_groups
+        n_block = _perm_block_size(n_vars, n_groups)
+        for start in range(0, len(orders), n_block):
+            block = np.array(orders[start : start + n_block])
+            weights = np.zeros((len(block), n_groups, n_samp))
+            weights[np.arange(len(block))[:, np.newaxis], labels, block] = 1.0
+            group_sums = (weights.reshape(-1, n_samp) @ X_full).reshape(
+                len(block), n_groups, n_vars
+            )
+            ssbn = np.sum(group_sums**2 / n_per_group[:, np.newaxis], axis=1)
+            ssbn -= sums**2 / n_samp
+            yield from (ssbn / dfbn) / ((sstot - ssbn) / dfwn)
+        return
 
     if buffer_size is not None and n_vars <= buffer_size:
         buffer_size = None  # don't use buffer for few variables
 
-    # allocate space for output
-    max_cluster_sums = np.empty(len(orders), dtype=np.double)
-
     if buffer_size is not None:
         # allocate buffer, so we don't need to allocate memory during loop
         X_buffer = [
             np.empty((len(X_full[s]), buffer_size), dtype=X_full.dtype) for s in slices
         ]
 
-    for seed_idx, order in enumerate(orders):
+    for order in orders:
         # shuffle sample indices
         assert order is not None
         idx_shuffle_list = [order[s] for s in slices]
@@ -696,7 +711,91 @@ def _do_permutations(
                 # apply stat_fun and store result
                 tmp = stat_fun(*X_buffer)
                 t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
+        yield t_obs_surr
+
+
+def _1samp_perm_stats(X, stat_fun, orders, buffer_size):
+    """Yield the statistic for each sign flip of the samples."""
+    n_samp, n_vars = X.shape
+    if stat_fun is ttest_1samp_no_p:
+        # flip the signs of a block of permutations at once (the variance is
+        # computed from the centered flipped data to remain accurate for data
+        # with a large offset)
+        n_block = _perm_block_size(n_vars, n_samp)
+        for start in range(0, len(orders), n_block):
+            signs = 2 * np.array(orders[start : start + n_block], int) - 1
+            assert signs.shape[1] == n_samp  # should be guaranteed by parent
+            if not np.all(np.equal(np.abs(signs), 1)):
+                raise ValueError("signs from rng must be +/- 1")
+            X_flip = signs[:, :, np.newaxis] * X
+            mean = np.mean(X_flip, axis=1)
+            var = np.var(X_flip, axis=1, ddof=1)
+            yield from mean / np.sqrt(var / n_samp)
+        return
+
+    if buffer_size is not None and n_vars <= buffer_size:
+        buffer_size = None  # don't use buffer for few variables
+
+    if buffer_size is not None:
+        # allocate a buffer so we don't need to allocate memory in loop
+        X_flip_buffer = np.empty((n_samp, buffer_size), dtype=X.dtype)
+
+    for order in orders:
+        assert isinstance(order, np.ndarray)
+        # new surrogate data with specified sign flip
+        assert order.size == n_samp  # should be guaranteed by parent
+        signs = 2 * order[:, None].astype(int) - 1
+        if not np.all(np.equal(np.abs(signs), 1)):
+            raise ValueError("signs from rng must be +/- 1")
+
+        if buffer_size is None:
+            # be careful about non-writable memmap (GH#1507)
+            if X.flags.writeable:
+                X *= signs
+                # Recompute statistic on randomized data
+                t_obs_surr = stat_fun(X)
+                # Set X back to previous state (trade memory eff. for CPU use)
+                X *= signs
+            else:
+                t_obs_surr = stat_fun(X * signs)
+        else:
+            # only sign-flip a small data buffer, so we need less memory
+            t_obs_surr = np.empty(n_vars, dtype=X.dtype)
+
+            for pos in range(0, n_vars, buffer_size):
+                # number of variables for this loop
+                n_var_loop = min(pos + buffer_size, n_vars) - pos
+
+                X_flip_buffer[:, :n_var_loop] = signs * X[:, pos : pos + n_var_loop]
+
+                # apply stat_fun and store result
+                tmp = stat_fun(X_flip_buffer)
+                t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
+        yield t_obs_surr
+
 
+def _do_permutations(
+    X_full,
+    slices,
+    threshold,
+    tail,
+    adjacency,
+    stat_fun,
+    max_step,
+    include,
+    partitions,
+    t_power,
+    orders,
+    sample_shape,
+    buffer_size,
+    progress_bar,
+):
+    # allocate space for output
+    max_cluster_sums = np.empty(len(orders), dtype=np.double)
+
+    for seed_idx, t_obs_surr in enumerate(
+        _perm_stats(X_full, slices, stat_fun, orders, buffer_size)
+    ):
         # The stat should have the same shape as the samples for no adj.
         if adjacency is None:
             t_obs_surr.shape = sample_shape
@@ -740,51 +839,14 @@ def _do_1samp_permutations(
     buffer_size,
     progress_bar,
 ):
-    n_samp, n_vars = X.shape
     assert slices is None  # should be None for the 1 sample case
 
-    if buffer_size is not None and n_vars <= buffer_size:
-        buffer_size = None  # don't use buffer for few variables
-
     # allocate space for output
     max_cluster_sums = np.empty(len(orders), dtype=np.double)
 
-    if buffer_size is not None:
-        # allocate a buffer so we don't need to allocate memory in loop
-        X_flip_buffer = np.empty((n_samp, buffer_size), dtype=X.dtype)
-
-    for seed_idx, order in enumerate(orders):
-        assert isinstance(order, np.ndarray)
-        # new surrogate data with specified sign flip
-        assert order.size == n_samp  # should be guaranteed by parent
-        signs = 2 * order[:, None].astype(int) - 1
-        if not np.all(np.equal(np.abs(signs), 1)):
-            raise ValueError("signs from rng must be +/- 1")
-
-        if buffer_size is None:
-            # be careful about non-writable memmap (GH#1507)
-            if X.flags.writeable:
-                X *= signs
-                # Recompute statistic on randomized data
-                t_obs_surr = stat_fun(X)
-                # Set X back to previous state (trade memory eff. for CPU use)
-                X *= signs
-            else:
-                t_obs_surr = stat_fun(X * signs)
-        else:
-            # only sign-flip a small data buffer, so we need less memory
-            t_obs_surr = np.empty(n_vars, dtype=X.dtype)
-
-            for pos in range(0, n_vars, buffer_size):
-                # number of variables for this loop
-                n_var_loop = min(pos + buffer_size, n_vars) - pos
-
-                X_flip_buffer[:, :n_var_loop] = signs * X[:, pos : pos + n_var_loop]
-
-                # apply stat_fun and store result
-                tmp = stat_fun(X_flip_buffer)
-                t_obs_surr[pos : pos + n_var_loop] = tmp[:n_var_loop]
-
+    for seed_idx, t_obs_surr in enumerate(
+        _1samp_perm_stats(X, stat_fun, orders, buffer_size)
+    ):
         # The stat should have the same shape as the samples for no adj.
         if adjacency is None:
             t_obs_surr.shape = sample_shape
@@ -792,6 +792,39 @@ def test_permutation_test_H0(numba_conditional):
         assert_equal(len(h0), 2 ** (7 - (tail == 0)))  # exact test
 
 
+@pytest.mark.parametrize("kind", ("1samp", "ind"))
+def test_permutation_batched_stats(kind, monkeypatch):
+    """Test that default stats for blocks of permutations match the loop."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(25, 40, 3) + 0.3
+    # a tiny block size makes the last block partial
+    if kind == "1samp":
+        fun, X = spatio_temporal_cluster_1samp_test, X
+        stat_fun = ttest_1samp_no_p
+        block_bytes = 8 * 120 * 25 * 7
+    else:
+        fun, X = spatio_temporal_cluster_test, [X[:10], X[10:18] - 0.3, X[18:]]
+        stat_fun = f_oneway
+        block_bytes = 8 * 120 * 7
+    kwargs = dict(threshold=1.0, n_permutations=100, seed=0, buffer_size=None)
+    monkeypatch.setattr("mne.stats.cluster_level._MAX_BLOCK_BYTES", block_bytes)
+    t, clusters, p, H0 = fun(X, **kwargs)
+    t_loop, _, p_loop, H0_loop = fun(
+        X, stat_fun=lambda *args: stat_fun(*args), **kwargs
+    )
+    assert_allclose(t, t_loop)
+    assert_allclose(H0, H0_loop)
+    assert_allclose(p, p_loop)
+    assert len(clusters) > 0
+    if kind == "1samp":
+        # a large offset does not make the variance inaccurate
+        X = 1e3 + 1e-4 * rng.randn(25, 40, 3)
+        t, _, _, H0 = fun(X, **kwargs)
+        t_loop, _, _, H0_loop = fun(X, stat_fun=lambda *args: stat_fun(*args), **kwargs)
+        assert_allclose(t, t_loop)
+        assert_allclose(H0, H0_loop)
+
+
 def test_tfce_thresholds(numba_conditional):
     """Test TFCE thresholds."""
     rng = np.random.RandomState(0)
@@ -762,6 +762,84 @@ def test_own_data():
     assert 1 < len(epochs) < n_now
 
 
+def test_epoch_cache(tmp_path, monkeypatch):
+    """Test reusing processed epochs of Epochs that are not preloaded."""
+    rng = np.random.RandomState(0)
+    info = create_info(["EEG 001", "EEG 002", "EEG 003", "EOG"], 100.0, "eeg")
+    with info._unlock():
+        info["chs"][3]["kind"] = FIFF.FIFFV_EOG_CH
+        info["lowpass"] = 10.0
+    fname = tmp_path / "test_raw.fif"
+    RawArray(rng.randn(4, 3000) * 1e-5, info).save(fname)
+    raw = read_raw_fif(fname).set_eeg_reference(projection=True)
+    events = make_fixed_length_events(raw, duration=1.0)
+    kwargs = dict(
+        tmin=-0.2, tmax=0.5, proj="delayed", decim=2, reject_by_annotation=True
+    )
+    epochs = Epochs(raw, events, **kwargs)
+    assert epochs._epoch_cache.nbytes == 0
+    n_read = [0]
+    orig_get_epoch_from_raw = Epochs._get_epoch_from_raw
+
+    def _get_epoch_from_raw(self, idx, verbose=None):
+        n_read[0] += 1
+        return orig_get_epoch_from_raw(self, idx, verbose=verbose)
+
+    monkeypatch.setattr(Epochs, "_get_epoch_from_raw", _get_epoch_from_raw)
+    data = epochs.get_data()
+    n_first = n_read[0]
+    assert n_first >= len(epochs)
+    assert epochs._epoch_cache.nbytes > 0
+    assert_array_equal(epochs.get_data(), data)
+    assert_array_equal(np.array(list(epochs)), data)
+    evoked = epochs.average()
+    assert n_read[0] == n_first  # all from the cache
+    # modifying the iterated data must not affect the cache
+    for epoch in epochs:
+        epoch[:] = 0
+    assert_array_equal(epochs.get_data(), data)
+    # projected epochs are cached as well
+    epochs_proj = epochs.copy().apply_proj()
+    assert epochs_proj._epoch_cache is epochs._epoch_cache
+    data_proj = epochs_proj.get_data()
+    assert n_read[0] == n_first
+    assert_allclose(data_proj[:, :3].mean(axis=1), 0, atol=1e-20)
+    # changing the processing invalidates the entries
+    epochs.apply_baseline((None, None))
+    data_bl = epochs.get_data()
+    assert n_read[0] == n_first + len(epochs)
+    assert not np.allclose(data_bl, data)
+    # preloading neither fills nor keeps the cache
+    epochs_proj.load_data()
+    assert epochs_proj._epoch_cache.nbytes == 0
+    assert epochs._epoch_cache.nbytes > 0
+    epochs_pre = Epochs(raw, events, preload=True, **kwargs)
+    assert epochs_pre._epoch_cache.nbytes == 0
+    assert_array_equal(epochs_pre.get_data(), data)
+    # disabled or too small a cache gives the same results
+    monkeypatch.setenv("MNE_EPOCHS_CACHE_SIZE", "0")
+    epochs = Epochs(raw, events, **kwargs)
+    assert_array_equal(epochs.get_data(), data)
+    assert_array_equal(epochs.average().data, evoked.data)
+    assert epochs._epoch_cache.nbytes == 0
+    monkeypatch.setenv("MNE_EPOCHS_CACHE_SIZE", "3kB")
+    n_size = [0]
+    orig_get_epochs_cache_size = mne.epochs._get_epochs_cache_size
+
+    def _get_epochs_cache_size():
+        n_size[0] += 1
+        return orig_get_epochs_cache_size()
+
+    monkeypatch.setattr(mne.epochs, "_get_epochs_cache_size", _get_epochs_cache_size)
+    epochs = Epochs(raw, events, **kwargs)
+    assert_array_equal(epochs.get_data(), data)
+    assert n_size[0] == 1  # once per pass, not once per epoch
+    assert 0 < epochs._epoch_cache.nbytes <= 3 * 1024
+    monkeypatch.setenv("MNE_EPOCHS_CACHE_SIZE", "foo")
+    with pytest.raises(ValueError, match="MNE_EPOCHS_CACHE_SIZE must be"):
+        Epochs(raw, events, **kwargs).get_data()
+
+
 def test_decim():
     """Test epochs decimation."""
     # First with EpochsArray
@@ -3155,6 +3233,55 @@ def test_drop_epochs():
     assert_array_equal(events[epochs["1"].selection], events1[[0, 1, 3, 5, 6]])
 
 
+@pytest.mark.parametrize("proj", (True, "delayed"))
+def test_drop_bad_batch(proj, monkeypatch):
+    """Test that rejecting preloaded epochs all at once matches one by one."""
+    rng = np.random.RandomState(0)
+    ch_types = ["eeg"] * 4 + ["eog", "misc"]
+    ch_names = ["EEG 001", "EEG 002", "EEG 003", "EEG 004", "EOG", "MISC"]
+    info = create_info(ch_names, 100.0, ch_types)
+    data = rng.randn(6, 20000) * 1e-5
+    data[:4, 3000:3300] = 0  # flat
+    data[4, 5000] = 1e-3  # EOG artifact
+    data[1, 8000] = 5e-4  # EEG artifact
+    raw = RawArray(data, info)
+    raw.info["bads"] = ["EEG 003"]
+    raw.set_eeg_reference(projection=True)
+    raw.set_annotations(Annotations([150.0], [1.0], "bad"))
+    events = make_fixed_length_events(raw, duration=0.5)
+    kwargs = dict(
+        tmin=-0.1,
+        tmax=0.4,
+        reject=dict(eeg=2e-4, eog=5e-4),
+        flat=dict(eeg=1e-7),
+        reject_tmin=0.0,
+        proj=proj,
+        baseline=None,
+    )
+    epochs = Epochs(raw, events, preload=False, **kwargs)
+    epochs.drop_bad()
+    monkeypatch.setattr("mne.epochs._MAX_BLOCK_BYTES", 1000)
+    with catch_logging() as log:
+        epochs_pre = Epochs(raw, events, preload=True, verbose=True, **kwargs)
+    log = log.getvalue()
+    assert epochs_pre.drop_log == epochs.drop_log
+    assert_array_equal(epochs_pre.selection, epochs.selection)
+    assert_array_equal(epochs_pre.get_data(), epochs.get_data())
+    assert ("bad",) in epochs.drop_log
+    bad_tuples = [d for d in epochs.drop_log if len(d) and d[0] in ch_names]
+    assert len(bad_tuples) >= 3
+    assert "EEG 003" not in sum(bad_tuples, ())
+    assert log.count("Rejecting") == len(bad_tuples)
+    assert "Rejecting flat epoch based on EEG" in log
+    # dropping again with new criteria
+    n_good = len(epochs_pre)
+    epochs_pre.drop_bad(reject=dict(eeg=5e-5))
+    epochs.drop_bad(reject=dict(eeg=5e-5))
+    assert len(epochs_pre) < n_good
+    assert epochs_pre.drop_log == epochs.drop_log
+    assert_array_equal(epochs_pre.get_data(), epochs.get_data())
+
+
 @pytest.mark.parametrize("preload", (True, False))
 def test_drop_epochs_mult(preload):
     """Test that subselecting epochs or making fewer epochs is similar."""
@@ -4080,6 +4207,32 @@ def test_save_complex_data(tmp_path, preload, is_complex, fmt, rtol):
     assert_allclose(data_read, data, rtol=rtol)
 
 
+@pytest.mark.parametrize("is_complex", (True, False))
+def test_save_read_blocks(tmp_path, monkeypatch, is_complex):
+    """Test writing and reading epochs data in blocks."""
+    rng = np.random.RandomState(0)
+    data = rng.randn(11, 3, 20) * 1e-5
+    if is_complex:
+        data = data + 1j * rng.randn(*data.shape) * 1e-5
+    info = create_info(["EEG 001", "EEG 002", "MISC"], 100.0, ["eeg", "eeg", "misc"])
+    events = np.array([np.arange(11) * 30, np.zeros(11), np.ones(11)], int).T
+    epochs = EpochsArray(data, info, events=events)
+    # only a few epochs per block
+    monkeypatch.setattr("mne.epochs._MAX_IO_BLOCK_BYTES", 3 * 3 * 20 * 16)
+    fname = tmp_path / "test-epo.fif"
+    epochs.save(fname, fmt="double")
+    for preload in (True, False):
+        epochs_read = read_epochs(fname, preload=preload)
+        assert_allclose(epochs_read.get_data(), data, rtol=1e-10)
+        assert_allclose(epochs_read[7].get_data()[0], data[7], rtol=1e-10)
+    # lazy epochs are also written in blocks
+    epochs_read = read_epochs(fname, preload=False)
+    fname_2 = tmp_path / "test_2-epo.fif"
+    epochs_read[::2].save(fname_2)
+    epochs_read = read_epochs(fname_2)
+    assert_allclose(epochs_read.get_data(), data[::2], rtol=1e-6)
+
+
 def test_no_epochs(tmp_path):
     """Test that having the first epoch bad does not break writing."""
     # a regression noticed in #5564
@@ -7,7 +7,7 @@ from numpy.testing import (
     assert_array_less,
 )
 import pytest
-from scipy.signal import resample as sp_resample, butter, freqz, sosfreqz
+from scipy.signal import resample as sp_resample, resample_poly, butter, freqz, sosfreqz
 
 from mne import create_info, Epochs
 from numpy.fft import fft, fftfreq
@@ -408,6 +408,33 @@ def test_resample_scipy():
                 assert_allclose(x_p5, x_p5_sp, atol=1e-12, err_msg=err_msg)
 
 
+@pytest.mark.parametrize("up, down", ((2, 1), (1, 3), (3, 4)))
+def test_resample_polyphase(up, down):
+    """Test polyphase resampling against SciPy."""
+    x = np.random.RandomState(0).randn(2, 3, 301)
+    y = resample(x, up, down, method="polyphase")
+    y_sp = resample_poly(x, up, down, axis=-1, padtype="reflect")
+    assert y.shape == x.shape[:-1] + (int(round(301 * up / down)),)
+    assert_allclose(y, y_sp[..., : y.shape[-1]], atol=1e-12)
+    y_2 = resample(x.swapaxes(0, 2), up, down, axis=0, method="polyphase")
+    assert_allclose(y_2.swapaxes(0, 2), y, atol=1e-12)
+    y_2 = resample(x, up, down, method="polyphase", n_jobs=2)
+    assert_allclose(y_2, y, atol=1e-12)
+    with pytest.raises(ValueError, match="Invalid value for the 'method'"):
+        resample(x, up, down, method="foo")
+
+
+def test_resample_polyphase_ratio():
+    """Test that polyphase resampling rejects impractical ratios."""
+    x = np.random.RandomState(0).randn(2, 1000)
+    # e.g. the sampling rate of the MNE sample data to 100 Hz
+    with pytest.raises(ValueError, match="cannot be expressed as up/down"):
+        resample(x, 100.0, 600.614990234375, method="polyphase")
+    y = resample(x, 100.0, 600.0, method="polyphase")
+    y_sp = resample_poly(x, 1, 6, axis=-1, padtype="reflect")
+    assert_allclose(y, y_sp[..., : y.shape[-1]], atol=1e-12)
+
+
 @pytest.mark.parametrize("n_jobs", (2, "cuda"))
 def test_n_jobs(n_jobs):
     """Test resampling against SciPy."""
@@ -420,6 +447,30 @@ def test_n_jobs(n_jobs):
     assert_allclose(y1, y2)
 
 
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+def test_fft_threads(phase, monkeypatch):
+    """Test batched multichannel FIR filtering."""
+    x = np.random.RandomState(0).randn(3, 7, 1000)
+    picks = [0, 2, 5]
+    kwargs = dict(sfreq=100.0, l_freq=1.0, h_freq=40.0, picks=picks, phase=phase)
+    y1 = filter_data(x, **kwargs)
+    y2 = filter_data(x, n_jobs="fft-threads", **kwargs)
+    assert_allclose(y1, y2, atol=1e-12)
+    assert_array_equal(y2[:, [1, 3, 4, 6]], x[:, [1, 3, 4, 6]])
+    # multiple blocks of signals
+    monkeypatch.setattr("mne.filter._MAX_BLOCK_BYTES", 1)
+    y3 = filter_data(x, n_jobs="fft-threads", **kwargs)
+    assert_allclose(y1, y3, atol=1e-12)
+    y1 = notch_filter(x[0], 100.0, 20.0, method="fir")
+    y2 = notch_filter(x[0], 100.0, 20.0, method="fir", n_jobs="fft-threads")
+    assert_allclose(y1, y2, atol=1e-12)
+    # only for FIR filtering
+    with pytest.raises(ValueError, match="can only be used with method="):
+        filter_data(x, n_jobs="fft-threads", method="iir", **kwargs)
+    with pytest.raises(ValueError, match="can only be used with method="):
+        notch_filter(x[0], 100.0, 20.0, method="spectrum_fit", n_jobs="fft-threads")
+
+
 def test_resamp_stim_channel():
     """Test resampling of stim channels."""
     # Downsampling
@@ -17,6 +17,7 @@ __getattr__, __dir__, __all__ = lazy.attach(
         ],
         "ar": ["fit_iir_model_raw"],
         "csd": [
+            "CSDAccumulator",
             "CrossSpectralDensity",
             "csd_array_fourier",
             "csd_array_morlet",
@@ -17,8 +17,10 @@ from ..utils import (
     verbose,
     warn,
     copy_function_doc_to_method_doc,
+    fill_doc,
     ProgressBar,
     _check_fname,
+    _check_option,
     _import_h5io_funcs,
     _validate_type,
 )
@@ -63,14 +65,16 @@ def pick_channels_csd(
         csd = csd.copy()
 
     sel = pick_channels(csd.ch_names, include=include, exclude=exclude, ordered=ordered)
-    data = []
-    for vec in csd._data.T:
-        mat = _vector_to_sym_mat(vec)
-        mat = mat[sel, :][:, sel]
-        data.append(_sym_mat_to_vector(mat))
+    # Read the upper triangle of the picked matrices directly from the vectors
+    idx, conj = _triu_index(csd.n_channels, sel)
+    triu = np.triu_indices(len(sel))
+    data = csd._data[idx[triu]]
+    if np.iscomplexobj(data):
+        conj = conj[triu]
+        data[conj] = data[conj].conj()
     ch_names = [csd.ch_names[i] for i in sel]
 
-    csd._data = np.array(data).T
+    csd._data = data
     csd.ch_names = ch_names
     return csd
 
@@ -629,6 +633,65 @@ def _sym_mat_to_vector(mat):
     return mat[np.triu_indices_from(mat)]
 
 
+def _triu_index(dim, picks=None):
+    """Find where the elements of a symmetric matrix are stored in a vector.
+
+    Parameters
+    ----------
+    dim : int
+        The dimensions of the symmetric matrix.
+    picks : array of int | None
+        The rows and columns of the matrix to consider. If None, all of them.
+
+    Returns
+    -------
+    idx : ndarray of int, shape (n_picks, n_picks)
+        For each element of the (picked) matrix, the index of the vector
+        element that holds its value.
+    conj : ndarray of bool, shape (n_picks, n_picks)
+        Whether the element lies in the lower triangle of the matrix, i.e.,
+        is the complex conjugate of the vector element.
+
+    See Also
+    --------
+    _vector_to_sym_mat
+    """
+    idx = np.empty((dim, dim), dtype=np.intp)
+    rows, cols = np.triu_indices(dim)
+    idx[rows, cols] = idx[cols, rows] = np.arange(len(rows))
+    picks = np.arange(dim) if picks is None else np.asarray(picks, dtype=np.intp)
+    return idx[np.ix_(picks, picks)], picks[:, np.newaxis] > picks[np.newaxis]
+
+
+def _vectors_to_sym_mats(vecs, picks=None):
+    """Convert the columns of an array to a stack of symmetric matrices.
+
+    This is a vectorized version of :func:`_vector_to_sym_mat`, that expands
+    all vectors at once and can directly select (and reorder) channels.
+
+    Parameters
+    ----------
+    vecs : 2d-array, shape (n_triu, n_vectors)
+        The vectors to convert to symmetric matrices.
+    picks : array of int | None
+        The rows and columns of the matrices to keep. If None, all of them.
+
+    Returns
+    -------
+    mats : 3d-array, shape (n_vectors, n_picks, n_picks)
+        The symmetric matrices.
+
+    See Also
+    --------
+    _vector_to_sym_mat
+    """
+    idx, conj = _triu_index(_n_dims_from_triu(len(vecs)), picks)
+    mats = vecs.T[:, idx]
+    if np.iscomplexobj(mats):
+        mats[:, conj] = mats[:, conj].conj()
+    return mats
+
+
 def read_csd(fname):
     """Read a CrossSpectralDensity object from an HDF5 file.
 
@@ -674,6 +737,7 @@ def csd_fourier(
     projs=None,
     n_jobs=None,
     *,
+    dtype="complex128",
     verbose=None,
 ):
     """Estimate cross-spectral density from an array using short-time fourier.
@@ -700,6 +764,7 @@ def csd_fourier(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means the projectors defined in the Epochs object will be copied.
     %(n_jobs)s
+    %(dtype_csd)s
     %(verbose)s
 
     Returns
@@ -716,9 +781,10 @@ def csd_fourier(
     csd_multitaper
     """
     epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
-    return csd_array_fourier(
-        epochs.get_data(),
-        sfreq=epochs.info["sfreq"],
+    accumulator = CSDAccumulator(
+        epochs.info["sfreq"],
+        len(epochs.times),
+        "fourier",
         t0=epochs.tmin,
         fmin=fmin,
         fmax=fmax,
@@ -727,9 +793,10 @@ def csd_fourier(
         ch_names=epochs.ch_names,
         n_fft=n_fft,
         projs=projs,
+        dtype=dtype,
         n_jobs=n_jobs,
-        verbose=verbose,
     )
+    return accumulator.add(epochs).get_csd()
 
 
 @verbose
@@ -746,6 +813,7 @@ def csd_array_fourier(
     projs=None,
     n_jobs=None,
     *,
+    dtype="complex128",
     verbose=None,
 ):
     """Estimate cross-spectral density from an array using short-time fourier.
@@ -780,6 +848,7 @@ def csd_array_fourier(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means no projectors are stored.
     %(n_jobs)s
+    %(dtype_csd)s
     %(verbose)s
 
     Returns
@@ -795,44 +864,23 @@ def csd_array_fourier(
     csd_morlet
     csd_multitaper
     """
-    X, times, tmin, tmax, fmin, fmax = _prepare_csd_array(
-        X, sfreq, t0, tmin, tmax, fmin, fmax
-    )
-
-    # Slice X to the requested time window
-    tstart = None if tmin is None else np.searchsorted(times, tmin - 1e-10)
-    tstop = None if tmax is None else np.searchsorted(times, tmax + 1e-10)
-    X = X[:, :, tstart:tstop]
-    times = times[tstart:tstop]
-    n_times = len(times)
-    n_fft = n_times if n_fft is None else n_fft
-
-    # Preparing frequencies of interest
-    # orig_frequencies = fftfreq(n_fft, 1. / sfreq)
-    orig_frequencies = rfftfreq(n_fft, 1.0 / sfreq)
-    freq_mask = (orig_frequencies > fmin) & (orig_frequencies < fmax)
-    frequencies = orig_frequencies[freq_mask]
-
-    if len(frequencies) == 0:
-        raise ValueError(
-            "No discrete fourier transform results within "
-            "the given frequency window. Please widen either "
-            "the frequency window or the time window"
-        )
-
-    # Compute the CSD
-    return _execute_csd_function(
-        X,
-        times,
-        frequencies,
-        _csd_fourier,
-        params=[sfreq, n_times, freq_mask, n_fft],
-        n_fft=n_fft,
+    X = _prepare_csd_array(X)
+    accumulator = CSDAccumulator(
+        sfreq,
+        X.shape[2],
+        "fourier",
+        t0=t0,
+        fmin=fmin,
+        fmax=fmax,
+        tmin=tmin,
+        tmax=tmax,
         ch_names=ch_names,
+        n_fft=n_fft,
         projs=projs,
+        dtype=dtype,
         n_jobs=n_jobs,
-        verbose=verbose,
     )
+    return accumulator.add(X).get_csd()
 
 
 @verbose
@@ -850,6 +898,7 @@ def csd_multitaper(
     projs=None,
     n_jobs=None,
     *,
+    dtype="complex128",
     verbose=None,
 ):
     """Estimate cross-spectral density from epochs using a multitaper method.
@@ -883,6 +932,7 @@ def csd_multitaper(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means the projectors defined in the Epochs object will by copied.
     %(n_jobs)s
+    %(dtype_csd)s
     %(verbose)s
 
     Returns
@@ -899,9 +949,10 @@ def csd_multitaper(
     csd_morlet
     """
     epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
-    return csd_array_multitaper(
-        epochs.get_data(),
-        sfreq=epochs.info["sfreq"],
+    accumulator = CSDAccumulator(
+        epochs.info["sfreq"],
+        len(epochs.times),
+        "multitaper",
         t0=epochs.tmin,
         fmin=fmin,
         fmax=fmax,
@@ -913,9 +964,10 @@ def csd_multitaper(
         adaptive=adaptive,
         low_bias=low_bias,
         projs=projs,
+        dtype=dtype,
         n_jobs=n_jobs,
-        verbose=verbose,
     )
+    return accumulator.add(epochs).get_csd()
 
 
 @verbose
@@ -936,6 +988,7 @@ def csd_array_multitaper(
     n_jobs=None,
     max_iter=250,
     *,
+    dtype="complex128",
     verbose=None,
 ):
     """Estimate cross-spectral density from an array using a multitaper method.
@@ -978,6 +1031,7 @@ def csd_array_multitaper(
         which means no projectors are stored.
     %(n_jobs)s
     %(max_iter_multitaper)s
+    %(dtype_csd)s
     %(verbose)s
 
     Returns
@@ -993,56 +1047,27 @@ def csd_array_multitaper(
     csd_morlet
     csd_multitaper
     """
-    X, times, tmin, tmax, fmin, fmax = _prepare_csd_array(
-        X, sfreq, t0, tmin, tmax, fmin, fmax
-    )
-
-    # Slice X to the requested time window
-    tstart = None if tmin is None else np.searchsorted(times, tmin - 1e-10)
-    tstop = None if tmax is None else np.searchsorted(times, tmax + 1e-10)
-    X = X[:, :, tstart:tstop]
-    times = times[tstart:tstop]
-    n_times = len(times)
-    n_fft = n_times if n_fft is None else n_fft
-
-    window_fun, eigvals, mt_adaptive = _compute_mt_params(
-        n_times, sfreq, bandwidth, low_bias, adaptive
-    )
-
-    # Preparing frequencies of interest
-    orig_frequencies = rfftfreq(n_fft, 1.0 / sfreq)
-    freq_mask = (orig_frequencies > fmin) & (orig_frequencies < fmax)
-    frequencies = orig_frequencies[freq_mask]
-
-    if len(frequencies) == 0:
-        raise ValueError(
-            "No discrete fourier transform results within "
-            "the given frequency window. Please widen either "
-            "the frequency window or the time window"
-        )
-
-    # Compute the CSD
-    return _execute_csd_function(
-        X,
-        times,
-        frequencies,
-        _csd_multitaper,
-        params=[
-            sfreq,
-            n_times,
-            window_fun,
-            eigvals,
-            freq_mask,
-            n_fft,
-            adaptive,
-            max_iter,
-        ],
-        n_fft=n_fft,
+    X = _prepare_csd_array(X)
+    accumulator = CSDAccumulator(
+        sfreq,
+        X.shape[2],
+        "multitaper",
+        t0=t0,
+        fmin=fmin,
+        fmax=fmax,
+        tmin=tmin,
+        tmax=tmax,
         ch_names=ch_names,
+        n_fft=n_fft,
+        bandwidth=bandwidth,
+        adaptive=adaptive,
+        low_bias=low_bias,
+        max_iter=max_iter,
         projs=projs,
+        dtype=dtype,
         n_jobs=n_jobs,
-        verbose=verbose,
     )
+    return accumulator.add(X).get_csd()
 
 
 @verbose
@@ -1058,6 +1083,7 @@ def csd_morlet(
     projs=None,
     n_jobs=None,
     *,
+    dtype="complex128",
     verbose=None,
 ):
     """Estimate cross-spectral density from epochs using Morlet wavelets.
@@ -1092,6 +1118,7 @@ def csd_morlet(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means the projectors defined in the Epochs object will be copied.
     %(n_jobs)s
+    %(dtype_csd)s
     %(verbose)s
 
     Returns
@@ -1108,21 +1135,23 @@ def csd_morlet(
     csd_multitaper
     """
     epochs, projs = _prepare_csd(epochs, tmin, tmax, picks, projs)
-    return csd_array_morlet(
-        epochs.get_data(),
-        sfreq=epochs.info["sfreq"],
-        frequencies=frequencies,
+    accumulator = CSDAccumulator(
+        epochs.info["sfreq"],
+        len(epochs.times),
+        "morlet",
         t0=epochs.tmin,
         tmin=tmin,
         tmax=tmax,
+        frequencies=frequencies,
         ch_names=epochs.ch_names,
         n_cycles=n_cycles,
         use_fft=use_fft,
         decim=decim,
         projs=projs,
+        dtype=dtype,
         n_jobs=n_jobs,
-        verbose=verbose,
     )
+    return accumulator.add(epochs).get_csd()
 
 
 @verbose
@@ -1140,6 +1169,7 @@ def csd_array_morlet(
     projs=None,
     n_jobs=None,
     *,
+    dtype="complex128",
     verbose=None,
 ):
     """Estimate cross-spectral density from an array using Morlet wavelets.
@@ -1182,6 +1212,7 @@ def csd_array_morlet(
         List of projectors to store in the CSD object. Defaults to ``None``,
         which means the projectors defined in the Epochs object will be copied.
     %(n_jobs)s
+    %(dtype_csd)s
     %(verbose)s
 
     Returns
@@ -1197,45 +1228,335 @@ def csd_array_morlet(
     csd_morlet
     csd_multitaper
     """
-    X, times, tmin, tmax, _, _ = _prepare_csd_array(X, sfreq, t0, tmin, tmax)
-    n_times = len(times)
-
-    # Construct the appropriate Morlet wavelets
-    wavelets = morlet(sfreq, frequencies, n_cycles)
-
-    # Slice X to the requested time window + half the length of the longest
-    # wavelet.
-    wave_length = len(wavelets[np.argmin(frequencies)]) // 2
-    tstart = tstop = None
-    if tmin is not None:
-        tstart = np.searchsorted(times, tmin)
-        tstart = max(0, tstart - wave_length)
-    if tmax is not None:
-        tstop = np.searchsorted(times, tmax)
-        tstop = min(n_times, tstop + wave_length)
-    X = X[:, :, tstart:tstop]
-    times = times[tstart:tstop]
-
-    # After CSD computation, we slice again to the requested time window.
-    csd_tstart = None if tmin is None else np.searchsorted(times, tmin - 1e-10)
-    csd_tstop = None if tmax is None else np.searchsorted(times, tmax + 1e-10)
-    csd_tslice = slice(csd_tstart, csd_tstop)
-    times = times[csd_tslice]
-
-    # Compute the CSD
-    nfft = _get_nfft(wavelets, X, use_fft)
-    return _execute_csd_function(
-        X,
-        times,
-        frequencies,
-        _csd_morlet,
-        params=[sfreq, wavelets, nfft, csd_tslice, use_fft, decim],
-        n_fft=1,
+    X = _prepare_csd_array(X)
+    accumulator = CSDAccumulator(
+        sfreq,
+        X.shape[2],
+        "morlet",
+        t0=t0,
+        tmin=tmin,
+        tmax=tmax,
+        frequencies=frequencies,
         ch_names=ch_names,
+        n_cycles=n_cycles,
+        use_fft=use_fft,
+        decim=decim,
         projs=projs,
+        dtype=dtype,
         n_jobs=n_jobs,
-        verbose=verbose,
     )
+    return accumulator.add(X).get_csd()
+
+
+@fill_doc
+class CSDAccumulator:
+    """Accumulate a cross-spectral density over epochs, one chunk at a time.
+
+    The CSD of each epoch is computed as the epochs are added and summed
+    in-place, so that only the running sum (and not the data or the per-epoch
+    CSDs) is kept in memory. This allows computing a CSD from more epochs than
+    fit in memory, e.g. from non-preloaded :class:`~mne.Epochs`.
+
+    Parameters
+    ----------
+    sfreq : float
+        Sampling frequency of observations.
+    n_times : int
+        The number of time samples of each epoch.
+    method : str
+        The method to use to compute the CSD of each epoch. Can be
+        ``"fourier"``, ``"multitaper"`` (default) or ``"morlet"``, see
+        :func:`csd_array_fourier`, :func:`csd_array_multitaper` and
+        :func:`csd_array_morlet`, respectively.
+    t0 : float
+        Time of the first sample relative to the onset of the epoch, in
+        seconds. Defaults to 0.
+    fmin : float
+        Minimum frequency of interest, in Hertz. Not used when
+        ``method="morlet"``.
+    fmax : float | np.inf
+        Maximum frequency of interest, in Hertz. Not used when
+        ``method="morlet"``.
+    tmin : float | None
+        Minimum time instant to consider, in seconds. If ``None`` start at
+        first sample.
+    tmax : float | None
+        Maximum time instant to consider, in seconds. If ``None`` end at last
+        sample.
+    frequencies : list of float | None
+        The frequencies of interest, in Hertz. Only used, and required, when
+        ``method="morlet"``.
+    ch_names : list of str | None
+        A name for each time series. If ``None`` (the default), the channel
+        names of the first :class:`~mne.Epochs` added are used, or the series
+        will be named 'SERIES###'.
+    n_fft : int | None
+        Length of the FFT. If ``None``, the exact number of samples between
+        ``tmin`` and ``tmax`` will be used. Not used when ``method="morlet"``.
+    bandwidth : float | None
+        The bandwidth of the multitaper windowing function in Hz. Only used
+        when ``method="multitaper"``.
+    adaptive : bool
+        Use adaptive weights to combine the tapered spectra into PSD. Only used
+        when ``method="multitaper"``.
+    low_bias : bool
+        Only use tapers with more than 90%% spectral concentration within
+        bandwidth. Only used when ``method="multitaper"``.
+    %(max_iter_multitaper)s
+    n_cycles : float | list of float | None
+        Number of cycles to use when constructing Morlet wavelets. Fixed number
+        or one per frequency. Defaults to 7. Only used when
+        ``method="morlet"``.
+    use_fft : bool
+        Whether to use FFT-based convolution to compute the wavelet transform.
+        Defaults to True. Only used when ``method="morlet"``.
+    decim : int | slice
+        Decimation factor during time-frequency decomposition. Defaults to 1
+        (no decimation). Only used when ``method="morlet"``.
+    projs : list of Projection | None
+        List of projectors to store in the CSD object. Defaults to ``None``,
+        which means no projectors are stored.
+    %(dtype_csd)s
+    %(n_jobs)s
+    %(verbose)s
+
+    Attributes
+    ----------
+    n_epochs : int
+        The number of epochs accumulated so far.
+    frequencies : array, shape (n_frequencies,)
+        The frequencies for which the CSD is computed.
+
+    See Also
+    --------
+    csd_array_fourier
+    csd_array_morlet
+    csd_array_multitaper
+    CrossSpectralDensity
+
+    Notes
+    -----
+    .. versionadded:: 1.6
+
+    Examples
+    --------
+    Compute the CSD of non-preloaded epochs, reading a chunk at a time::
+
+        >>> accumulator = CSDAccumulator(  # doctest: +SKIP
+        ...     epochs.info["sfreq"], len(epochs.times), fmin=8, fmax=12,
+        ...     t0=epochs.tmin)
+        >>> csd = accumulator.add(epochs).get_csd()  # doctest: +SKIP
+    """
+
+    @verbose
+    def __init__(
+        self,
+        sfreq,
+        n_times,
+        method="multitaper",
+        *,
+        t0=0,
+        fmin=0,
+        fmax=np.inf,
+        tmin=None,
+        tmax=None,
+        frequencies=None,
+        ch_names=None,
+        n_fft=None,
+        bandwidth=None,
+        adaptive=False,
+        low_bias=True,
+        max_iter=250,
+        n_cycles=7,
+        use_fft=True,
+        decim=1,
+        projs=None,
+        dtype="complex128",
+        n_jobs=None,
+        verbose=None,
+    ):
+        _check_option("method", method, ("fourier", "multitaper", "morlet"))
+        _check_option("dtype", dtype, ("complex128", "complex64"))
+        sfreq = float(sfreq)
+        self._n_times_orig = n_times = int(n_times)
+        times = np.arange(n_times) / sfreq + t0
+        if method == "morlet":
+            if frequencies is None:
+                raise ValueError('frequencies must be given when method="morlet"')
+            tmin, tmax = _check_csd_times(times, sfreq, tmin, tmax)
+            wavelets = morlet(sfreq, frequencies, n_cycles)
+
+            # Slice X to the requested time window + half the length of the
+            # longest wavelet.
+            wave_length = len(wavelets[np.argmin(frequencies)]) // 2
+            tstart = max(0, np.searchsorted(times, tmin) - wave_length)
+            tstop = min(n_times, np.searchsorted(times, tmax) + wave_length)
+            self._tslice = slice(tstart, tstop)
+            times = times[self._tslice]
+
+            # After CSD computation, we slice again to the requested time
+            # window.
+            csd_tstart = np.searchsorted(times, tmin - 1e-10)
+            csd_tstop = np.searchsorted(times, tmax + 1e-10)
+            csd_tslice = slice(csd_tstart, csd_tstop)
+            nfft = _get_nfft(wavelets, times, use_fft)
+            times = times[csd_tslice]
+            self._csd_function = _csd_morlet
+            self._params = [sfreq, wavelets, nfft, csd_tslice, use_fft, decim]
+            self.n_fft = 1
+        else:
+            tmin, tmax = _check_csd_times(times, sfreq, tmin, tmax, fmin, fmax)
+
+            # Slice X to the requested time window
+            tstart = np.searchsorted(times, tmin - 1e-10)
+            tstop = np.searchsorted(times, tmax + 1e-10)
+            self._tslice = slice(tstart, tstop)
+            times = times[self._tslice]
+            n_times = len(times)
+            n_fft = n_times if n_fft is None else n_fft
+
+            # Preparing frequencies of interest
+            orig_frequencies = rfftfreq(n_fft, 1.0 / sfreq)
+            freq_mask = (orig_frequencies > fmin) & (orig_frequencies < fmax)
+            frequencies = orig_frequencies[freq_mask]
+            if len(frequencies) == 0:
+                raise ValueError(
+                    "No discrete fourier transform results within "
+                    "the given frequency window. Please widen either "
+                    "the frequency window or the time window"
+                )
+            if method == "fourier":
+                self._csd_function = _csd_fourier
+                self._params = [sfreq, n_times, freq_mask, n_fft]
+            else:
+                window_fun, eigvals, _ = _compute_mt_params(
+                    n_times, sfreq, bandwidth, low_bias, adaptive
+                )
+                self._csd_function = _csd_multitaper
+                self._params = [
+                    sfreq,
+                    n_times,
+                    window_fun,
+                    eigvals,
+                    freq_mask,
+                    n_fft,
+                    adaptive,
+                    max_iter,
+                ]
+            self.n_fft = n_fft
+        self.sfreq = sfreq
+        self.method = method
+        self.frequencies = frequencies
+        self.ch_names = None if ch_names is None else list(ch_names)
+        self.projs = projs
+        self.dtype = np.dtype(dtype)
+        self.n_epochs = 0
+        self._times = times
+        self._n_jobs = n_jobs
+        self._data = None
+
+    @verbose
+    def add(self, X, *, verbose=None):
+        """Add the CSD of some epochs to the accumulated sum.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_epochs, n_channels, n_times) | instance of Epochs
+            The time series data of the epochs to add. A single epoch of shape
+            ``(n_channels, n_times)`` can also be given. :class:`~mne.Epochs`
+            that are not preloaded are read a chunk of epochs at a time.
+        %(verbose)s
+
+        Returns
+        -------
+        self : instance of CSDAccumulator
+            The accumulator, modified in-place.
+        """
+        from ..epochs import BaseEpochs
+
+        logger.info("Computing cross-spectral density from epochs...")
+        if isinstance(X, BaseEpochs):
+            if not np.isclose(X.info["sfreq"], self.sfreq):
+                raise ValueError(
+                    "The sampling frequency of the epochs "
+                    f"({X.info['sfreq']}) does not match the one of the "
+                    f"accumulator ({self.sfreq})."
+                )
+            if self.ch_names is None:
+                self.ch_names = list(X.ch_names)
+            if X.preload:
+                self._add_array(X.get_data())
+            else:
+                n_block = max(int(100e6 // (8 * len(X.ch_names) * len(X.times))), 1)
+                for start in range(0, len(X.events), n_block):
+                    self._add_array(X[start : start + n_block].get_data())
+        else:
+            X = np.asarray(X, dtype=float)
+            if X.ndim == 2:
+                X = X[np.newaxis]
+            if X.ndim != 3:
+                raise ValueError("X must be n_epochs x n_channels x n_times.")
+            self._add_array(X)
+        logger.info("[done]")
+        return self
+
+    def _add_array(self, X):
+        if X.shape[2] != self._n_times_orig:
+            raise ValueError(
+                f"X must have {self._n_times_orig} time samples, got {X.shape[2]}."
+            )
+        n_channels = X.shape[1]
+        if self._data is None:
+            self._data = np.zeros(
+                (n_channels * (n_channels + 1) // 2, len(self.frequencies)),
+                dtype=np.complex128,
+            )
+        elif len(self._data) != n_channels * (n_channels + 1) // 2:
+            raise ValueError(
+                f"X must have {_n_dims_from_triu(len(self._data))} channels, "
+                f"got {n_channels}."
+            )
+        X = X[:, :, self._tslice]
+
+        # Prepare the function that does the actual CSD computation for
+        # parallel execution.
+        parallel, my_csd, n_jobs = parallel_func(self._csd_function, self._n_jobs)
+
+        # Compute CSD for each trial
+        n_blocks = int(np.ceil(len(X) / float(n_jobs)))
+        for i in ProgressBar(range(n_blocks), mesg="CSD epoch blocks"):
+            epoch_block = X[i * n_jobs : (i + 1) * n_jobs]
+            csds = parallel(
+                my_csd(this_epoch, *self._params) for this_epoch in epoch_block
+            )
+
+            # Add CSD matrices in-place
+            self._data += np.sum(csds, axis=0)
+        self.n_epochs += len(X)
+
+    def get_csd(self):
+        """Get the CSD averaged over the epochs added so far.
+
+        Returns
+        -------
+        csd : instance of CrossSpectralDensity
+            The computed cross-spectral density.
+        """
+        if self.n_epochs == 0:
+            raise RuntimeError("No epochs have been added to the accumulator.")
+        ch_names = self.ch_names
+        if ch_names is None:
+            n_channels = _n_dims_from_triu(len(self._data))
+            ch_names = ["SERIES%03d" % (i + 1) for i in range(n_channels)]
+        return CrossSpectralDensity(
+            (self._data / self.n_epochs).astype(self.dtype, copy=False),
+            ch_names=ch_names,
+            tmin=self._times[0],
+            tmax=self._times[-1],
+            frequencies=self.frequencies,
+            n_fft=self.n_fft,
+            projs=self.projs,
+        )
 
 
 def _prepare_csd(epochs, tmin=None, tmax=None, picks=None, projs=None):
@@ -1266,18 +1587,20 @@ def _prepare_csd(epochs, tmin=None, tmax=None, picks=None, projs=None):
     return epochs, projs
 
 
-def _prepare_csd_array(X, sfreq, t0, tmin, tmax, fmin=None, fmax=None):
-    """Do some checking and preprocessing of common csd_r=array_* parameters.
-
-    See the csd_array_* functions for documentation of the parameters.
-    """
+def _prepare_csd_array(X):
+    """Check the data passed to the csd_array_* functions."""
     X = np.asarray(X, dtype=float)
     if X.ndim != 3:
         raise ValueError("X must be n_epochs x n_channels x n_times.")
+    return X
+
+
+def _check_csd_times(times, sfreq, tmin, tmax, fmin=None, fmax=None):
+    """Do some checking and preprocessing of common csd_array_* parameters.
 
-    n_times = X.shape[2]
+    See the csd_array_* functions for documentation of the parameters.
+    """
     tstep = 1.0 / sfreq
-    times = np.arange(n_times) * tstep + t0
 
     # Check tmin and tmax
     if tmax is None:
@@ -1295,93 +1618,7 @@ def _prepare_csd_array(X, sfreq, t0, tmin, tmax, fmin=None, fmax=None):
     if fmax is not None and fmin is not None and fmax <= fmin:
         raise ValueError("fmax must be larger than fmin")
 
-    return X, times, tmin, tmax, fmin, fmax
-
-
-@verbose
-def _execute_csd_function(
-    X,
-    times,
-    frequencies,
-    csd_function,
-    params,
-    n_fft,
-    ch_names=None,
-    projs=None,
-    n_jobs=None,
-    *,
-    verbose=None,
-):
-    """Estimate cross-spectral density with a given function.
-
-    This function will apply the given CSD function in parallel across epochs.
-
-    Parameters
-    ----------
-    X : array-like, shape (n_epochs, n_channels, n_times)
-        The time series data consisting of n_epochs separate observations
-        of signals with n_channels time-series of length n_times.
-    times : float
-        Timestamps for each sample.
-    frequencies : list of float
-        The frequencies of interest for which the CSD is going to be computed.
-    csd_function : function
-        Function that performs the actual CSD computation
-    params : list
-        List of parameters to pass the CSD function.
-    n_fft : int
-        Number of FFT points. This is stored in the CSD object.
-    ch_names : list of str | None
-        A name for each time series. If ``None`` (the default), the series will
-        be named 'SERIES###'.
-    projs : list of Projection | None
-        List of projectors to store in the CSD object. Defaults to ``None``,
-        which means the projectors defined in the Epochs object will be copied.
-    %(n_jobs)s
-    %(verbose)s
-
-    Returns
-    -------
-    csd : instance of CrossSpectralDensity
-        The computed cross-spectral density.
-    """
-    n_epochs, n_channels, _ = X.shape
-
-    logger.info("Computing cross-spectral density from epochs...")
-
-    n_freqs = len(frequencies)
-    csds_mean = np.zeros(
-        (n_channels * (n_channels + 1) // 2, n_freqs), dtype=np.complex128
-    )
-
-    # Prepare the function that does the actual CSD computation for parallel
-    # execution.
-    parallel, my_csd, n_jobs = parallel_func(csd_function, n_jobs, verbose=verbose)
-
-    # Compute CSD for each trial
-    n_blocks = int(np.ceil(n_epochs / float(n_jobs)))
-    for i in ProgressBar(range(n_blocks), mesg="CSD epoch blocks"):
-        epoch_block = X[i * n_jobs : (i + 1) * n_jobs]
-        csds = parallel(my_csd(this_epoch, *params) for this_epoch in epoch_block)
-
-        # Add CSD matrices in-place
-        csds_mean += np.sum(csds, axis=0)
-
-    csds_mean /= n_epochs
-    logger.info("[done]")
-
-    if ch_names is None:
-        ch_names = ["SERIES%03d" % (i + 1) for i in range(n_channels)]
-
-    return CrossSpectralDensity(
-        csds_mean,
-        ch_names=ch_names,
-        tmin=times[0],
-        tmax=times[-1],
-        frequencies=frequencies,
-        n_fft=n_fft,
-        projs=projs,
-    )
+    return tmin, tmax
 
 
 def _csd_fourier(X, sfreq, n_times, freq_mask, n_fft):
@@ -3,6 +3,8 @@
 
 # Parts of this code were copied from NiTime http://nipy.sourceforge.net/nitime
 
+from collections import OrderedDict
+
 import numpy as np
 from scipy.fft import rfft, rfftfreq
 from scipy.signal import get_window
@@ -13,6 +15,29 @@ from ..parallel import parallel_func
 from ..utils import warn, verbose, logger, _check_option
 
 
+_DPSS_CACHE = OrderedDict()
+_DPSS_CACHE_MAX_BYTES = 100e6  # least recently used tapers are evicted beyond this
+
+
+def _get_dpss(N, half_nbw, Kmax, sym, norm):
+    """Get DPSS windows and their concentrations, reusing recent ones."""
+    key = (N, float(half_nbw), Kmax, sym, norm)
+    if key in _DPSS_CACHE:
+        _DPSS_CACHE.move_to_end(key)
+        return _DPSS_CACHE[key]
+    out = sp_dpss(N, half_nbw, Kmax, sym=sym, norm=norm, return_ratios=True)
+    for arr in out:
+        arr.setflags(write=False)
+    if sum(arr.nbytes for arr in out) > _DPSS_CACHE_MAX_BYTES:
+        return out  # too large to be cached at all
+    _DPSS_CACHE[key] = out
+    n_bytes = sum(arr.nbytes for val in _DPSS_CACHE.values() for arr in val)
+    while n_bytes > _DPSS_CACHE_MAX_BYTES:
+        _, val = _DPSS_CACHE.popitem(last=False)
+        n_bytes -= sum(arr.nbytes for arr in val)
+    return out
+
+
 def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
     """Compute Discrete Prolate Spheroidal Sequences.
 
@@ -58,17 +83,21 @@ def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
     -----
     Tridiagonal form of DPSS calculation from :footcite:`Slepian1978`.
 
+    The most recently computed windows are kept in memory (up to 100 MB), so
+    that repeated calls with the same parameters do not recompute them.
+
     References
     ----------
     .. footbibliography::
     """
-    dpss, eigvals = sp_dpss(N, half_nbw, Kmax, sym=sym, norm=norm, return_ratios=True)
+    dpss, eigvals = _get_dpss(N, half_nbw, Kmax, sym, norm)
+    idx = np.ones(len(eigvals), bool)
     if low_bias:
         idx = eigvals > 0.9
         if not idx.any():
             warn("Could not properly use low_bias, keeping lowest-bias taper")
             idx = [np.argmax(eigvals)]
-        dpss, eigvals = dpss[idx], eigvals[idx]
+    dpss, eigvals = dpss[idx], eigvals[idx]  # copies of the cached arrays
     assert len(dpss) > 0  # should never happen
     assert dpss.shape[1] == N  # old nitime bug
     return dpss, eigvals
@@ -119,63 +148,74 @@ def _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, max_iter=250, return_weights
     x_var = np.trapz(psd_est, dx=np.pi / n_freqs) / (2 * np.pi)
     del psd_est
 
-    # allocate space for output
-    psd = np.empty((n_signals, np.sum(freq_mask)))
-
     # only keep the frequencies of interest
     x_mt = x_mt[:, :, freq_mask]
 
+    # allocate space for output
+    psd = np.empty((n_signals, x_mt.shape[2]))
     if return_weights:
-        weights = np.empty((n_signals, n_tapers, psd.shape[1]))
-
-    for i, (xk, var) in enumerate(zip(x_mt, x_var)):
-        # combine the SDFs in the traditional way in order to estimate
-        # the variance of the timeseries
-
-        # The process is to iteratively switch solving for the following
-        # two expressions:
-        # (1) Adaptive Multitaper SDF:
-        # S^{mt}(f) = [ sum |d_k(f)|^2 S_k(f) ]/ sum |d_k(f)|^2
-        #
-        # (2) Weights
-        # d_k(f) = [sqrt(lam_k) S^{mt}(f)] / [lam_k S^{mt}(f) + E{B_k(f)}]
-        #
-        # Where lam_k are the eigenvalues corresponding to the DPSS tapers,
-        # and the expected value of the broadband bias function
-        # E{B_k(f)} is replaced by its full-band integration
-        # (1/2pi) int_{-pi}^{pi} E{B_k(f)} = sig^2(1-lam_k)
-
-        # start with an estimate from incomplete data--the first 2 tapers
-        psd_iter = _psd_from_mt(xk[:2, :], rt_eig[:2, np.newaxis])
-
-        err = np.zeros_like(xk)
-        for n in range(max_iter):
-            d_k = psd_iter / (
-                eigvals[:, np.newaxis] * psd_iter + (1 - eigvals[:, np.newaxis]) * var
-            )
-            d_k *= rt_eig[:, np.newaxis]
-            # Test for convergence -- this is overly conservative, since
-            # iteration only stops when all frequencies have converged.
-            # A better approach is to iterate separately for each freq, but
-            # that is a nonvectorized algorithm.
-            # Take the RMS difference in weights from the previous iterate
-            # across frequencies. If the maximum RMS error across freqs is
-            # less than 1e-10, then we're converged
-            err -= d_k
-            if np.max(np.mean(err**2, axis=0)) < 1e-10:
-                break
-
-            # update the iterative estimate with this d_k
-            psd_iter = _psd_from_mt(xk, d_k)
-            err = d_k
-
-        if n == max_iter - 1:
-            warn("Iterative multi-taper PSD computation did not converge.")
-
-        psd[i, :] = psd_iter
-
+        weights = np.empty(x_mt.shape)
+
+    # combine the SDFs in the traditional way in order to estimate
+    # the variance of the timeseries
+
+    # The process is to iteratively switch solving for the following
+    # two expressions:
+    # (1) Adaptive Multitaper SDF:
+    # S^{mt}(f) = [ sum |d_k(f)|^2 S_k(f) ]/ sum |d_k(f)|^2
+    #
+    # (2) Weights
+    # d_k(f) = [sqrt(lam_k) S^{mt}(f)] / [lam_k S^{mt}(f) + E{B_k(f)}]
+    #
+    # Where lam_k are the eigenvalues corresponding to the DPSS tapers,
+    # and the expected value of the broadband bias function
+    # E{B_k(f)} is replaced by its full-band integration
+    # (1/2pi) int_{-pi}^{pi} E{B_k(f)} = sig^2(1-lam_k)
+
+    # All signals are iterated at once, and the ones that have converged are
+    # removed from the following iterations
+    active = np.arange(n_signals)
+    var = x_var[:, np.newaxis, np.newaxis]
+    eigvals = eigvals[:, np.newaxis]
+    rt_eig = rt_eig[:, np.newaxis]
+
+    # start with an estimate from incomplete data--the first 2 tapers
+    psd_iter = _psd_from_mt(x_mt[:, :2], rt_eig[:2])
+
+    err = np.zeros(x_mt.shape)
+    for n in range(max_iter):
+        d_k = psd_iter[:, np.newaxis] / (
+            eigvals * psd_iter[:, np.newaxis] + (1 - eigvals) * var
+        )
+        d_k *= rt_eig
+        # Test for convergence -- this is overly conservative, since
+        # iteration only stops when all frequencies have converged.
+        # A better approach is to iterate separately for each freq, but
+        # that is a nonvectorized algorithm.
+        # Take the RMS difference in weights from the previous iterate
+        # across frequencies. If the maximum RMS error across freqs is
+        # less than 1e-10, then we're converged
+        err -= d_k
+        done = np.max(np.mean(err**2, axis=1), axis=-1) < 1e-10
+        psd[active[done]] = psd_iter[done]
         if return_weights:
-            weights[i, :, :] = d_k
+            weights[active[done]] = d_k[done]
+        if done.all():
+            break
+        if done.any():
+            keep = ~done
+            active, x_mt, var, d_k = active[keep], x_mt[keep], var[keep], d_k[keep]
+
+        # update the iterative estimate with this d_k
+        psd_iter = _psd_from_mt(x_mt, d_k)
+        err = d_k
+    else:
+        psd[active] = psd_iter
+        if return_weights:
+            weights[active] = d_k
+
+    if n == max_iter - 1:
+        warn("Iterative multi-taper PSD computation did not converge.")
 
     if return_weights:
         return psd, weights
@@ -267,10 +307,17 @@ def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
 
     # The following is equivalent to this, but uses less memory:
     # x_mt = fftpack.fft(x[:, np.newaxis, :] * dpss, n=n_fft)
-    n_tapers = dpss.shape[0] if dpss.ndim > 1 else 1
+    # by transforming blocks of signals (~10 MB of tapered data at a time)
+    # with one FFT call each
+    dpss = np.atleast_2d(dpss)
+    n_tapers = dpss.shape[0]
     x_mt = np.zeros(x.shape[:-1] + (n_tapers, len(freqs)), dtype=np.complex128)
-    for idx, sig in enumerate(x):
-        x_mt[idx] = rfft(sig[..., np.newaxis, :] * dpss, n=n_fft)
+    x_flat = x.reshape(-1, x.shape[-1])
+    x_mt_flat = x_mt.reshape(-1, n_tapers, len(freqs))  # a view
+    n_block = max(10000000 // (n_tapers * max(n_fft, x.shape[-1]) * 8), 1)
+    for start in range(0, len(x_flat), n_block):
+        sig = x_flat[start : start + n_block, np.newaxis, :] * dpss
+        x_mt_flat[start : start + n_block] = rfft(sig, n=n_fft)
     # Adjust DC and maybe Nyquist, depending on one-sided transform
     x_mt[..., 0] /= np.sqrt(2.0)
     if n_fft % 2 == 0:
@@ -474,6 +521,7 @@ def tfr_array_multitaper(
     output="complex",
     n_jobs=None,
     *,
+    dtype="complex128",
     verbose=None
 ):
     """Compute Time-Frequency Representation (TFR) using DPSS tapers.
@@ -506,6 +554,7 @@ def tfr_array_multitaper(
         * ``'avg_power_itc'`` : average of single trial power and inter-trial
           coherence across trials.
     %(n_jobs)s
+    %(dtype_tfr)s
     %(verbose)s
 
     Returns
@@ -552,5 +601,6 @@ def tfr_array_multitaper(
         decim=decim,
         output=output,
         n_jobs=n_jobs,
+        dtype=dtype,
         verbose=verbose,
     )
@@ -233,3 +233,96 @@ def psd_array_welch(
         shape = shape + (-1,)
     psds.shape = shape
     return psds, freqs
+
+
+def _welch_sum(data, func, freq_sl):
+    """Sum the periodograms of the segments that are not NaN."""
+    _, _, spect = func(data)
+    spect = spect[..., freq_sl, :]
+    good = ~np.isnan(spect)
+    return np.where(good, spect, 0.0).sum(-1), good.sum(-1)
+
+
+@verbose
+def _psd_welch_stream(
+    get_data,
+    sfreq,
+    fmin=0,
+    fmax=np.inf,
+    n_fft=256,
+    n_overlap=0,
+    n_per_seg=None,
+    n_jobs=None,
+    average="mean",
+    window="hamming",
+    remove_dc=True,
+    *,
+    n_times,
+    output="power",
+    verbose=None,
+):
+    """Compute the Welch PSD reading the data chunk by chunk.
+
+    ``get_data(start, stop)`` must return the data of the given samples,
+    with NaN where they should be ignored. Each chunk holds a whole number of
+    Welch segments, so the result is the same as :func:`psd_array_welch` with
+    ``average='mean'`` but only one chunk of data is held in memory.
+    """
+    _check_option("average", average, ("mean",), extra="when streaming data")
+    _check_option("output", output, ("power",), extra="when streaming data")
+    detrend = "constant" if remove_dc else False
+    n_fft = _ensure_int(n_fft, "n_fft")
+    n_overlap = _ensure_int(n_overlap, "n_overlap")
+    if n_per_seg is not None:
+        n_per_seg = _ensure_int(n_per_seg, "n_per_seg")
+
+    # Prep the PSD
+    n_fft, n_per_seg, n_overlap = _check_nfft(n_times, n_fft, n_per_seg, n_overlap)
+    win_size = n_fft / float(sfreq)
+    logger.info("Effective window size : %0.3f (s)" % win_size)
+    freqs = np.arange(n_fft // 2 + 1, dtype=float) * (sfreq / n_fft)
+    freq_mask = (freqs >= fmin) & (freqs <= fmax)
+    if not freq_mask.any():
+        raise ValueError(f"No frequencies found between fmin={fmin} and fmax={fmax}")
+    freq_sl = slice(*(np.where(freq_mask)[0][[0, -1]] + [0, 1]))
+    del freq_mask
+    freqs = freqs[freq_sl]
+
+    # Chunks of about 10 s made of whole segments
+    step = n_per_seg - n_overlap
+    n_segments = (n_times - n_overlap) // step
+    n_seg_chunk = max(int(np.ceil(10 * sfreq / step)), 1)
+    logger.debug(
+        f"Spectogram using {n_fft}-point FFT on {n_per_seg} samples with "
+        f"{n_overlap} overlap and {window} window, in chunks of {n_seg_chunk} "
+        "segments"
+    )
+    parallel, my_welch_sum, n_jobs = parallel_func(
+        _welch_sum, n_jobs=n_jobs, max_jobs=int(np.ceil(n_segments / n_seg_chunk))
+    )
+    func = partial(
+        spectrogram,
+        detrend=detrend,
+        noverlap=n_overlap,
+        nperseg=n_per_seg,
+        nfft=n_fft,
+        fs=sfreq,
+        window=window,
+        mode="psd",
+    )
+    chunks = [
+        (seg * step, (min(seg + n_seg_chunk, n_segments) - 1) * step + n_per_seg)
+        for seg in range(0, n_segments, n_seg_chunk)
+    ]
+    psds = n_good = 0
+    for bi in range(0, len(chunks), n_jobs):
+        sums = parallel(
+            my_welch_sum(get_data(start, stop), func, freq_sl)
+            for start, stop in chunks[bi : bi + n_jobs]
+        )
+        for this_sum, this_n_good in sums:
+            psds = psds + this_sum
+            n_good = n_good + this_n_good
+    with np.errstate(invalid="ignore", divide="ignore"):
+        psds = psds / n_good  # NaN if all segments were rejected
+    return psds, freqs
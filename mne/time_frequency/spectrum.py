@@ -56,7 +56,7 @@ from ..viz.utils import (
     _get_plot_ch_type,
 )
 from .multitaper import psd_array_multitaper
-from .psd import psd_array_welch, _check_nfft
+from .psd import psd_array_welch, _check_nfft, _psd_welch_stream
 
 
 def _identity_function(x):
@@ -1147,9 +1147,26 @@ class Spectrum(BaseSpectrum):
         if isinstance(self.inst, BaseRaw):
             start, stop = np.where(self._time_mask)[0][[0, -1]]
             rba = "NaN" if reject_by_annotation else None
-            data = self.inst.get_data(
-                self._picks, start, stop + 1, reject_by_annotation=rba
-            )
+            if not self.inst.preload and _can_stream_psd(method, method_kw):
+                # read the data chunk by chunk while computing the spectrum
+                def data(seg_start, seg_stop):
+                    return self.inst.get_data(
+                        self._picks,
+                        start + seg_start,
+                        start + seg_stop,
+                        reject_by_annotation=rba,
+                    )
+
+                self._psd_func = partial(
+                    _psd_welch_stream,
+                    n_times=stop + 1 - start,
+                    remove_dc=remove_dc,
+                    **method_kw,
+                )
+            else:
+                data = self.inst.get_data(
+                    self._picks, start, stop + 1, reject_by_annotation=rba
+                )
         else:  # Evoked
             data = self.inst.data[self._picks][:, self._time_mask]
         # compute the spectra
@@ -1197,6 +1214,15 @@ class Spectrum(BaseSpectrum):
         return BaseRaw._getitem(self, item, return_times=False)
 
 
+def _can_stream_psd(method, method_kw):
+    """Check if the spectrum can be accumulated over chunks of data."""
+    return (
+        method == "welch"
+        and method_kw.get("average", "mean") == "mean"
+        and method_kw.get("output", "power") == "power"
+    )
+
+
 def _check_data_shape(data, freqs, info, ndim):
     if data.ndim != ndim:
         raise ValueError(f"Data must be a {ndim}D array.")
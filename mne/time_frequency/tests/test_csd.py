@@ -19,10 +19,15 @@ from mne.time_frequency import (
     tfr_morlet,
     csd_tfr,
     CrossSpectralDensity,
+    CSDAccumulator,
     read_csd,
     pick_channels_csd,
 )
-from mne.time_frequency.csd import _sym_mat_to_vector, _vector_to_sym_mat
+from mne.time_frequency.csd import (
+    _sym_mat_to_vector,
+    _vector_to_sym_mat,
+    _vectors_to_sym_mats,
+)
 from mne.proj import Projection
 
 base_dir = op.join(op.dirname(__file__), "..", "..", "io", "tests", "data")
@@ -281,6 +286,31 @@ def test_pick_channels_csd():
     assert_array_equal(csd._data, [[0, 6, 12, 18], [2, 8, 14, 20], [5, 11, 17, 23]])
 
 
+def test_pick_channels_csd_complex():
+    """Test reordering the channels of a complex-valued CSD."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((10, 3)) + 1j * rng.standard_normal((10, 3))
+    data[[0, 4, 7, 9]] = data[[0, 4, 7, 9]].real  # real-valued diagonal
+    names = ["CH1", "CH2", "CH3", "CH4"]
+    csd = CrossSpectralDensity(data, names, [1.0, 2.0, 3.0], 1)
+    picks = [3, 0, 2]
+    csd_picked = pick_channels_csd(csd, [names[p] for p in picks], ordered=True)
+    assert csd_picked.ch_names == ["CH4", "CH1", "CH3"]
+    for ii in range(3):
+        want = csd.get_data(index=ii)[np.ix_(picks, picks)]
+        assert_array_equal(csd_picked.get_data(index=ii), want)
+
+    # expanding all frequencies at once
+    mats = _vectors_to_sym_mats(data)
+    assert mats.shape == (3, 4, 4)
+    for ii in range(3):
+        assert_array_equal(mats[ii], _vector_to_sym_mat(data[:, ii]))
+    mats = _vectors_to_sym_mats(data, picks)
+    for ii in range(3):
+        want = _vector_to_sym_mat(data[:, ii])[np.ix_(picks, picks)]
+        assert_array_equal(mats[ii], want)
+
+
 def test_sym_mat_to_vector():
     """Test converting between vectors and symmetric matrices."""
     mat = np.array([[0, 1, 2, 3], [1, 4, 5, 6], [2, 5, 7, 8], [3, 6, 8, 9]])
@@ -563,6 +593,72 @@ def test_csd_multitaper():
             assert abs(signal_power_per_sample - mt_power_per_sample) < 0.001
 
 
+@pytest.mark.parametrize("method", ("fourier", "multitaper", "morlet"))
+def test_csd_accumulator(method):
+    """Test accumulating the CSD one chunk of epochs at a time."""
+    raw = mne.io.read_raw_fif(raw_fname).pick(["eeg"]).crop(0, 30)
+    raw.pick(raw.ch_names[:5])
+    events = mne.read_events(event_fname)
+    epochs = mne.Epochs(raw, events, tmin=-0.2, tmax=0.3, preload=False)
+    data = epochs.get_data()
+    kwargs = dict(frequencies=[10.0, 20.0] if method == "morlet" else None)
+    if method != "morlet":
+        kwargs.update(fmin=5, fmax=30)
+    accumulator = CSDAccumulator(
+        epochs.info["sfreq"],
+        len(epochs.times),
+        method,
+        t0=epochs.tmin,
+        ch_names=epochs.ch_names,
+        **kwargs,
+    )
+    for epoch in data[:3]:
+        accumulator.add(epoch)
+    accumulator.add(data[3:])
+    assert accumulator.n_epochs == len(data)
+    csd = accumulator.get_csd()
+    assert csd.ch_names == epochs.ch_names
+    if method == "morlet":
+        want = csd_array_morlet(data, epochs.info["sfreq"], t0=epochs.tmin, **kwargs)
+    else:
+        func = dict(fourier=csd_array_fourier, multitaper=csd_array_multitaper)
+        kwargs.pop("frequencies")
+        want = func[method](data, epochs.info["sfreq"], t0=epochs.tmin, **kwargs)
+    assert_allclose(csd.frequencies, want.frequencies)
+    assert_allclose(csd._data, want._data)
+    assert csd.tmin == want.tmin and csd.tmax == want.tmax
+
+    # single precision storage
+    csd = CSDAccumulator(
+        epochs.info["sfreq"],
+        len(epochs.times),
+        method,
+        t0=epochs.tmin,
+        dtype="complex64",
+        **kwargs,
+    )
+    csd = csd.add(data).get_csd()
+    assert csd._data.dtype == np.complex64
+    assert csd.get_data(index=0).dtype == np.complex64
+    atol = 1e-6 * np.abs(want._data).max()
+    assert_allclose(csd._data, want._data, rtol=1e-5, atol=atol)
+
+    # non-preloaded epochs are read in chunks
+    csd = CSDAccumulator(
+        epochs.info["sfreq"], len(epochs.times), method, t0=epochs.tmin, **kwargs
+    )
+    csd = csd.add(epochs).get_csd()
+    assert csd.ch_names == epochs.ch_names
+    assert_allclose(csd._data, want._data)
+
+    with pytest.raises(RuntimeError, match="No epochs"):
+        CSDAccumulator(epochs.info["sfreq"], len(epochs.times), **kwargs).get_csd()
+    with pytest.raises(ValueError, match="time samples"):
+        accumulator.add(data[:, :, 1:])
+    with pytest.raises(ValueError, match="channels"):
+        accumulator.add(data[:, 1:])
+
+
 def test_csd_morlet():
     """Test computing cross-spectral density using Morlet wavelets."""
     epochs = _generate_coherence_data()
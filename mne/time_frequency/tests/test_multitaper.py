@@ -1,9 +1,16 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal
 
 from mne.time_frequency import psd_array_multitaper
-from mne.time_frequency.multitaper import dpss_windows
+from mne.time_frequency import multitaper
+from mne.time_frequency.multitaper import (
+    _DPSS_CACHE,
+    _mt_spectra,
+    _psd_from_mt,
+    _psd_from_mt_adaptive,
+    dpss_windows,
+)
 from mne.utils import _record_warnings
 
 
@@ -73,3 +80,73 @@ def test_adaptive_weights_convergence():
     ):
         psd_array_multitaper(data, sfreq, adaptive=True, max_iter=2)
     psd_array_multitaper(data, sfreq, adaptive=True, max_iter=200)
+
+
+def _psd_from_mt_adaptive_loop(x_mt, eigvals, freq_mask, max_iter=250):
+    """Compute adaptive weights one signal at a time, as originally done."""
+    n_tapers, n_freqs = x_mt.shape[1:]
+    rt_eig = np.sqrt(eigvals)
+    psd_est = _psd_from_mt(x_mt, rt_eig[np.newaxis, :, np.newaxis])
+    x_var = np.trapz(psd_est, dx=np.pi / n_freqs) / (2 * np.pi)
+    x_mt = x_mt[:, :, freq_mask]
+    psd = np.empty((len(x_mt), np.sum(freq_mask)))
+    weights = np.empty((len(x_mt), n_tapers, psd.shape[1]))
+    for ii, (xk, var) in enumerate(zip(x_mt, x_var)):
+        psd_iter = _psd_from_mt(xk[:2, :], rt_eig[:2, np.newaxis])
+        err = np.zeros_like(xk)
+        for _ in range(max_iter):
+            d_k = psd_iter / (
+                eigvals[:, np.newaxis] * psd_iter + (1 - eigvals[:, np.newaxis]) * var
+            )
+            d_k *= rt_eig[:, np.newaxis]
+            err -= d_k
+            if np.max(np.mean(err**2, axis=0)) < 1e-10:
+                break
+            psd_iter = _psd_from_mt(xk, d_k)
+            err = d_k
+        psd[ii] = psd_iter
+        weights[ii] = d_k
+    return psd, weights
+
+
+def test_adaptive_weights_vectorized(monkeypatch):
+    """Test that adaptive weights match when computed signal by signal."""
+    rng = np.random.default_rng(0)
+    # mix signals that converge at different iterations
+    data = rng.standard_normal((6, 200))
+    data[::2] += np.sin(2 * np.pi * 40 * np.arange(200) / 500.0)
+    dpss, eigvals = dpss_windows(200, 4, 7)
+    x_mt, freqs = _mt_spectra(data, dpss, 500.0)
+    freq_mask = freqs <= 100
+    psd, weights = _psd_from_mt_adaptive(x_mt, eigvals, freq_mask, return_weights=True)
+    psd_loop, weights_loop = _psd_from_mt_adaptive_loop(x_mt, eigvals, freq_mask)
+    assert_allclose(psd, psd_loop)
+    assert_allclose(weights, weights_loop)
+    assert_allclose(_psd_from_mt_adaptive(x_mt, eigvals, freq_mask), psd)
+    for ii in range(len(data)):
+        psd_1, weights_1 = _psd_from_mt_adaptive(
+            x_mt[ii : ii + 1], eigvals, freq_mask, return_weights=True
+        )
+        assert_allclose(psd[ii : ii + 1], psd_1)
+        assert_allclose(weights[ii : ii + 1], weights_1)
+    # the tapers are reused and modifying the output does not alter the cache
+    dpss[:] = 0.0
+    dpss_2, eigvals_2 = dpss_windows(200, 4, 7)
+    assert_allclose(eigvals_2, eigvals)
+    assert np.abs(dpss_2).max() > 0
+    assert (200, 4.0, 7, True, None) in _DPSS_CACHE
+    # tapers larger than the cache budget are not kept, and older ones are
+    # evicted down to the budget
+    monkeypatch.setattr(multitaper, "_DPSS_CACHE_MAX_BYTES", 1000)
+    dpss_windows(200, 4, 7, sym=False)
+    assert (200, 4.0, 7, False, None) not in _DPSS_CACHE
+    assert (200, 4.0, 7, True, None) in _DPSS_CACHE
+    dpss_windows(10, 2, 2)
+    assert (10, 2.0, 2, True, None) in _DPSS_CACHE
+    assert (200, 4.0, 7, True, None) not in _DPSS_CACHE
+    # the batched FFT matches tapering each signal separately
+    for ii in range(len(data)):
+        want = np.fft.rfft((data[ii] - data[ii].mean()) * dpss_2)
+        want[..., 0] /= np.sqrt(2.0)
+        want[..., -1] /= np.sqrt(2.0)
+        assert_allclose(x_mt[ii], want, atol=1e-12)
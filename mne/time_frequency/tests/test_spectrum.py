@@ -1,5 +1,6 @@
 from contextlib import nullcontext
 from functools import partial
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -7,12 +8,14 @@ from numpy.testing import assert_array_equal, assert_allclose
 import matplotlib.pyplot as plt
 
 from mne import create_info, make_fixed_length_epochs
-from mne.io import RawArray
+from mne.io import RawArray, read_raw_fif
 from mne import Annotations
 from mne.time_frequency import read_spectrum
 from mne.time_frequency.multitaper import _psd_from_mt
 from mne.time_frequency.spectrum import SpectrumArray, EpochsSpectrumArray
 
+raw_fname = Path(__file__).parents[2] / "io" / "tests" / "data" / "test_raw.fif"
+
 
 def test_spectrum_errors(raw):
     """Test for expected errors in the .compute_psd() method."""
@@ -169,6 +172,28 @@ def test_spectrum_reject_by_annot(raw):
     assert spect_no_annot != spect_reject_annot
 
 
+@pytest.mark.parametrize("reject_by_annotation", (True, False))
+def test_spectrum_stream_raw(reject_by_annotation):
+    """Test computing the Welch PSD of non-preloaded data chunk by chunk."""
+    raw = read_raw_fif(raw_fname)
+    raw.set_annotations(Annotations([1, 5], [3, 1], ["bad_test", "bad_test"]))
+    kwargs = dict(
+        picks="meg",
+        tmin=0.5,
+        n_fft=512,
+        n_overlap=128,
+        reject_by_annotation=reject_by_annotation,
+    )
+    spect = raw.compute_psd(**kwargs)
+    spect_preload = raw.copy().load_data().compute_psd(**kwargs)
+    assert_array_equal(spect.freqs, spect_preload.freqs)
+    assert_allclose(spect.get_data(), spect_preload.get_data(), rtol=1e-10)
+    # aggregations other than the mean need all segments at once
+    spect = raw.compute_psd(average="median", **kwargs)
+    spect_preload = raw.copy().load_data().compute_psd(average="median", **kwargs)
+    assert_allclose(spect.get_data(), spect_preload.get_data(), rtol=1e-10)
+
+
 def test_spectrum_getitem_raw(raw_spectrum):
     """Test Spectrum.__getitem__ for Raw-derived spectra."""
     want = raw_spectrum.get_data(slice(1, 3), fmax=7)
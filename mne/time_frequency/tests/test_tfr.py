@@ -32,6 +32,7 @@ from mne.time_frequency.tfr import (
     combine_tfr,
     cwt,
     _compute_tfr,
+    _get_wavelet_bank,
     EpochsTFR,
     fwhm,
 )
@@ -1124,6 +1125,61 @@ def test_compute_tfr_correct(method, decim):
     assert freqs[np.argmax(tfr.mean(-1))] == f
 
 
+@pytest.mark.parametrize("func", (tfr_array_morlet, tfr_array_multitaper))
+@pytest.mark.parametrize("use_fft", (False, True))
+@pytest.mark.parametrize(
+    "output", ("complex", "power", "phase", "avg_power_itc", "avg_power", "itc")
+)
+def test_compute_tfr_complex64(func, use_fft, output):
+    """Test computing TFRs in single precision."""
+    rng = np.random.RandomState(0)
+    sfreq = 1000.0
+    data = rng.randn(5, 2, 500)
+    freqs = np.arange(20, 60, 10.0)
+    kwargs = dict(sfreq=sfreq, freqs=freqs, n_cycles=3.0, use_fft=use_fft)
+    kwargs["output"] = output
+    want = func(data, **kwargs)
+    got = func(data, dtype="complex64", **kwargs)
+    assert got.shape == want.shape
+    assert got.dtype == (np.complex64 if np.iscomplexobj(want) else np.float32)
+    if output == "phase":  # compare the phase on the unit circle
+        got, want = np.exp(1j * got), np.exp(1j * want)
+    assert_allclose(got, want, rtol=1e-3, atol=1e-3 * np.abs(want).max())
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        func(data, dtype="float32", **kwargs)
+    if func is tfr_array_morlet:  # verbose can still be passed by position
+        out = func(data, sfreq, freqs, 3.0, False, use_fft, 1, output, None, False)
+        assert_array_equal(out, want)
+
+
+@pytest.mark.parametrize("method", ("multitaper", "morlet"))
+def test_wavelet_bank(method, monkeypatch):
+    """Test reusing the wavelets and their FFTs across channels and calls."""
+    rng = np.random.RandomState(0)
+    sfreq = 1000.0
+    data = rng.randn(3, 4, 600)
+    freqs = np.arange(20, 60, 10.0)
+    n_cycles = freqs / 5.0
+    out = _compute_tfr(data, freqs, sfreq, method=method, n_cycles=n_cycles)
+    args = (method, sfreq, freqs, n_cycles, method == "multitaper")
+    args += (4.0 if method == "multitaper" else None, 600, True, "complex128")
+    Ws, fft_Ws = _get_wavelet_bank(*args)
+    assert _get_wavelet_bank(*args)[1] is fft_Ws  # cached
+    assert not fft_Ws[0].flags.writeable
+    # same as transforming each channel separately
+    for ti, W in enumerate(Ws):
+        for ci in range(data.shape[1]):
+            want = cwt(data[:, ci], W)
+            got = out[:, ci, ti] if method == "multitaper" else out[:, ci]
+            assert_allclose(got, want, rtol=1e-10, atol=1e-10 * np.abs(want).max())
+    out_2 = _compute_tfr(data, freqs, sfreq, method=method, n_cycles=n_cycles)
+    assert_array_equal(out, out_2)
+    # banks larger than the cache budget are not kept
+    monkeypatch.setattr("mne.time_frequency.tfr._WAVELET_BANK_CACHE_MAX_BYTES", 1000)
+    args = args[:6] + (700,) + args[7:]
+    assert _get_wavelet_bank(*args)[1] is not _get_wavelet_bank(*args)[1]
+
+
 def test_averaging_epochsTFR():
     """Test that EpochsTFR averaging methods work."""
     # Setup for reading the raw data
@@ -9,6 +9,7 @@ Morlet code inspired by Matlab code from Sheraz Khan & Brainstorm & SPM
 #
 # License : BSD-3-Clause
 
+from collections import OrderedDict
 from copy import deepcopy
 from functools import partial
 
@@ -47,6 +48,7 @@ from ..utils import (
     _build_data_frame,
     warn,
     _import_h5io_funcs,
+    object_hash,
     copy_function_doc_to_method_doc,
 )
 from ..channels.channels import UpdateChannelsMixin
@@ -330,7 +332,82 @@ def _get_nfft(wavelets, X, use_fft=True, check=True):
     return nfft
 
 
-def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
+def _get_fft_Ws(Ws, fsize, dtype=np.complex128):
+    """Compute the FFTs of the wavelets."""
+    fft_Ws = np.empty((len(Ws), fsize), dtype=dtype)
+    for i, W in enumerate(Ws):
+        fft_Ws[i] = fft(W.astype(dtype, copy=False), fsize)
+    return fft_Ws
+
+
+# The bank can be reused by calls with the same parameters (e.g., across
+# subjects), but its FFTs (n_tapers * n_freqs * nfft values) grow with the
+# signal length, so the cache is bounded by size
+_WAVELET_BANK_CACHE = OrderedDict()
+_WAVELET_BANK_CACHE_MAX_BYTES = 100e6  # least recently used banks are evicted
+
+
+def _get_wavelet_bank(*args):
+    """Get the wavelets and their FFTs, reusing recent ones."""
+    key = object_hash(args)
+    if key in _WAVELET_BANK_CACHE:
+        _WAVELET_BANK_CACHE.move_to_end(key)
+        return _WAVELET_BANK_CACHE[key]
+    out = _compute_wavelet_bank(*args)
+    if _wavelet_bank_nbytes(out) > _WAVELET_BANK_CACHE_MAX_BYTES:
+        return out  # too large to be cached at all
+    _WAVELET_BANK_CACHE[key] = out
+    n_bytes = sum(_wavelet_bank_nbytes(val) for val in _WAVELET_BANK_CACHE.values())
+    while n_bytes > _WAVELET_BANK_CACHE_MAX_BYTES:
+        _, val = _WAVELET_BANK_CACHE.popitem(last=False)
+        n_bytes -= _wavelet_bank_nbytes(val)
+    return out
+
+
+def _wavelet_bank_nbytes(bank):
+    Ws, fft_Ws = bank
+    n_bytes = sum(w.nbytes for W in Ws for w in W)
+    return n_bytes + sum(f.nbytes for f in fft_Ws if f is not None)
+
+
+def _compute_wavelet_bank(
+    method, sfreq, freqs, n_cycles, zero_mean, time_bandwidth, n_times, use_fft, dtype
+):
+    """Compute the wavelets of each taper and, with ``use_fft``, their FFTs."""
+    if method == "morlet":
+        W = morlet(sfreq, freqs, n_cycles=n_cycles, zero_mean=zero_mean)
+        Ws = [W]  # to have same dimensionality as the 'multitaper' case
+    else:
+        assert method == "multitaper"
+        Ws = _make_dpss(
+            sfreq,
+            freqs,
+            n_cycles=n_cycles,
+            time_bandwidth=time_bandwidth,
+            zero_mean=zero_mean,
+        )
+    fft_Ws = [None] * len(Ws)
+    for ti, W in enumerate(Ws):
+        for w in W:
+            w.setflags(write=False)  # shared across calls
+        if use_fft:
+            nfft = _get_nfft(W, np.empty((0, n_times)), check=False)
+            fft_Ws[ti] = _get_fft_Ws(W, nfft, dtype)
+            fft_Ws[ti].setflags(write=False)
+    return Ws, fft_Ws
+
+
+def _cwt_gen(
+    X,
+    Ws,
+    *,
+    fsize=0,
+    mode="same",
+    decim=1,
+    use_fft=True,
+    dtype=np.complex128,
+    fft_Ws=None,
+):
     """Compute cwt with fft based convolutions or temporal convolutions.
 
     Parameters
@@ -353,6 +430,10 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
     use_fft : bool, default True
         Use the FFT for convolutions or not.
+    dtype : dtype, default np.complex128
+        The complex dtype of the computation and output.
+    fft_Ws : array, shape (n_freqs, fsize) | None
+        The precomputed FFTs of the wavelets (only used if ``use_fft``).
 
     Returns
     -------
@@ -362,6 +443,9 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
     _check_option("mode", mode, ["same", "valid", "full"])
     decim = _check_decim(decim)
     X = np.asarray(X)
+    if dtype == np.complex64:  # compute in single precision
+        X = X.astype(np.complex64 if np.iscomplexobj(X) else np.float32, copy=False)
+        Ws = [W.astype(np.complex64, copy=False) for W in Ws]
 
     # Precompute wavelets for given frequency range to save time
     _, n_times = X.shape
@@ -370,20 +454,23 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
     # precompute FFTs of Ws
     if use_fft:
-        fft_Ws = np.empty((n_freqs, fsize), dtype=np.complex128)
-        for i, W in enumerate(Ws):
-            fft_Ws[i] = fft(W, fsize)
+        if fft_Ws is None:
+            fft_Ws = _get_fft_Ws(Ws, fsize, dtype)
+        assert fft_Ws.shape == (n_freqs, fsize)
+        # transform all signals at once
+        fft_X = fft(X, fsize, axis=-1)
 
     # Make generator looping across signals
-    tfr = np.zeros((n_freqs, n_times_out), dtype=np.complex128)
-    for x in X:
+    tfr = np.zeros((n_freqs, n_times_out), dtype=dtype)
+    for xi, x in enumerate(X):
         if use_fft:
-            fft_x = fft(x, fsize)
+            # convolve with all wavelets at once
+            rets = ifft(fft_X[xi] * fft_Ws)
 
         # Loop across wavelets
         for ii, W in enumerate(Ws):
             if use_fft:
-                ret = ifft(fft_x * fft_Ws[ii])[: n_times + W.size - 1]
+                ret = rets[ii, : n_times + W.size - 1]
             else:
                 # Work around multarray.correlate->OpenBLAS bug on ppc64le
                 # ret = np.correlate(x, W, mode=mode)
@@ -426,6 +513,7 @@ def _compute_tfr(
     decim=1,
     output="complex",
     n_jobs=None,
+    dtype="complex128",
     verbose=None,
 ):
     """Compute time-frequency transforms.
@@ -478,6 +566,9 @@ def _compute_tfr(
     %(n_jobs)s
         The number of epochs to process at the same time. The parallelization
         is implemented across channels.
+    dtype : str
+        ``'complex128'`` (default) or ``'complex64'`` to compute in single
+        precision.
     %(verbose)s
 
     Returns
@@ -513,6 +604,8 @@ def _compute_tfr(
         decim,
         output,
     )
+    _check_option("dtype", dtype, ["complex128", "complex64"])
+    dtype = np.dtype(dtype)
 
     decim = _check_decim(decim)
     if (freqs > sfreq / 2.0).any():
@@ -522,19 +615,19 @@ def _compute_tfr(
         )
 
     # We decimate *after* decomposition, so we need to create our kernels
-    # for the original sfreq
-    if method == "morlet":
-        W = morlet(sfreq, freqs, n_cycles=n_cycles, zero_mean=zero_mean)
-        Ws = [W]  # to have same dimensionality as the 'multitaper' case
-
-    elif method == "multitaper":
-        Ws = _make_dpss(
-            sfreq,
-            freqs,
-            n_cycles=n_cycles,
-            time_bandwidth=time_bandwidth,
-            zero_mean=zero_mean,
-        )
+    # for the original sfreq. The wavelets (and their FFTs) are computed once
+    # and shared by all channels.
+    Ws, fft_Ws = _get_wavelet_bank(
+        method,
+        sfreq,
+        freqs,
+        n_cycles,
+        zero_mean,
+        time_bandwidth,
+        epoch_data.shape[2],
+        use_fft,
+        dtype.name,
+    )
 
     # Check wavelets
     if len(Ws[0][0]) > epoch_data.shape[2]:
@@ -548,33 +641,46 @@ def _compute_tfr(
     n_tapers = len(Ws)
     n_epochs, n_chans, n_times = epoch_data[:, :, decim].shape
     if output in ("power", "phase", "avg_power", "itc"):
-        dtype = np.float64
+        out_dtype = np.finfo(dtype).dtype
     elif output in ("complex", "avg_power_itc"):
         # avg_power_itc is stored as power + 1i * itc to keep a
         # simple dimensionality
-        dtype = np.complex128
+        out_dtype = dtype
 
     if ("avg_" in output) or ("itc" in output):
-        out = np.empty((n_chans, n_freqs, n_times), dtype)
+        out = np.empty((n_chans, n_freqs, n_times), out_dtype)
     elif output in ["complex", "phase"] and method == "multitaper":
-        out = np.empty((n_chans, n_tapers, n_epochs, n_freqs, n_times), dtype)
+        out = np.empty((n_chans, n_tapers, n_epochs, n_freqs, n_times), out_dtype)
     else:
-        out = np.empty((n_chans, n_epochs, n_freqs, n_times), dtype)
+        out = np.empty((n_chans, n_epochs, n_freqs, n_times), out_dtype)
 
     # Parallel computation
     all_Ws = sum([list(W) for W in Ws], list())
     _get_nfft(all_Ws, epoch_data, use_fft)
-    parallel, my_cwt, n_jobs = parallel_func(_time_frequency_loop, n_jobs)
-
-    # Parallelization is applied across channels.
-    tfrs = parallel(
-        my_cwt(channel, Ws, output, use_fft, "same", decim, method)
-        for channel in epoch_data.transpose(1, 0, 2)
+    parallel, my_cwt, n_jobs = parallel_func(
+        _time_frequency_loop, n_jobs, max_jobs=n_chans
     )
 
-    # FIXME: to avoid overheads we should use np.array_split()
-    for channel_idx, tfr in enumerate(tfrs):
-        out[channel_idx] = tfr
+    # Parallelization is applied across channels, in batches of n_jobs
+    # channels so that only their single-channel outputs are held at once
+    for start in range(0, n_chans, n_jobs):
+        tfrs = parallel(
+            my_cwt(
+                epoch_data[:, ci],
+                Ws,
+                output,
+                use_fft,
+                "same",
+                decim,
+                method,
+                dtype,
+                fft_Ws=fft_Ws,
+            )
+            for ci in range(start, min(start + n_jobs, n_chans))
+        )
+        for channel_idx, tfr in enumerate(tfrs, start):
+            out[channel_idx] = tfr
+        del tfrs
 
     if ("avg_" not in output) and ("itc" not in output):
         # This is to enforce that the first dimension is for epochs
@@ -661,7 +767,9 @@ def _check_tfr_param(
     return freqs, sfreq, zero_mean, n_cycles, time_bandwidth, decim
 
 
-def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
+def _time_frequency_loop(
+    X, Ws, output, use_fft, mode, decim, method=None, dtype=np.complex128, fft_Ws=None
+):
     """Aux. function to _compute_tfr.
 
     Loops time-frequency transform across wavelets and epochs.
@@ -691,29 +799,45 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
     method : str | None
         Used only for multitapering to create tapers dimension in the output
         if ``output in ['complex', 'phase']``.
+    dtype : dtype
+        The complex dtype of the computation. Averages across epochs are
+        accumulated in double precision.
+    fft_Ws : list of array | None
+        The precomputed FFTs of the wavelets of each taper.
     """
     # Set output type
-    dtype = np.float64
-    if output in ["complex", "avg_power_itc"]:
-        dtype = np.complex128
+    avg = ("avg_" in output) or ("itc" in output)
+    # Averages are accumulated in double precision
+    out_dtype = np.dtype(np.complex128 if avg else dtype)
+    if output not in ["complex", "avg_power_itc"]:
+        out_dtype = np.finfo(out_dtype).dtype
 
     # Init outputs
     decim = _check_decim(decim)
     n_tapers = len(Ws)
     n_epochs, n_times = X[:, decim].shape
     n_freqs = len(Ws[0])
-    if ("avg_" in output) or ("itc" in output):
-        tfrs = np.zeros((n_freqs, n_times), dtype=dtype)
+    if avg:
+        tfrs = np.zeros((n_freqs, n_times), dtype=out_dtype)
     elif output in ["complex", "phase"] and method == "multitaper":
-        tfrs = np.zeros((n_tapers, n_epochs, n_freqs, n_times), dtype=dtype)
+        tfrs = np.zeros((n_tapers, n_epochs, n_freqs, n_times), dtype=out_dtype)
     else:
-        tfrs = np.zeros((n_epochs, n_freqs, n_times), dtype=dtype)
+        tfrs = np.zeros((n_epochs, n_freqs, n_times), dtype=out_dtype)
 
     # Loops across tapers.
     for taper_idx, W in enumerate(Ws):
         # No need to check here, it's done earlier (outside parallel part)
         nfft = _get_nfft(W, X, use_fft, check=False)
-        coefs = _cwt_gen(X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft)
+        coefs = _cwt_gen(
+            X,
+            W,
+            fsize=nfft,
+            mode=mode,
+            decim=decim,
+            use_fft=use_fft,
+            dtype=dtype,
+            fft_Ws=None if fft_Ws is None else fft_Ws[taper_idx],
+        )
 
         # Inter-trial phase locking is apparently computed per taper...
         if "itc" in output:
@@ -755,6 +879,9 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
     # Normalization by number of taper
     if n_tapers > 1 and output not in ["complex", "phase"]:
         tfrs /= n_tapers
+    if avg:
+        out_dtype = dtype if np.iscomplexobj(tfrs) else np.finfo(dtype).dtype
+        tfrs = tfrs.astype(out_dtype, copy=False)
     return tfrs
 
 
@@ -983,6 +1110,8 @@ def tfr_array_morlet(
     output="complex",
     n_jobs=None,
     verbose=None,
+    *,
+    dtype="complex128",
 ):
     """Compute Time-Frequency Representation (TFR) using Morlet wavelets.
 
@@ -1015,6 +1144,7 @@ def tfr_array_morlet(
         The number of epochs to process at the same time. The parallelization
         is implemented across channels. Default 1.
     %(verbose)s
+    %(dtype_tfr)s
 
     Returns
     -------
@@ -1060,6 +1190,7 @@ def tfr_array_morlet(
         decim=decim,
         output=output,
         n_jobs=n_jobs,
+        dtype=dtype,
         verbose=verbose,
     )
 
@@ -165,6 +165,20 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_EPOCHS_CACHE_SIZE": (
+        "str, maximum size of the least recently used cache of processed epochs "
+        "kept by Epochs that are not preloaded, e.g., 500MB or 2GB, 0 disables "
+        "the cache (default 256MB)"
+    ),
+    "MNE_FIF_TREE_CACHE_DIR": (
+        "str, path to a directory used to cache the tag directory trees of FIF "
+        "files across sessions (disabled if not set)"
+    ),
+    "MNE_FIF_TREE_CACHE_SIZE": (
+        "int, maximum number of FIF files whose tag directory trees are kept in "
+        "MNE_FIF_TREE_CACHE_DIR, least recently used ones are evicted first "
+        "(default 1000)"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
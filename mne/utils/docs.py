@@ -1125,6 +1125,31 @@ dtype : numpy.dtype
     (default) the data type is not modified.
 """
 
+docdict[
+    "dtype_csd"
+] = """
+dtype : str
+    The data type in which the CSD matrices are stored, ``'complex128'``
+    (default) or ``'complex64'``. The CSD is always computed and accumulated
+    across epochs in double precision. Using ``'complex64'`` halves the memory
+    used by the returned :class:`~mne.time_frequency.CrossSpectralDensity`.
+
+    .. versionadded:: 1.6
+"""
+
+docdict[
+    "dtype_tfr"
+] = """
+dtype : str
+    The precision of the computation, ``'complex128'`` (default) or
+    ``'complex64'``. With ``'complex64'``, the convolutions are computed in
+    single precision and the output is ``complex64`` (or ``float32`` for
+    real-valued outputs), halving memory usage. Averages across epochs are
+    still accumulated in double precision.
+
+    .. versionadded:: 1.6
+"""
+
 # %%
 # E
 
@@ -1227,7 +1252,13 @@ docdict[
 ] = """
     Load all epochs from disk when creating the object
     or wait before accessing each epoch (more memory
-    efficient but can be slower).
+    efficient but can be slower). Epochs that are not preloaded keep
+    recently processed epochs in a cache whose size in bytes can be set with
+    the ``MNE_EPOCHS_CACHE_SIZE`` config key (default ``"256MB"``, ``0``
+    disables the cache).
+
+    .. versionchanged:: 1.6
+       Added the cache of processed epochs.
 """
 
 docdict[
@@ -2551,6 +2582,18 @@ docdict["method_plot_psd_auto"] = _method_psd.format(
 docdict["method_psd"] = _method_psd.format("", "")
 docdict["method_psd_auto"] = _method_psd.format(" | ``'auto'``", "")
 
+docdict[
+    "method_resample"
+] = """
+method : str
+    Resampling method to use. Can be ``"fft"`` (default) or ``"polyphase"``
+    to use FFT-based or polyphase FIR resampling, respectively. These wrap to
+    :func:`scipy.signal.resample` and :func:`scipy.signal.resample_poly`,
+    respectively. ``npad`` is only used for ``method="fft"``.
+    ``method="polyphase"`` requires the ratio of the new and old sampling
+    rates to be a fraction with a denominator of at most 1000.
+"""
+
 docdict[
     "mode_eltc"
 ] = """
@@ -2675,7 +2718,13 @@ docdict[
 ] = """
 n_jobs : int | str
     Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
-    is installed properly and ``method='fir'``.
+    is installed properly and ``method='fir'``. Can also be
+    ``'fft-threads'`` (only for ``method='fir'``) to filter blocks of
+    channels at once, reusing the filter spectrum and computing each FFT
+    for all channels of a block in a single multithreaded call.
+
+    .. versionchanged:: 1.6
+       Support for ``'fft-threads'``.
 """
 
 docdict[
@@ -3089,6 +3138,25 @@ overview_mode : str | None
     if it's not found.
 """
 
+docdict[
+    "out_fname_filter"
+] = """
+out_fname : path-like | None
+    If not None, the data are not filtered in place. Instead, they are
+    read, filtered, and written to this FIF file chunk by chunk, so that
+    the data do not need to be preloaded and the memory usage does not
+    depend on the duration of the recording. A new (not preloaded) instance
+    reading the filtered data from ``out_fname`` is then returned. Only
+    ``method='fir'`` is supported in this mode.
+
+    .. versionadded:: 1.6
+overwrite : bool
+    If True (default False), overwrite ``out_fname`` if it exists. Only
+    used when ``out_fname`` is not None.
+
+    .. versionadded:: 1.6
+"""
+
 docdict[
     "overwrite"
 ] = """
@@ -3117,6 +3185,25 @@ docdict["pad_fir"] = (
 """
 )
 
+_pad_resample = """
+pad : str
+    The type of padding to use. When ``method="fft"``, supports all
+    :func:`numpy.pad` ``mode`` options. Can also be ``"reflect_limited"``,
+    which pads with a reflected version of each vector mirrored on the first
+    and last values of the vector, followed by zeros.
+    When ``method="polyphase"``, supports all modes of
+    :func:`scipy.signal.upfirdn`.
+"""
+
+docdict["pad_resample"] = _pad_resample
+
+docdict["pad_resample_auto"] = (
+    _pad_resample
+    + """    The default (``"auto"``) means ``'reflect_limited'`` for
+    ``method='fft'`` and ``'reflect'`` for ``method='polyphase'``.
+"""
+)
+
 docdict[
     "pca_vars_pctf"
 ] = """
@@ -3453,9 +3540,20 @@ preload : bool, str, or None (default None)
     If True, the data will be preloaded into memory (fast, requires
     large amount of memory). If preload is a string, preload is the
     file name of a memory-mapped file which is used to store the data
-    on the hard drive (slower, requires less memory). If preload is
-    None, preload=True or False is inferred using the preload status
-    of the instances passed in.
+    on the hard drive (slower, requires less memory). If ``"virtual"``,
+    the data of preloaded instances are referenced instead of copied and
+    the result is not preloaded, so the data are only materialized
+    when they are accessed, loaded with ``load_data()``, or saved. The
+    result then reads from the data buffers of the preloaded instances,
+    so modifying these in place afterward (e.g., with
+    :meth:`~mne.io.Raw.filter`) also changes the data of the result; call
+    ``load_data()`` on the result first to avoid this. If
+    preload is None, preload=True or False is inferred using the preload
+    status of the instances passed in.
+
+    .. versionchanged:: 1.6
+       Support for ``preload="virtual"``. Previously, ``"virtual"`` was
+       used as the file name of a memory-mapped file like any other string.
 """
 
 docdict[
@@ -4943,8 +5041,13 @@ docdict[
     "window_resample"
 ] = """
 window : str | tuple
-    Frequency-domain window to use in resampling.
-    See :func:`scipy.signal.resample`.
+    When ``method="fft"``, this is the *frequency-domain* window to use in
+    resampling, and should be the same length as the signal; see
+    :func:`scipy.signal.resample` for details. When ``method="polyphase"``,
+    this is the *time-domain* linear-phase window to use after upsampling the
+    signal; see :func:`scipy.signal.resample_poly` for details. The default
+    ``"auto"`` will use ``"boxcar"`` for ``method="fft"`` and
+    ``("kaiser", 5.0)`` for ``method="polyphase"``.
 """
 
 # %%
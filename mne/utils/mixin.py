@@ -345,6 +345,10 @@ class GetEpochsMixin:
         """
         self._current = 0
         self._current_detrend_picks = self._detrend_picks
+        if not self.preload:
+            self._current_cache_state = self._epoch_cache_state(
+                self._current_detrend_picks
+            )
         return self
 
     def __next__(self, return_event_id=False):
@@ -374,16 +378,18 @@ class GetEpochsMixin:
             while not is_good:
                 if self._current >= len(self.events):
                     self._stop_iter()
-                epoch_noproj = self._get_epoch_from_raw(self._current)
-                epoch_noproj = self._detrend_offset_decim(
-                    epoch_noproj, self._current_detrend_picks
+                epoch_noproj, epoch = self._get_processed_epoch(
+                    self._current,
+                    self._current_detrend_picks,
+                    self._current_cache_state,
                 )
-                epoch = self._project_epoch(epoch_noproj)
                 self._current += 1
                 is_good, _ = self._is_good_epoch(epoch)
             # If delayed-ssp mode, pass 'virgin' data after rejection decision.
             if self._do_delayed_proj:
                 epoch = epoch_noproj
+            if self._current_cache_state is not None:
+                epoch = epoch.copy()  # do not let users modify the cache
 
         if not return_event_id:
             return epoch
@@ -393,6 +399,7 @@ class GetEpochsMixin:
     def _stop_iter(self):
         del self._current
         del self._current_detrend_picks
+        self.__dict__.pop("_current_cache_state", None)
         raise StopIteration  # signal the end
 
     next = __next__  # originally for Python2, now b/c public